@@ -0,0 +1,11 @@
+"""Scaling benchmarks for ``PredefinedValidations``.
+
+``run_benchmarks`` times every validation method on synthetic source/target
+frames of the requested sizes and records peak memory. Reports are plain JSON,
+so ``compare_reports`` can flag regressions against an earlier run. The
+command-line entry point is ``scripts/run_validation_benchmarks.py``.
+"""
+
+from .harness import compare_reports, load_report, measure, run_benchmarks, save_report
+from .synthetic_data import SIZES, BenchmarkDataset, build_dataset, parse_size
+from .validation_cases import CASES, ValidationCase, public_validation_methods
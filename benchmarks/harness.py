@@ -0,0 +1,200 @@
+"""Time validation cases, record peak memory and compare runs stored as JSON."""
+
+import gc
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic_data import build_dataset
+from benchmarks.validation_cases import CASES, ValidationCase
+from utils.predefined_validations import PredefinedValidations
+
+PASSED = "passed"
+FAILED = "failed"
+ERROR = "error"
+
+
+def _run_once(call: Callable[[], Any]) -> str:
+    # Cached per-column normalization plans would make repeats faster than a real first run.
+    PredefinedValidations.clear_normalization_plans()
+    try:
+        call()
+    except AssertionError:
+        return FAILED
+    return PASSED
+
+
+def measure(call: Callable[[], Any], repeats: int = 3) -> Dict[str, Any]:
+    """Time ``call`` ``repeats`` times, then run it once more under tracemalloc.
+
+    A validation that raises ``AssertionError`` is a normal outcome on
+    mismatching data and is timed like a passing one. The memory run is kept
+    separate because tracemalloc slows allocation-heavy code down.
+    """
+    timings: List[float] = []
+    outcome = PASSED
+    for _ in range(max(1, repeats)):
+        gc.collect()
+        started = time.perf_counter()
+        outcome = _run_once(call)
+        timings.append(time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        _run_once(call)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "outcome": outcome,
+        "repeats": len(timings),
+        "min_seconds": min(timings),
+        "mean_seconds": sum(timings) / len(timings),
+        "peak_memory_bytes": peak_bytes,
+    }
+
+
+def run_benchmarks(
+    sizes: Sequence[int],
+    mismatch_rate: float = 0.01,
+    repeats: int = 3,
+    methods: Optional[Iterable[str]] = None,
+    seed: int = 0,
+    cases: Sequence[ValidationCase] = CASES,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Run every case (or only ``methods``) at each size and return a JSON-ready report."""
+    selected = [case for case in cases if methods is None or case.method in set(methods)]
+    results: List[Dict[str, Any]] = []
+    for rows in sizes:
+        dataset = build_dataset(rows, mismatch_rate, seed)
+        for case in selected:
+            try:
+                measured = measure(case.prepare(dataset), repeats)
+            except Exception as exc:
+                measured = {"outcome": ERROR, "error": f"{exc.__class__.__name__}: {exc}"}
+            result = {"method": case.method, "rows": rows, "mismatch_rate": mismatch_rate, **measured}
+            results.append(result)
+            if progress is not None:
+                progress(result)
+        del dataset
+        gc.collect()
+    return {"metadata": run_metadata(mismatch_rate, repeats, seed), "results": results}
+
+
+def run_metadata(mismatch_rate: float, repeats: int, seed: int) -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = ""
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "mismatch_rate": mismatch_rate,
+        "repeats": repeats,
+        "seed": seed,
+    }
+
+
+def save_report(report: Dict[str, Any], path: str) -> str:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    return path
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    time_tolerance: float = 0.25,
+    memory_tolerance: float = 0.25,
+    min_seconds: float = 0.005,
+) -> List[Dict[str, Any]]:
+    """Return regressions of ``current`` against ``baseline``, matched by method and rows.
+
+    A case regresses when its best time or peak memory grew by more than the
+    tolerance (0.25 = 25%), or when it errors now but did not before. Timings
+    under ``min_seconds`` in both runs are too noisy to compare.
+    """
+    previous = {(result["method"], result["rows"]): result for result in baseline.get("results", [])}
+    regressions: List[Dict[str, Any]] = []
+    for result in current.get("results", []):
+        before = previous.get((result["method"], result["rows"]))
+        if before is None:
+            continue
+        if result["outcome"] == ERROR:
+            if before["outcome"] != ERROR:
+                regressions.append({
+                    "method": result["method"],
+                    "rows": result["rows"],
+                    "metric": "outcome",
+                    "baseline": before["outcome"],
+                    "current": ERROR,
+                })
+            continue
+        if before["outcome"] == ERROR:
+            continue
+        checks = [("peak_memory_bytes", memory_tolerance)]
+        if max(before["min_seconds"], result["min_seconds"]) >= min_seconds:
+            checks.append(("min_seconds", time_tolerance))
+        for metric, tolerance in checks:
+            if before[metric] and result[metric] > before[metric] * (1 + tolerance):
+                regressions.append({
+                    "method": result["method"],
+                    "rows": result["rows"],
+                    "metric": metric,
+                    "baseline": before[metric],
+                    "current": result[metric],
+                    "change": result[metric] / before[metric] - 1,
+                })
+    return regressions
+
+
+def format_report(results: Iterable[Dict[str, Any]]) -> str:
+    lines = [f"{'method':<36}{'rows':>11}{'outcome':>9}{'best s':>10}{'mean s':>10}{'peak MB':>10}"]
+    for result in results:
+        if result["outcome"] == ERROR:
+            lines.append(f"{result['method']:<36}{result['rows']:>11}{ERROR:>9}  {result['error']}")
+            continue
+        lines.append(
+            f"{result['method']:<36}{result['rows']:>11}{result['outcome']:>9}"
+            f"{result['min_seconds']:>10.3f}{result['mean_seconds']:>10.3f}"
+            f"{result['peak_memory_bytes'] / 1_048_576:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def format_regressions(regressions: Iterable[Dict[str, Any]]) -> str:
+    lines = []
+    for regression in regressions:
+        if regression["metric"] == "outcome":
+            lines.append(f"  {regression['method']} @ {regression['rows']} rows: now errors")
+        else:
+            lines.append(
+                f"  {regression['method']} @ {regression['rows']} rows: {regression['metric']} "
+                f"{regression['baseline']:.4g} -> {regression['current']:.4g} ({regression['change']:+.0%})"
+            )
+    return "\n".join(lines)
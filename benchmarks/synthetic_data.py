@@ -0,0 +1,81 @@
+"""Synthetic source/target DataFrames with a controlled share of mismatching rows."""
+
+from dataclasses import dataclass
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+SIZES: Dict[str, int] = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+KEY_COLUMNS = ["recid"]
+COMPARE_COLUMNS = ["dataareaid", "accountnum", "amountcur", "qty", "isdelete", "modifieddatetime"]
+
+
+def parse_size(label: str) -> int:
+    """Accept ``10k``/``1m``/``10m`` style labels or a plain row count."""
+    label = label.strip().lower().replace("_", "")
+    if label in SIZES:
+        return SIZES[label]
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(label[-1:], 1)
+    return int(float(label.rstrip("km")) * multiplier)
+
+
+@dataclass
+class BenchmarkDataset:
+    """Source and target frames plus how many target rows were made to differ."""
+
+    rows: int
+    mismatch_rate: float
+    source: pd.DataFrame
+    target: pd.DataFrame
+    missing_rows: int
+    changed_rows: int
+    extra_rows: int
+
+
+def _frame(recid: np.ndarray, rng: np.random.Generator) -> pd.DataFrame:
+    rows = len(recid)
+    offsets = rng.integers(0, 63_072_000, rows).astype("timedelta64[s]")
+    created = np.datetime64("2023-01-01T00:00:00", "s") + offsets
+    return pd.DataFrame({
+        "recid": recid,
+        "dataareaid": np.array(["da0", "da1", "da2", "da3"], dtype=object)[recid % 4],
+        "accountnum": np.char.add("C", rng.integers(0, 100_000, rows).astype(str)).astype(object),
+        "amountcur": rng.integers(0, 10_000_000, rows) / 100.0,
+        "qty": rng.integers(0, 1_000, rows),
+        "isdelete": (rng.random(rows) < 0.01).astype(np.int64),
+        "createddatetime": created,
+        "modifieddatetime": created + rng.integers(0, 2_592_000, rows).astype("timedelta64[s]"),
+    })
+
+
+def build_dataset(rows: int, mismatch_rate: float = 0.01, seed: int = 0) -> BenchmarkDataset:
+    """Build a source frame and a target that differs in ``mismatch_rate`` of its rows.
+
+    The differing rows are split evenly between rows missing from the target,
+    rows whose ``amountcur``, ``isdelete`` and ``modifieddatetime`` changed,
+    and target-only rows. Output is deterministic for a given ``seed``.
+    """
+    if not 0 <= mismatch_rate <= 1:
+        raise ValueError("mismatch_rate must be between 0 and 1.")
+    rng = np.random.default_rng(seed)
+    source = _frame(np.arange(1, rows + 1, dtype=np.int64), rng)
+
+    per_kind = int(rows * mismatch_rate / 3)
+    picked = rng.choice(rows, size=2 * per_kind, replace=False)
+    missing, changed = picked[:per_kind], picked[per_kind:]
+
+    target = source.copy()
+    amount = target["amountcur"].to_numpy(copy=True)
+    amount[changed] += 1.0
+    isdelete = target["isdelete"].to_numpy(copy=True)
+    isdelete[changed] = 1 - isdelete[changed]
+    modified = target["modifieddatetime"].to_numpy(copy=True)
+    modified[changed] += np.timedelta64(1, "D")
+    target["amountcur"], target["isdelete"], target["modifieddatetime"] = amount, isdelete, modified
+
+    keep = np.ones(rows, dtype=bool)
+    keep[missing] = False
+    extra = _frame(np.arange(rows + 1, rows + per_kind + 1, dtype=np.int64), rng)
+    target = pd.concat([target[keep], extra], ignore_index=True)
+    return BenchmarkDataset(rows, mismatch_rate, source, target, per_kind, per_kind, per_kind)
@@ -0,0 +1,140 @@
+"""One benchmark case per ``PredefinedValidations`` method.
+
+``prepare`` builds the method's inputs from a ``BenchmarkDataset`` outside the
+timed region (for example precomputed row hashes or group counts) and returns
+the zero-argument call that is timed.
+"""
+
+import inspect
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+
+from benchmarks.synthetic_data import COMPARE_COLUMNS, KEY_COLUMNS, BenchmarkDataset
+from utils.predefined_validations import PredefinedValidations as PV
+from utils.row_hash import compute_row_hashes, local_column_kinds
+
+
+@dataclass(frozen=True)
+class ValidationCase:
+    method: str
+    prepare: Callable[[BenchmarkDataset], Callable[[], Any]]
+
+
+def _aggregates(frame: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+    return {
+        column: {"sum": float(frame[column].sum()), "max": float(frame[column].max())}
+        for column in ("amountcur", "qty")
+    }
+
+
+def _group_counts(frame: pd.DataFrame) -> pd.DataFrame:
+    return frame.groupby("dataareaid").size().reset_index(name="row_count")
+
+
+def _row_hashes(data: BenchmarkDataset) -> Callable[[], Any]:
+    kinds = local_column_kinds(data.source, data.target, COMPARE_COLUMNS)
+    source = compute_row_hashes(data.source, KEY_COLUMNS, kinds)
+    target = compute_row_hashes(data.target, KEY_COLUMNS, kinds)
+    return lambda: PV.row_hash_comparison(source, target, KEY_COLUMNS)
+
+
+def _aggregate_values(data: BenchmarkDataset) -> Callable[[], Any]:
+    source, target = _aggregates(data.source), _aggregates(data.target)
+    return lambda: PV.aggregate_value_comparison(source, target)
+
+
+def _group_count_values(data: BenchmarkDataset) -> Callable[[], Any]:
+    source, target = _group_counts(data.source), _group_counts(data.target)
+    return lambda: PV.group_count_comparison(source, target, ["dataareaid"], tolerance=1.0)
+
+
+def _custom_columns(data: BenchmarkDataset) -> Callable[[], Any]:
+    # Mapped target columns are named differently, as in the silver-to-gold CSV rows.
+    target = data.target.rename(columns={"amountcur": "amount", "accountnum": "account"})
+    return lambda: PV.custom_column_comparison(
+        data.source,
+        target,
+        KEY_COLUMNS,
+        {"amountcur": "amount", "accountnum": "account"},
+        source_transformers={"accountnum": lambda series: series.str.upper()},
+    )
+
+
+CASES: List[ValidationCase] = [
+    ValidationCase("row_count_comparison", lambda d: lambda: PV.row_count_comparison(d.source, d.target)),
+    ValidationCase("column_count_validation", lambda d: lambda: PV.column_count_validation(d.source, d.target)),
+    ValidationCase(
+        "schema_and_datatype_validation",
+        lambda d: lambda: PV.schema_and_datatype_validation(d.source, d.target),
+    ),
+    ValidationCase(
+        "null_checks_mandatory_columns",
+        lambda d: lambda: PV.null_checks_mandatory_columns(d.target, ["recid", "dataareaid", "accountnum"]),
+    ),
+    ValidationCase(
+        "duplicate_checks_primary_keys",
+        lambda d: lambda: PV.duplicate_checks_primary_keys(d.target, KEY_COLUMNS),
+    ),
+    ValidationCase(
+        "soft_delete_consistency",
+        lambda d: lambda: PV.soft_delete_consistency(d.source, d.target, KEY_COLUMNS),
+    ),
+    ValidationCase(
+        "aggregate_validations",
+        lambda d: lambda: PV.aggregate_validations(d.source, d.target, {"amountcur": ["sum", "min", "max"]}),
+    ),
+    ValidationCase("aggregate_value_comparison", _aggregate_values),
+    ValidationCase(
+        "record_level_dataframe_comparison",
+        lambda d: lambda: PV.record_level_dataframe_comparison(d.source, d.target, KEY_COLUMNS, COMPARE_COLUMNS),
+    ),
+    ValidationCase("row_hash_comparison", _row_hashes),
+    ValidationCase(
+        "incremental_delta_validation",
+        lambda d: lambda: PV.incremental_delta_validation(
+            d.source, d.target, "modifieddatetime", KEY_COLUMNS, delta_start="2024-07-01"
+        ),
+    ),
+    ValidationCase(
+        "referential_integrity_validation",
+        lambda d: lambda: PV.referential_integrity_validation(d.target, d.source, KEY_COLUMNS, KEY_COLUMNS),
+    ),
+    ValidationCase(
+        "threshold_based_validation",
+        lambda d: lambda: PV.threshold_based_validation(len(d.source), len(d.target), 1.0, "row_count"),
+    ),
+    ValidationCase(
+        "date_range_validation",
+        lambda d: lambda: PV.date_range_validation(d.source, "createddatetime", "2023-01-01", "2025-01-01"),
+    ),
+    ValidationCase(
+        "negative_value_validation",
+        lambda d: lambda: PV.negative_value_validation(d.source, ["amountcur", "qty"]),
+    ),
+    ValidationCase("empty_dataset_validation", lambda d: lambda: PV.empty_dataset_validation(d.source)),
+    ValidationCase(
+        "group_by_distribution_validation",
+        lambda d: lambda: PV.group_by_distribution_validation(d.source, d.target, ["dataareaid"], tolerance=1.0),
+    ),
+    ValidationCase("group_count_comparison", _group_count_values),
+    ValidationCase("custom_column_comparison", _custom_columns),
+]
+
+
+def _is_validation(member: Any) -> bool:
+    """Validations are plain static methods that take the data to check.
+
+    Decorated helpers (``shared_scan`` is a context manager) and parameterless
+    housekeeping such as ``clear_normalization_plans`` are not.
+    """
+    if not isinstance(member, staticmethod):
+        return False
+    function = member.__func__
+    return not hasattr(function, "__wrapped__") and bool(inspect.signature(function).parameters)
+
+
+def public_validation_methods() -> List[str]:
+    """Public ``PredefinedValidations`` methods that run a validation."""
+    return sorted(name for name, member in vars(PV).items() if not name.startswith("_") and _is_validation(member))
@@ -111,7 +111,7 @@ class CrossTestingRunner:
             sql_id = test_case.get('sql_id')
             sql_query = self.sql_repo.get_query(sql_id)
             if sql_query:
-                return self.db_client.execute_query(sql_query)
+                return self.db_client.execute(sql_query).scalar(0)
             return 0
     
     def _generate_cross_testing_report(self, results):
@@ -61,7 +61,7 @@ class ETLTestRunner:
                 if not sql_query:
                     raise Exception(f"SQL query not found for ID: {sql_id}")
                 
-                result = self.db_client.execute_query(sql_query)
+                result = self.db_client.execute(sql_query)
                 
                 # Validate result
                 is_valid = self.csv_controller.validate_result(result, expected_condition)
@@ -118,7 +118,7 @@ class ETLTestRunner:
         
         try:
             sql_query = self.sql_repository.get_query(sql_id)
-            result = self.db_client.execute_query(sql_query)
+            result = self.db_client.execute(sql_query)
             is_valid = self.csv_controller.validate_result(result, expected_condition)
             
             status = "PASSED" if is_valid else "FAILED"
@@ -144,6 +144,11 @@ class ETLTestRunner:
         # Generate summary
         summary = self.xml_reporter.generate_summary_report()
         print(f"Total execution time: {summary['execution_time']:.2f} seconds")
+        pool_stats = self.db_client.pool.snapshot()
+        print(
+            f"DB connections: {pool_stats['created']} opened for {pool_stats['checkouts']} queries "
+            f"({pool_stats['reused']} reused, {pool_stats['discarded']} discarded)"
+        )
 
 def main():
     parser = argparse.ArgumentParser(description='ETL Test Runner')
@@ -23,11 +23,11 @@ class FabricETLRunner:
         start_time = time.time()
         
         try:
-            bronze_count = self.bronze.execute_query(f"SELECT COUNT(*) FROM {source_table}")[0][0]
-            silver_count = self.silver.execute_query(f"SELECT COUNT(*) FROM {target_table}")[0][0]
+            bronze_count = self.bronze.execute(f"SELECT COUNT(*) FROM {source_table}").scalar()
+            silver_count = self.silver.execute(f"SELECT COUNT(*) FROM {target_table}").scalar()
             
             if validation_query:
-                validation_result = self.silver.execute_query(validation_query)
+                validation_result = self.silver.execute(validation_query)
                 assert validation_result, "Validation query failed"
             
             assert bronze_count == silver_count, f"Count mismatch: Bronze={bronze_count}, Silver={silver_count}"
@@ -49,11 +49,11 @@ class FabricETLRunner:
         start_time = time.time()
         
         try:
-            silver_count = self.silver.execute_query(f"SELECT COUNT(*) FROM {source_table}")[0][0]
-            gold_count = self.gold.execute_query(f"SELECT COUNT(*) FROM {target_table}")[0][0]
+            silver_count = self.silver.execute(f"SELECT COUNT(*) FROM {source_table}").scalar()
+            gold_count = self.gold.execute(f"SELECT COUNT(*) FROM {target_table}").scalar()
             
             if validation_query:
-                validation_result = self.gold.execute_query(validation_query)
+                validation_result = self.gold.execute(validation_query)
                 assert validation_result, "Validation query failed"
             
             assert silver_count == gold_count, f"Count mismatch: Silver={silver_count}, Gold={gold_count}"
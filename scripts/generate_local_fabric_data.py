@@ -0,0 +1,135 @@
+"""
+Generate synthetic lakehouse tables for the local Fabric backend
+([FABRIC] FABRIC_BACKEND = local in config/master.properties).
+
+By default the lakehouses, schemas and tables are taken from the enabled rows
+of the bronze-to-silver CSV, so the CSV-driven suite can run against them
+offline. Requires the optional duckdb package.
+
+Examples:
+    python scripts/generate_local_fabric_data.py --rows 100000 --mismatch-rate 0.01
+    python scripts/generate_local_fabric_data.py --csv data/etl_validation_silver_to_gold_tests.csv --include-disabled
+    python scripts/generate_local_fabric_data.py --rows 10000000 --source-lakehouses LH_AX_CANADA \
+        --target-lakehouse LH_Finance --source-schema fullload --tables custinvoicejour,custtrans
+    FABRIC_BACKEND=local python -m pytest tests/fabric/test_csv_driven_bronze_to_silver_validation.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import configparser
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from utils.local_fabric import generate_lakehouse_data, load_local_data_dir
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate local lakehouse files for offline validation runs.")
+    parser.add_argument(
+        "--config",
+        default=str(ROOT_DIR / "config" / "master.properties"),
+        help="Path to master.properties.",
+    )
+    parser.add_argument("--data-dir", help="Output directory (default: FABRIC_LOCAL_DATA_DIR).")
+    parser.add_argument("--rows", type=int, default=10000, help="Rows per table and source lakehouse.")
+    parser.add_argument("--mismatch-rate", type=float, default=0.0, help="Share of rows that differ (0-1).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the deterministic row generator.")
+    parser.add_argument(
+        "--csv",
+        action="append",
+        help="Validation CSV to take lakehouses and tables from (repeatable).",
+    )
+    parser.add_argument("--include-disabled", action="store_true", help="Also use CSV rows with enabled=FALSE.")
+    parser.add_argument("--source-lakehouses", help="Comma-separated source lakehouses (instead of a CSV).")
+    parser.add_argument("--target-lakehouse", help="Target lakehouse (instead of a CSV).")
+    parser.add_argument("--tables", help="Comma-separated table names (instead of a CSV).")
+    parser.add_argument("--source-schema", default="dbo")
+    parser.add_argument("--target-schema", default="dbo")
+    parser.add_argument("--lhname-column", default="lhname")
+    return parser.parse_args()
+
+
+def split_values(raw) -> List[str]:
+    return [item.strip() for item in str(raw or "").split(",") if item.strip()]
+
+
+def plan_from_csv(csv_files: List[str], include_disabled: bool) -> Dict[Tuple[str, str, str, str], Dict[str, set]]:
+    """Group CSV rows by (target lakehouse, source schema, target schema, lhname column)."""
+    plan: Dict[Tuple[str, str, str, str], Dict[str, set]] = defaultdict(lambda: {"sources": set(), "tables": set()})
+    for csv_file in csv_files:
+        frame = pd.read_csv(csv_file).fillna("")
+        for row in frame.to_dict("records"):
+            if not include_disabled and str(row.get("enabled", "")).strip().upper() != "TRUE":
+                continue
+            sources = split_values(row.get("source_lakehouse"))
+            tables = split_values(row.get("table_name"))
+            for target in split_values(row.get("target_lakehouse")):
+                key = (
+                    target,
+                    str(row.get("source_schema") or "dbo").strip(),
+                    str(row.get("target_schema") or "dbo").strip(),
+                    str(row.get("target_lhname_column") or "lhname").strip(),
+                )
+                plan[key]["sources"].update(sources)
+                plan[key]["tables"].update(tables)
+    return plan
+
+
+def run() -> None:
+    args = parse_args()
+    os.chdir(ROOT_DIR)
+    config = configparser.ConfigParser()
+    config.read(args.config)
+    data_dir = args.data_dir or load_local_data_dir(config)
+
+    if args.source_lakehouses or args.target_lakehouse or args.tables:
+        if not (args.source_lakehouses and args.target_lakehouse and args.tables):
+            raise SystemExit("[ERROR] --source-lakehouses, --target-lakehouse and --tables go together.")
+        plan = {
+            (args.target_lakehouse, args.source_schema, args.target_schema, args.lhname_column): {
+                "sources": set(split_values(args.source_lakehouses)),
+                "tables": set(split_values(args.tables)),
+            }
+        }
+    else:
+        csv_files = args.csv or [str(ROOT_DIR / "data" / "etl_validation_bronze_to_silver_tests.csv")]
+        plan = plan_from_csv(csv_files, args.include_disabled)
+    if not plan:
+        raise SystemExit("[ERROR] No lakehouses/tables to generate; enable CSV rows or pass --include-disabled.")
+
+    for (target, source_schema, target_schema, lhname_column), entry in plan.items():
+        started = time.perf_counter()
+        summary = generate_lakehouse_data(
+            data_dir,
+            sorted(entry["tables"]),
+            args.rows,
+            sorted(entry["sources"]),
+            target,
+            source_schema=source_schema,
+            target_schema=target_schema,
+            lhname_column=lhname_column,
+            mismatch_rate=args.mismatch_rate,
+            seed=args.seed,
+        )
+        print(
+            f"[INFO] {', '.join(sorted(entry['sources']))} ({source_schema}) -> {target} ({target_schema}): "
+            f"{len(summary)} table(s) in {time.perf_counter() - started:.1f}s"
+        )
+        for table, counts in summary.items():
+            print(f"  {table}: source={counts['source_rows']} target={counts['target_rows']}")
+    print(f"[INFO] Local lakehouse files written to {os.path.abspath(data_dir)}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,85 @@
+"""
+Inspect and purge the local Fabric query result cache ([QUERY_CACHE] in config/master.properties).
+
+Examples:
+    python scripts/query_cache.py list
+    python scripts/query_cache.py purge --expired
+    python scripts/query_cache.py purge --older-than 12 --endpoint bronze.datawarehouse.fabric.microsoft.com
+    python scripts/query_cache.py purge --all
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from utils.query_cache import load_query_cache
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inspect and purge the Fabric query result cache.")
+    parser.add_argument(
+        "--config",
+        default=str(ROOT_DIR / "config" / "master.properties"),
+        help="Path to master.properties.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="List cached query results, most recently used first.")
+    list_parser.add_argument("--endpoint", help="Only show entries for this SQL endpoint.")
+
+    purge_parser = commands.add_parser("purge", help="Remove cached query results.")
+    purge_parser.add_argument("--all", action="store_true", help="Remove every entry.")
+    purge_parser.add_argument("--expired", action="store_true", help="Remove entries past TTL_SECONDS.")
+    purge_parser.add_argument("--older-than", type=float, help="Remove entries created more than N hours ago.")
+    purge_parser.add_argument("--endpoint", help="Only remove entries for this SQL endpoint.")
+    return parser.parse_args()
+
+
+def _format_time(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def list_entries(cache, endpoint: str | None) -> None:
+    entries = [entry for entry in cache.entries() if endpoint is None or entry["endpoint"] == endpoint]
+    total_bytes = sum(entry["bytes"] for entry in entries)
+    print(f"[INFO] {len(entries)} cached result(s), {total_bytes / (1024 * 1024):.1f} MB in {cache.directory}")
+    for entry in entries:
+        query = " ".join(entry["query"].split())
+        status = " (expired)" if entry["expired"] else ""
+        print(
+            f"  {entry['key'][:12]}  {entry['rows']:>9} rows  {entry['bytes'] / 1024:>9.1f} KB  "
+            f"created {_format_time(entry['created_at'])}  used {_format_time(entry['last_used_at'])}{status}"
+        )
+        print(f"      {entry['endpoint']}  token={entry['freshness_token'] or '-'}  {query[:100]}")
+
+
+def run() -> None:
+    args = parse_args()
+    os.chdir(ROOT_DIR)
+    cache = load_query_cache(args.config, force=True)
+
+    if args.command == "list":
+        list_entries(cache, args.endpoint)
+        return
+
+    if not (args.all or args.expired or args.older_than is not None or args.endpoint):
+        raise SystemExit("[ERROR] purge needs --all, --expired, --older-than or --endpoint.")
+    removed = cache.purge(
+        older_than_seconds=None if args.older_than is None else args.older_than * 3600,
+        endpoint=args.endpoint,
+        expired_only=args.expired,
+    )
+    print(f"[INFO] Removed {removed} cached result(s) at {time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+
+if __name__ == "__main__":
+    run()
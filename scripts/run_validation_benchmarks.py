@@ -0,0 +1,95 @@
+"""
+Benchmark every PredefinedValidations method on synthetic data and store the
+timings and peak memory as JSON (benchmarks/ package).
+
+Examples:
+    python scripts/run_validation_benchmarks.py
+    python scripts/run_validation_benchmarks.py --sizes 10k,1m,10m --repeats 1
+    python scripts/run_validation_benchmarks.py --methods record_level_dataframe_comparison,row_hash_comparison
+    python scripts/run_validation_benchmarks.py --compare reports/benchmarks/baseline.json --fail-on-regression
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from benchmarks.harness import (
+    compare_reports,
+    format_regressions,
+    format_report,
+    load_report,
+    run_benchmarks,
+    save_report,
+)
+from benchmarks.synthetic_data import parse_size
+from benchmarks.validation_cases import CASES
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark PredefinedValidations at scale.")
+    parser.add_argument("--sizes", default="10k,1m", help="Comma-separated row counts: 10k, 1m, 10m or numbers.")
+    parser.add_argument("--mismatch-rate", type=float, default=0.01, help="Share of target rows that differ (0-1).")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per method and size.")
+    parser.add_argument("--methods", help="Comma-separated subset of validation methods.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON report path (default: reports/benchmarks/validations_<timestamp>.json).")
+    parser.add_argument("--compare", help="Earlier JSON report to flag regressions against.")
+    parser.add_argument("--time-tolerance", type=float, default=0.25, help="Allowed slowdown, 0.25 = 25%%.")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25, help="Allowed peak memory growth.")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 on regressions.")
+    return parser.parse_args()
+
+
+def run() -> None:
+    args = parse_args()
+    os.chdir(ROOT_DIR)
+    sizes = [parse_size(size) for size in args.sizes.split(",") if size.strip()]
+    methods = [method.strip() for method in args.methods.split(",")] if args.methods else None
+    if methods:
+        unknown = sorted(set(methods) - {case.method for case in CASES})
+        if unknown:
+            raise SystemExit(f"[ERROR] Unknown validation method(s): {', '.join(unknown)}")
+
+    report = run_benchmarks(
+        sizes,
+        mismatch_rate=args.mismatch_rate,
+        repeats=args.repeats,
+        methods=methods,
+        seed=args.seed,
+        progress=lambda result: print(
+            f"[INFO] {result['method']} @ {result['rows']} rows: {result['outcome']}", flush=True
+        ),
+    )
+    output = args.output or os.path.join(
+        "reports", "benchmarks", f"validations_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    save_report(report, output)
+    print(format_report(report["results"]))
+    print(f"[INFO] Report written to {os.path.abspath(output)}")
+
+    if args.compare:
+        regressions = compare_reports(
+            load_report(args.compare),
+            report,
+            time_tolerance=args.time_tolerance,
+            memory_tolerance=args.memory_tolerance,
+        )
+        if not regressions:
+            print(f"[INFO] No regressions against {args.compare}")
+            return
+        print(f"[WARN] {len(regressions)} regression(s) against {args.compare}:")
+        print(format_regressions(regressions))
+        if args.fail_on_regression:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    run()
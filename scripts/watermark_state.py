@@ -0,0 +1,71 @@
+"""
+Inspect and reset stored watermarks of stateful incremental validations
+([TESTING] WATERMARK_STATE_DB in config/master.properties).
+
+Examples:
+    python scripts/watermark_state.py list
+    python scripts/watermark_state.py reset --source-lakehouse LH_AX_CANADA --table custinvoicejour
+    python scripts/watermark_state.py reset --all
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from utils.watermark_state import load_watermark_store
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inspect and reset incremental validation watermarks.")
+    parser.add_argument(
+        "--config",
+        default=str(ROOT_DIR / "config" / "master.properties"),
+        help="Path to master.properties.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="List stored watermarks.")
+
+    reset_parser = commands.add_parser("reset", help="Forget watermarks so the next run checks full history.")
+    reset_parser.add_argument("--all", action="store_true", help="Forget every watermark.")
+    reset_parser.add_argument("--source-lakehouse", help="Only watermarks for this source lakehouse.")
+    reset_parser.add_argument("--target-lakehouse", help="Only watermarks for this target lakehouse.")
+    reset_parser.add_argument("--table", help="Only watermarks for this table.")
+    return parser.parse_args()
+
+
+def list_entries(store) -> None:
+    entries = store.entries()
+    print(f"[INFO] {len(entries)} stored watermark(s) in {store.db_path}")
+    for entry in entries:
+        print(
+            f"  {entry['source_lakehouse']} -> {entry['target_lakehouse']}  {entry['table_name']}  "
+            f"{entry['watermark_column']} = {entry['watermark']}  "
+            f"({entry['rows_validated']} rows, {entry['test_id'] or '-'}, {entry['validated_at']})"
+        )
+
+
+def run() -> None:
+    args = parse_args()
+    os.chdir(ROOT_DIR)
+    store = load_watermark_store(args.config)
+
+    if args.command == "list":
+        list_entries(store)
+        return
+
+    if not (args.all or args.source_lakehouse or args.target_lakehouse or args.table):
+        raise SystemExit("[ERROR] reset needs --all, --source-lakehouse, --target-lakehouse or --table.")
+    removed = store.reset(args.source_lakehouse, args.target_lakehouse, args.table)
+    print(f"[INFO] Removed {removed} watermark(s)")
+
+
+if __name__ == "__main__":
+    run()
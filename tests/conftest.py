@@ -2,8 +2,15 @@ import pytest
 import json
 import re
 from pathlib import Path
+import pandas as pd
 from utils.api_client import APIClient
 from utils.db_client import DatabaseClient
+from utils.query_memo import format_session_report
+
+# Validations read DataFrame inputs without copying them when copy-on-write is on
+# (always from pandas 3); turn it on for pandas 1.5/2.x runs too.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
 
 @pytest.fixture(scope="session")
 def api_client():
@@ -313,6 +320,14 @@ def pytest_collection_modifyitems(session, config, items):
     _remove_stale_allure_results(results_dir, collected_test_ids)
 
 
+def pytest_terminal_summary(terminalreporter):
+    """Report query dedup reuse across every test class of the session."""
+    report = format_session_report()
+    if report:
+        terminalreporter.write_sep("-", "query dedup")
+        terminalreporter.write_line(report)
+
+
 @pytest.hookimpl(trylast=True)
 def pytest_sessionfinish(session, exitstatus):
     """Create ETL dashboard JSON in allure-results and expose it as an attachment."""
@@ -2,11 +2,57 @@ import pytest
 import allure
 import pandas as pd
 import re
+import threading
+import time
 from pathlib import Path
 from typing import Dict, List, Any
 from openpyxl import load_workbook
-from utils.fabric_client import FabricClient
+from utils.async_query_client import AsyncFabricClient, run_queries
+from utils.count_batching import (
+    build_batched_count_query,
+    fan_out_counts,
+    load_count_batch_size,
+    plan_count_batches,
+)
+from utils.fabric_client import FabricClient, create_fabric_client
+from utils.fabric_throttle import format_limiter_report
+from utils.key_comparison import compare_keys, distinct_key_count
+from utils.parallel_executor import (
+    AllureEventRecorder,
+    ParallelRowExecutor,
+    RowExecution,
+    format_timing_report,
+    load_parallel_settings,
+    run_concurrently,
+)
 from utils.predefined_validations import PredefinedValidations
+from utils.query_memo import load_query_memo
+from utils.recid_chunking import (
+    can_chunk_query,
+    chunk_recids,
+    load_recid_chunk_settings,
+    merge_chunk_results,
+    run_chunked,
+)
+from utils.row_hash import (
+    build_key_filter_query,
+    build_row_hash_query,
+    compute_row_hashes,
+    key_tuples,
+    local_column_kinds,
+    resolve_hash_mode,
+    server_column_kinds,
+)
+from utils.sql_pushdown import (
+    ROW_COUNT_COLUMN,
+    aggregate_row_count,
+    aggregates_from_result,
+    build_aggregate_query,
+    build_distribution_query,
+    can_wrap_query,
+    load_pushdown_setting,
+)
+from utils.watermark_state import STATEFUL_MODE, build_incremental_query, load_watermark_store
 
 @allure.epic("ETL Testing Framework")
 @allure.feature("CSV-Driven ETL Validation")
@@ -21,10 +67,23 @@ class TestCSVDrivenETLValidation:
     @classmethod
     def setup_class(cls):
         """Setup database clients and load CSV tests"""
-        cls.source_client = FabricClient(cls.SOURCE_LAYER)
-        cls.target_client = FabricClient(cls.TARGET_LAYER)
+        cls.source_client = create_fabric_client(cls.SOURCE_LAYER)
+        cls.target_client = create_fabric_client(cls.TARGET_LAYER)
         cls.validator = PredefinedValidations()
         cls.test_cases = cls._load_test_cases()
+        cls.parallel_settings = load_parallel_settings()
+        cls.query_memo = load_query_memo()
+        cls.count_batch_size = load_count_batch_size()
+        cls._count_batches_planned = False
+        cls.recid_chunk_settings = load_recid_chunk_settings()
+        cls.pushdown_enabled = load_pushdown_setting()
+        cls._watermark_store = None
+        cls._row_executions: Dict[str, RowExecution] = {}
+        cls._prefetch_wall_seconds = None
+        cls._worker_state = threading.local()
+        cls._worker_lock = threading.Lock()
+        cls._worker_clients: List[FabricClient] = []
+        cls._result_types: Dict[tuple, Dict[str, Any]] = {}
 
     @classmethod
     def teardown_class(cls):
@@ -33,6 +92,206 @@ class TestCSVDrivenETLValidation:
             cls.source_client.close()
         if getattr(cls, 'target_client', None):
             cls.target_client.close()
+        for client in getattr(cls, '_worker_clients', []):
+            client.close()
+        if getattr(cls, '_row_executions', None):
+            print(f"\n[{cls.__name__}] Per-row timings")
+            print(format_timing_report(cls._row_executions.values(), cls._prefetch_wall_seconds))
+        if getattr(cls, 'query_memo', None) is not None:
+            cls.query_memo.clear()
+        limiter_report = format_limiter_report()
+        if limiter_report:
+            print(f"[{cls.__name__}] Endpoint concurrency\n{limiter_report}")
+
+    @classmethod
+    def _worker(cls) -> 'TestCSVDrivenETLValidation':
+        """Return this thread's validation context with its own Fabric clients.
+
+        pyodbc connections must not be shared between threads, so every pool
+        thread gets a dedicated source/target client pair.
+        """
+        worker = getattr(cls._worker_state, 'instance', None)
+        if worker is None:
+            worker = cls()
+            worker.source_client = create_fabric_client(cls.SOURCE_LAYER)
+            worker.target_client = create_fabric_client(cls.TARGET_LAYER)
+            worker.validator = cls.validator
+            with cls._worker_lock:
+                cls._worker_clients.extend([worker.source_client, worker.target_client])
+            cls._worker_state.instance = worker
+        return worker
+
+    @classmethod
+    def _collected_test_cases(cls, session) -> List[Dict[str, Any]]:
+        """Return the CSV rows pytest actually collected for this class (honors -k/selection)."""
+        rows: List[Dict[str, Any]] = []
+        for item in session.items:
+            if getattr(item, 'cls', None) is not cls:
+                continue
+            callspec = getattr(item, 'callspec', None)
+            test_case = getattr(callspec, 'params', {}).get('test_case') if callspec else None
+            if isinstance(test_case, dict):
+                rows.append(test_case)
+        return rows
+
+    @classmethod
+    def _prefetch_parallel_results(cls, session) -> None:
+        """Execute every collected row on a bounded worker pool before the first test reports."""
+        rows = cls._collected_test_cases(session)
+        executor = ParallelRowExecutor(
+            max_workers=cls.parallel_settings['max_workers'],
+            thread_name_prefix=f"{cls.SOURCE_LAYER.lower()}-{cls.TARGET_LAYER.lower()}",
+        )
+        started = time.perf_counter()
+        cls._row_executions = executor.run(
+            rows,
+            fn=lambda row: cls._worker()._execute_validation(row),
+            key=lambda row: str(row['test_id']),
+        )
+        cls._prefetch_wall_seconds = time.perf_counter() - started
+
+    def _result_for_test_case(self, test_case: Dict, request) -> Dict[str, Any]:
+        """Return the validation result for a row, from the parallel pool when enabled."""
+        cls = type(self)
+        test_id = str(test_case['test_id'])
+        if not cls._count_batches_planned:
+            cls._count_batches_planned = True
+            self._prefetch_batched_counts(cls._collected_test_cases(request.session))
+        if cls.parallel_settings['enabled']:
+            if not cls._row_executions:
+                cls._prefetch_parallel_results(request.session)
+            execution = cls._row_executions.get(test_id)
+            if execution is not None:
+                AllureEventRecorder.replay(execution.events)
+                self._attach_row_timing(execution, mode='parallel')
+                return execution.result()
+
+        execution = RowExecution(key=test_id, started_at=time.time(), worker=threading.current_thread().name)
+        started = time.perf_counter()
+        try:
+            execution.value = self._execute_validation(test_case)
+        except Exception as exc:
+            execution.error = exc
+        execution.elapsed_seconds = time.perf_counter() - started
+        cls._row_executions[test_id] = execution
+        self._attach_row_timing(execution, mode='serial')
+        return execution.result()
+
+    @classmethod
+    def _planned_query_pairs(cls, test_case: Dict) -> List[tuple]:
+        """Resolved (source_query, target_query, source_lakehouse, target_lakehouse) a row will run.
+
+        Mirrors the query resolution in ``_execute_validation``; a row that cannot
+        be resolved up front simply contributes nothing to count batching.
+        """
+        validation_type = test_case.get('validation_type', '')
+        if str(validation_type).strip().lower() == 'duplicate_column_check_using_excel_metadata':
+            return []
+        try:
+            query_config = cls._build_dynamic_queries(test_case)
+            query_variables = cls._build_query_variables(test_case)
+            dimension_list = cls._get_dimension_list(test_case)
+            execution_items = cls._build_placeholder_execution_items(
+                test_case, query_config, cls._get_table_list(test_case), dimension_list
+            )
+            uses_table = '{table_name}' in query_config['source_query'] or '{table_name}' in query_config['target_query']
+            uses_dimension = '{Dimension}' in query_config['source_query'] or '{Dimension}' in query_config['target_query']
+
+            variable_sets = []
+            for execution_item in execution_items or [None]:
+                item_vars = dict(query_variables)
+                item_case = test_case
+                if execution_item is not None:
+                    item_case = dict(test_case, table_name=execution_item['table_name'])
+                    if uses_table:
+                        item_vars['table_name'] = execution_item['table_name']
+                    if uses_dimension:
+                        item_vars['Dimension'] = execution_item['Dimension']
+                elif uses_dimension and len(dimension_list) == 1:
+                    item_vars['Dimension'] = dimension_list[0]
+                variable_sets.append((item_case, item_vars))
+
+            pairs = []
+            for item_case, item_vars in variable_sets:
+                source_query, target_query = cls._server_side_queries(
+                    item_case,
+                    validation_type,
+                    cls._resolve_query_variables(query_config['source_query'], item_vars),
+                    cls._resolve_query_variables(query_config['target_query'], item_vars),
+                )
+                pairs.append((
+                    source_query,
+                    target_query,
+                    str(item_vars.get('source_lakehouse', '')),
+                    str(item_vars.get('target_lakehouse', '')),
+                ))
+            return pairs
+        except (AssertionError, ValueError):
+            return []
+
+    def _prefetch_batched_counts(self, test_cases: List[Dict[str, Any]]) -> None:
+        """Answer simple COUNT(*) queries of all collected rows with a few batched statements.
+
+        Counts are primed into the query memo, so rows later find their results
+        there instead of each sending its own round trip. Batches run concurrently,
+        bounded per SQL endpoint.
+        """
+        if self.query_memo is None or not self.count_batch_size:
+            return
+
+        clients: Dict[str, Any] = {}
+        planned = []
+        for test_case in test_cases:
+            for source_query, target_query, source_lakehouse, target_lakehouse in self._planned_query_pairs(test_case):
+                for query, side in ((source_query, 'source'), (target_query, 'target')):
+                    client = self._pick_client_for_query(query, source_lakehouse, target_lakehouse, default_side=side)
+                    clients.setdefault(client.sql_endpoint, client)
+                    planned.append((client.sql_endpoint, query))
+
+        batched = 0
+        batches = plan_count_batches(planned, self.count_batch_size)
+        async_clients = {endpoint: AsyncFabricClient(client) for endpoint, client in clients.items()}
+        outcomes = run_queries(
+            [(async_clients[batch.endpoint], build_batched_count_query(batch.counts)) for batch in batches],
+            return_exceptions=True,
+        )
+        for batch, outcome in zip(batches, outcomes):
+            try:
+                if isinstance(outcome, Exception):
+                    raise outcome
+                counts = fan_out_counts(batch.counts, outcome)
+            except Exception as exc:
+                # Rows fall back to running their own count queries.
+                print(
+                    f"[{type(self).__name__}] batched count for {batch.lakehouse}.{batch.schema} failed; "
+                    f"running {len(batch.counts)} counts individually: {exc.__class__.__name__}: {exc}"
+                )
+                continue
+            for query, (column, value) in counts.items():
+                self.query_memo.prime(batch.endpoint, query, 'records', [{column: value}])
+                self.query_memo.prime(batch.endpoint, query, 'dataframe', pd.DataFrame({column: [value]}))
+            batched += len(batch.counts)
+        if batches:
+            print(
+                f"[{type(self).__name__}] Count batching: {batched} count queries answered by "
+                f"{len(batches)} batched statement(s)"
+            )
+
+    def _execute_query(self, client, query: str, result_format: str = 'records') -> Any:
+        """Run a query through the run-scoped dedup memo when it is enabled."""
+        if self.query_memo is not None:
+            return self.query_memo.execute(client, query, result_format)
+        if result_format == 'records':
+            return client.execute_query(query)
+        return client.execute_query(query, result_format=result_format)
+
+    @staticmethod
+    def _attach_row_timing(execution: RowExecution, mode: str) -> None:
+        allure.attach(
+            f"Mode: {mode}\nWorker: {execution.worker}\nElapsed: {execution.elapsed_seconds:.3f}s",
+            name='Execution Timing',
+            attachment_type=allure.attachment_type.TEXT
+        )
     
     @classmethod
     def _load_test_cases(cls) -> List[Dict]:
@@ -182,6 +441,18 @@ class TestCSVDrivenETLValidation:
 
         return {'source_lakehouse': source_lakehouse, 'target_lakehouse': target_lakehouse}
 
+    @classmethod
+    def _normalization_tables(cls, test_case: Dict) -> tuple[Any, Any]:
+        """Source/target table identities used to cache per-column normalization kinds."""
+        table_name = cls._derive_table_name(test_case)
+        if table_name in ('N/A', 'MULTI_TABLE'):
+            return None, None
+        lakehouses = cls._derive_lakehouse_names(test_case)
+        return (
+            f"{lakehouses['source_lakehouse']}.{table_name}",
+            f"{lakehouses['target_lakehouse']}.{table_name}",
+        )
+
     @staticmethod
     def _csv_value(test_case: Dict, key: str, default: str = '') -> str:
         """Read CSV field as a trimmed string with default fallback."""
@@ -406,6 +677,178 @@ class TestCSVDrivenETLValidation:
             'delete_record_validation_group',
         }
 
+    @staticmethod
+    def _uses_dataframe_results(validation_type: str) -> bool:
+        """Validations that only hand results to PredefinedValidations can fetch DataFrames."""
+        normalized = str(validation_type).strip().lower()
+        return normalized in {
+            'record_level_dataframe_comparison',
+            'record_level_comparison',
+            'soft_delete_consistency',
+            'incremental_validation',
+            'incremental_delta_validation',
+            'duplicate_check',
+            'duplicate_checks',
+            'duplicate_checks_primary_keys',
+            'aggregate_validation',
+            'aggregate_validations',
+            'referential_integrity',
+            'referential_integrity_validation',
+            'null_checks_mandatory_columns',
+            'row_hash_comparison',
+            'row_hash_validation',
+            'group_by_distribution_validation',
+            'distribution_validation',
+        }
+
+    @staticmethod
+    def _is_row_hash_validation(validation_type: str) -> bool:
+        normalized = str(validation_type).strip().lower()
+        return normalized in {'row_hash_comparison', 'row_hash_validation'}
+
+    @staticmethod
+    def _is_aggregate_validation(validation_type: str) -> bool:
+        normalized = str(validation_type).strip().lower()
+        return normalized in {'aggregate_validation', 'aggregate_validations'}
+
+    @staticmethod
+    def _is_distribution_validation(validation_type: str) -> bool:
+        normalized = str(validation_type).strip().lower()
+        return normalized in {'group_by_distribution_validation', 'distribution_validation'}
+
+    @staticmethod
+    def _is_incremental_validation(validation_type: str) -> bool:
+        normalized = str(validation_type).strip().lower()
+        return normalized in {'incremental_validation', 'incremental_delta_validation'}
+
+    @classmethod
+    def _stateful_incremental(cls, test_case: Dict) -> bool:
+        return cls._csv_value(test_case, 'incremental_mode', 'full').lower() == STATEFUL_MODE
+
+    @classmethod
+    def _watermark_state(cls):
+        """Open the persisted watermark store on first use, so full-mode runs never create it."""
+        with cls._worker_lock:
+            if cls._watermark_store is None:
+                cls._watermark_store = load_watermark_store()
+            return cls._watermark_store
+
+    @classmethod
+    def _watermark_state_key(cls, test_case: Dict) -> tuple[str, str, str]:
+        table_name = cls._derive_table_name(test_case)
+        lakehouses = cls._derive_lakehouse_names(test_case)
+        if table_name in ('N/A', 'MULTI_TABLE') or 'N/A' in lakehouses.values():
+            raise AssertionError(
+                "incremental_mode=stateful needs one table_name and known source/target lakehouses."
+            )
+        return lakehouses['source_lakehouse'], lakehouses['target_lakehouse'], table_name
+
+    @classmethod
+    def _pushdown_enabled(cls, test_case: Dict) -> bool:
+        """Per-row ``pushdown`` CSV value, else SQL_PUSHDOWN_ENABLED (off by default)."""
+        value = cls._csv_value(test_case, 'pushdown', '').lower()
+        if not value:
+            return cls.pushdown_enabled
+        return value in ('true', '1', 'yes', 'y')
+
+    @classmethod
+    def _pushdown_applies(
+        cls, test_case: Dict, validation_type: str, source_query: str, target_query: str
+    ) -> bool:
+        """True when an aggregate/distribution row runs on the endpoint.
+
+        Queries are left as they are (and compared in pandas) unless pushdown is
+        enabled and both can be wrapped without changing their meaning.
+        """
+        if not cls._pushdown_enabled(test_case):
+            return False
+        if cls._is_aggregate_validation(validation_type):
+            columns = list(cls._aggregate_config(test_case))
+        elif cls._is_distribution_validation(validation_type):
+            columns = cls._csv_list(test_case, 'group_columns', [])
+        else:
+            return False
+        return all(can_wrap_query(query, columns) for query in (source_query, target_query))
+
+    @classmethod
+    def _aggregate_config(cls, test_case: Dict) -> Dict[str, List[str]]:
+        aggregate_columns = cls._csv_list(test_case, 'aggregate_columns', [])
+        if not aggregate_columns:
+            raise AssertionError("aggregate_columns is required for aggregate_validation.")
+        aggregate_functions = cls._csv_list(test_case, 'aggregate_functions', ['sum'])
+        return {col: aggregate_functions for col in aggregate_columns}
+
+    @classmethod
+    def _describe_result(cls, client: FabricClient, query: str) -> Dict[str, Any]:
+        """Result column types of ``query``, described once per endpoint and query."""
+        key = (client.layer, query)
+        with cls._worker_lock:
+            if key in cls._result_types:
+                return cls._result_types[key]
+        types = client.describe_columns(query)
+        with cls._worker_lock:
+            return cls._result_types.setdefault(key, types)
+
+    @classmethod
+    def _server_side_queries(
+        cls, test_case: Dict, validation_type: str, source_query: str, target_query: str
+    ) -> tuple[str, str]:
+        """Rewrite both queries so row hashing, aggregates, group counts or watermark filters run on the endpoint."""
+        if cls._is_incremental_validation(validation_type) and cls._stateful_incremental(test_case):
+            watermark_column = cls._csv_value(test_case, 'watermark_column', 'dpmodifieddatetime')
+            watermark = cls._watermark_state().get(*cls._watermark_state_key(test_case), watermark_column)
+            if watermark is None:
+                # First stateful run (or a new watermark column) validates the full history.
+                return source_query, target_query
+            return (
+                build_incremental_query(source_query, watermark_column, watermark),
+                build_incremental_query(target_query, watermark_column, watermark),
+            )
+        if cls._is_row_hash_validation(validation_type):
+            compare_columns = cls._csv_list(test_case, 'compare_columns', [])
+            if resolve_hash_mode(cls._csv_value(test_case, 'hash_mode', 'auto'), compare_columns) != 'server':
+                return source_query, target_query
+            key_columns = cls._csv_list(test_case, 'key_columns', ['recid'])
+            column_kinds = server_column_kinds(
+                cls._describe_result(cls.source_client, source_query),
+                cls._describe_result(cls.target_client, target_query),
+                compare_columns,
+            )
+            return (
+                build_row_hash_query(source_query, key_columns, compare_columns, column_kinds),
+                build_row_hash_query(target_query, key_columns, compare_columns, column_kinds),
+            )
+        if not cls._pushdown_applies(test_case, validation_type, source_query, target_query):
+            return source_query, target_query
+        if cls._is_aggregate_validation(validation_type):
+            aggregate_config = cls._aggregate_config(test_case)
+            return (
+                build_aggregate_query(source_query, aggregate_config),
+                build_aggregate_query(target_query, aggregate_config),
+            )
+        if cls._is_distribution_validation(validation_type):
+            group_columns = cls._csv_list(test_case, 'group_columns', [])
+            if not group_columns:
+                raise AssertionError("group_columns is required for group_by_distribution_validation.")
+            return (
+                build_distribution_query(source_query, group_columns),
+                build_distribution_query(target_query, group_columns),
+            )
+        return source_query, target_query
+
+    @staticmethod
+    def _has_rows(data: Any) -> bool:
+        if isinstance(data, pd.DataFrame):
+            return not data.empty
+        return bool(data)
+
+    @staticmethod
+    def _column_names(data: Any) -> set:
+        if isinstance(data, pd.DataFrame):
+            return set(data.columns)
+        first = data[0]
+        return set(first.keys()) if hasattr(first, 'keys') else set()
+
     @staticmethod
     def _is_target_zero_validation(validation_type: str) -> bool:
         normalized = str(validation_type).strip().lower()
@@ -428,13 +871,7 @@ class TestCSVDrivenETLValidation:
     @staticmethod
     def _count_unique_recids(rows: Any) -> int:
         """Count unique recids from row objects/dicts."""
-        recids = set()
-        for row in rows or []:
-            if hasattr(row, 'get'):
-                recid = row.get('recid')
-                if recid is not None:
-                    recids.add(recid)
-        return len(recids)
+        return distinct_key_count(rows, ['recid'])
 
     @staticmethod
     def _query_uses_recid_list(query: str) -> bool:
@@ -471,6 +908,24 @@ class TestCSVDrivenETLValidation:
             return self.source_client
         return self.source_client if default_side == 'source' else self.target_client
 
+    @classmethod
+    def _recid_chunks(cls, query: str, variables: Dict[str, Any]) -> List[List[Any]]:
+        """Chunks for a ``{recid_list}`` query whose list exceeds RECID_CHUNK_SIZE, else []."""
+        recids = variables.get('recid_list')
+        chunk_size = cls.recid_chunk_settings['chunk_size']
+        if not chunk_size or not isinstance(recids, list) or len(recids) <= chunk_size:
+            return []
+        if not can_chunk_query(query):
+            return []
+        return chunk_recids(recids, chunk_size)
+
+    @staticmethod
+    def _can_query_concurrently(source_query_client, target_query_client) -> bool:
+        """Distinct clients own distinct sessions; a shared client must support pooling."""
+        if source_query_client is not target_query_client:
+            return True
+        return bool(getattr(source_query_client, 'supports_concurrent_queries', False))
+
     def _execute_queries_with_dynamic_order(
         self,
         test_id: str,
@@ -484,7 +939,8 @@ class TestCSVDrivenETLValidation:
         """Execute source/target queries honoring recid dependency direction.
 
         Default behavior is source -> target. If source_query depends on
-        {recid_list}, execution switches to target -> source.
+        {recid_list}, execution switches to target -> source. When neither
+        side depends on the other, both queries run at the same time.
         """
         recid_based = self._is_recid_based_validation(validation_type)
         source_needs_recid = self._query_uses_recid_list(source_query)
@@ -518,10 +974,37 @@ class TestCSVDrivenETLValidation:
                 return str(target_lakehouse or '<target-unknown>')
             return '<unknown-lakehouse>'
 
+        # Row dicts are only needed when recids are extracted from one side.
+        result_format = (
+            'dataframe'
+            if not (source_needs_recid or target_needs_recid) and self._uses_dataframe_results(validation_type)
+            else 'records'
+        )
+
         def _execute_with_context(client, query_text: str, variables: Dict[str, Any], query_side: str):
+            chunks = self._recid_chunks(query_text, variables)
+            if chunks:
+                workers = (
+                    self.recid_chunk_settings['max_workers']
+                    if getattr(client, 'supports_concurrent_queries', False)
+                    else 1
+                )
+                AllureEventRecorder.attach(
+                    f"{len(variables['recid_list'])} recids sent as {len(chunks)} chunks "
+                    f"of at most {self.recid_chunk_settings['chunk_size']} ({workers} at a time)",
+                    name=f'{query_side.capitalize()} RecID Chunking{suffix}',
+                    attachment_type=allure.attachment_type.TEXT
+                )
+                return merge_chunk_results(run_chunked(
+                    lambda chunk: _execute_with_context(
+                        client, query_text, {**variables, 'recid_list': chunk}, query_side
+                    ),
+                    chunks,
+                    workers,
+                ))
             resolved_query = self._resolve_query_variables(query_text, variables)
             try:
-                return client.execute_query(resolved_query)
+                return self._execute_query(client, resolved_query, result_format)
             except Exception as exc:
                 raise RuntimeError(
                     f"{query_side.capitalize()} query execution failed for test_id={test_id}{suffix}, "
@@ -530,35 +1013,35 @@ class TestCSVDrivenETLValidation:
                 ) from exc
 
         if source_needs_recid:
-            with allure.step(f"Execute target query for {test_id}{suffix}"):
+            with AllureEventRecorder.step(f"Execute target query for {test_id}{suffix}"):
                 target_results = _execute_with_context(
                     target_query_client,
                     target_query,
                     {},
                     'target'
                 )
-                allure.attach(
+                AllureEventRecorder.attach(
                     str(target_results[:10]),
                     name=f'Target Query Results (sample){suffix}',
                     attachment_type=allure.attachment_type.TEXT
                 )
                 recid_list = self._extract_recid_list(target_results)
                 query_variables['recid_list'] = recid_list
-                allure.attach(
+                AllureEventRecorder.attach(
                     str(recid_list[:20]),
                     name=f'RecID List from Target (first 20){suffix}',
                     attachment_type=allure.attachment_type.TEXT
                 )
-                allure.attach(
+                AllureEventRecorder.attach(
                     str(len(set(recid_list))),
                     name=f'Target RecID Count{suffix}',
                     attachment_type=allure.attachment_type.TEXT
                 )
 
-            with allure.step(f"Execute source query for {test_id}{suffix}"):
+            with AllureEventRecorder.step(f"Execute source query for {test_id}{suffix}"):
                 if recid_based and not query_variables.get('recid_list'):
                     source_results = []
-                    allure.attach(
+                    AllureEventRecorder.attach(
                         "Skipped source query because target returned 0 recids.",
                         name=f'Source Query Skipped{suffix}',
                         attachment_type=allure.attachment_type.TEXT
@@ -570,27 +1053,46 @@ class TestCSVDrivenETLValidation:
                         query_variables,
                         'source'
                     )
-                allure.attach(
+                AllureEventRecorder.attach(
                     str(source_results[:10]),
                     name=f'Source Query Results (sample){suffix}',
                     attachment_type=allure.attachment_type.TEXT
                 )
                 if recid_based:
-                    allure.attach(
+                    AllureEventRecorder.attach(
                         str(self._count_unique_recids(source_results)),
                         name=f'Source RecID Count{suffix}',
                         attachment_type=allure.attachment_type.TEXT
                     )
             return source_results, target_results
 
-        with allure.step(f"Execute source query for {test_id}{suffix}"):
+        if not target_needs_recid and self._can_query_concurrently(source_query_client, target_query_client):
+            source_results, target_results = run_concurrently(
+                lambda: _execute_with_context(source_query_client, source_query, {}, 'source'),
+                lambda: _execute_with_context(target_query_client, target_query, {}, 'target'),
+            )
+            with AllureEventRecorder.step(f"Execute source query for {test_id}{suffix}"):
+                AllureEventRecorder.attach(
+                    str(source_results[:10]),
+                    name=f'Source Query Results (sample){suffix}',
+                    attachment_type=allure.attachment_type.TEXT
+                )
+            with AllureEventRecorder.step(f"Execute target query for {test_id}{suffix}"):
+                AllureEventRecorder.attach(
+                    str(target_results[:10]),
+                    name=f'Target Query Results (sample){suffix}',
+                    attachment_type=allure.attachment_type.TEXT
+                )
+            return source_results, target_results
+
+        with AllureEventRecorder.step(f"Execute source query for {test_id}{suffix}"):
             source_results = _execute_with_context(
                 source_query_client,
                 source_query,
                 {},
                 'source'
             )
-            allure.attach(
+            AllureEventRecorder.attach(
                 str(source_results[:10]),
                 name=f'Source Query Results (sample){suffix}',
                 attachment_type=allure.attachment_type.TEXT
@@ -598,21 +1100,21 @@ class TestCSVDrivenETLValidation:
             if target_needs_recid:
                 recid_list = self._extract_recid_list(source_results)
                 query_variables['recid_list'] = recid_list
-                allure.attach(
+                AllureEventRecorder.attach(
                     str(recid_list[:20]),
                     name=f'RecID List from Source (first 20){suffix}',
                     attachment_type=allure.attachment_type.TEXT
                 )
-                allure.attach(
+                AllureEventRecorder.attach(
                     str(len(set(recid_list))),
                     name=f'Source RecID Count{suffix}',
                     attachment_type=allure.attachment_type.TEXT
                 )
 
-        with allure.step(f"Execute target query for {test_id}{suffix}"):
+        with AllureEventRecorder.step(f"Execute target query for {test_id}{suffix}"):
             if recid_based and target_needs_recid and not query_variables.get('recid_list'):
                 target_results = []
-                allure.attach(
+                AllureEventRecorder.attach(
                     "Skipped target query because source returned 0 recids.",
                     name=f'Target Query Skipped{suffix}',
                     attachment_type=allure.attachment_type.TEXT
@@ -624,30 +1126,19 @@ class TestCSVDrivenETLValidation:
                     query_variables,
                     'target'
                 )
-            allure.attach(
+            AllureEventRecorder.attach(
                 str(target_results[:10]),
                 name=f'Target Query Results (sample){suffix}',
                 attachment_type=allure.attachment_type.TEXT
             )
             if recid_based and target_needs_recid:
-                allure.attach(
+                AllureEventRecorder.attach(
                     str(self._count_unique_recids(target_results)),
                     name=f'Target RecID Count{suffix}',
                     attachment_type=allure.attachment_type.TEXT
                 )
         return source_results, target_results
 
-    @staticmethod
-    def _extract_key_set(rows: Any, key_columns: List[str]) -> set:
-        """Build unique key tuples from dict-like rows for provided key columns."""
-        keys = set()
-        for row in rows or []:
-            if not hasattr(row, 'get'):
-                continue
-            if all(col in row for col in key_columns):
-                keys.add(tuple(row.get(col) for col in key_columns))
-        return keys
-
     @staticmethod
     def _normalize_sheet_name(raw_name: str) -> str:
         name = (raw_name or "UNKNOWN").strip()
@@ -762,18 +1253,18 @@ class TestCSVDrivenETLValidation:
 
             per_table_results = []
             for table_name in table_list:
-                with allure.step(f"Execute duplicate metadata validation for {test_id} - {table_name}"):
+                with AllureEventRecorder.step(f"Execute duplicate metadata validation for {test_id} - {table_name}"):
                     try:
                         source_columns = self._get_columns_from_excel_metadata(source_lakehouse, table_name)
                         target_columns = self._get_columns_from_excel_metadata(target_lakehouse, table_name)
                         source_dup_query = self._build_duplicate_query(source_lakehouse, source_schema, table_name, source_columns)
                         target_dup_query = self._build_duplicate_query(target_lakehouse, target_schema, table_name, target_columns)
 
-                        allure.attach(source_dup_query, name=f"Source Duplicate Query - {table_name}", attachment_type=allure.attachment_type.TEXT)
-                        allure.attach(target_dup_query, name=f"Target Duplicate Query - {table_name}", attachment_type=allure.attachment_type.TEXT)
+                        AllureEventRecorder.attach(source_dup_query, name=f"Source Duplicate Query - {table_name}", attachment_type=allure.attachment_type.TEXT)
+                        AllureEventRecorder.attach(target_dup_query, name=f"Target Duplicate Query - {table_name}", attachment_type=allure.attachment_type.TEXT)
 
-                        source_duplicates = self.source_client.execute_query(source_dup_query)
-                        target_duplicates = self.target_client.execute_query(target_dup_query)
+                        source_duplicates = self._execute_query(self.source_client, source_dup_query)
+                        target_duplicates = self._execute_query(self.target_client, target_dup_query)
 
                         result = self._run_validation(
                             validation_type,
@@ -864,7 +1355,7 @@ class TestCSVDrivenETLValidation:
                 table_name = execution_item['table_name']
                 dimension_name = execution_item['Dimension']
 
-                with allure.step(f"Execute item {execution_label} for {test_id}"):
+                with AllureEventRecorder.step(f"Execute item {execution_label} for {test_id}"):
                     item_vars = dict(query_variables)
                     if template_uses_table_placeholder:
                         item_vars['table_name'] = table_name
@@ -874,17 +1365,20 @@ class TestCSVDrivenETLValidation:
                     source_query = self._resolve_query_variables(query_config['source_query'], item_vars)
                     target_query = self._resolve_query_variables(query_config['target_query'], item_vars)
                     try:
+                        source_exec_query, target_exec_query = self._server_side_queries(
+                            dict(test_case, table_name=table_name), validation_type, source_query, target_query
+                        )
                         source_results, target_results = self._execute_queries_with_dynamic_order(
                             test_id=test_id,
                             validation_type=validation_type,
-                            source_query=source_query,
-                            target_query=target_query,
+                            source_query=source_exec_query,
+                            target_query=target_exec_query,
                             source_lakehouse=str(item_vars.get('source_lakehouse', '')),
                             target_lakehouse=str(item_vars.get('target_lakehouse', '')),
                             label_suffix=execution_label
                         )
 
-                        with allure.step(f"Execute validation: {validation_type} - {execution_label}"):
+                        with AllureEventRecorder.step(f"Execute validation: {validation_type} - {execution_label}"):
                             runtime_test_case = dict(test_case)
                             runtime_test_case['table_name'] = table_name
                             runtime_test_case['Dimension'] = dimension_name
@@ -969,16 +1463,19 @@ class TestCSVDrivenETLValidation:
 
         source_query = self._resolve_query_variables(query_config['source_query'], query_variables)
         target_query = self._resolve_query_variables(query_config['target_query'], query_variables)
+        source_exec_query, target_exec_query = self._server_side_queries(
+            test_case, validation_type, source_query, target_query
+        )
         source_results, target_results = self._execute_queries_with_dynamic_order(
             test_id=test_id,
             validation_type=validation_type,
-            source_query=source_query,
-            target_query=target_query,
+            source_query=source_exec_query,
+            target_query=target_exec_query,
             source_lakehouse=str(query_variables.get('source_lakehouse', '')),
             target_lakehouse=str(query_variables.get('target_lakehouse', ''))
         )
         
-        with allure.step(f"Execute validation: {validation_type}"):
+        with AllureEventRecorder.step(f"Execute validation: {validation_type}"):
             runtime_test_case = dict(test_case)
             if template_uses_table_placeholder:
                 runtime_test_case['table_name'] = query_variables.get('table_name', '')
@@ -991,6 +1488,39 @@ class TestCSVDrivenETLValidation:
             )
             return result
     
+    def _row_hash_mismatch_samples(
+        self,
+        test_case: Dict,
+        hash_mode: str,
+        key_columns: List[str],
+        mismatch_keys: List[Dict[str, Any]],
+        source_df: pd.DataFrame,
+        target_df: pd.DataFrame,
+    ) -> Dict[str, Any]:
+        """Fetch full source/target rows for hash-mismatched keys only."""
+        if not mismatch_keys:
+            return {'source': [], 'target': []}
+        keys = key_tuples(mismatch_keys, key_columns)
+
+        if hash_mode == 'local':
+            key_frame = pd.DataFrame(keys, columns=key_columns)
+            return {
+                'source': source_df.merge(key_frame, on=key_columns).to_dict(orient='records'),
+                'target': target_df.merge(key_frame, on=key_columns).to_dict(orient='records'),
+            }
+
+        source_lakehouse = str(test_case.get('source_lakehouse', ''))
+        target_lakehouse = str(test_case.get('target_lakehouse', ''))
+        samples: Dict[str, Any] = {}
+        for side in ('source', 'target'):
+            query = str(test_case.get(f'{side}_query', ''))
+            client = self._pick_client_for_query(query, source_lakehouse, target_lakehouse, default_side=side)
+            try:
+                samples[side] = client.execute_query(build_key_filter_query(query, key_columns, keys))
+            except Exception as exc:
+                samples[side] = f"sample fetch failed: {exc.__class__.__name__}: {exc}"
+        return samples
+
     def _run_validation(self, validation_type: str, source_data: Any, 
                        target_data: Any, test_case: Dict) -> Dict[str, Any]:
         """Run specific validation type"""
@@ -1072,32 +1602,30 @@ class TestCSVDrivenETLValidation:
                 }
             
             elif normalized_validation in ('insert_record_validation', 'update_record_validation', 'delete_record_validation'):
-                source_recids = set(row['recid'] for row in source_data)
-                target_recids = set(row['recid'] for row in target_data)
-                missing_recids = source_recids - target_recids
-                
-                if missing_recids:
+                keys = compare_keys(source_data, target_data, ['recid'])
+
+                if keys['missing_count']:
                     return {
                         'status': 'FAILED',
-                        'source_count': len(source_recids),
-                        'target_count': len(target_recids),
-                        'source_recid_count': len(source_recids),
-                        'target_recid_count': len(target_recids),
-                        'missing_count': len(missing_recids),
-                        'missing_recids': list(missing_recids)[:10],
-                        'message': f'{len(missing_recids)} recids missing in target'
+                        'source_count': keys['source_count'],
+                        'target_count': keys['target_count'],
+                        'source_recid_count': keys['source_count'],
+                        'target_recid_count': keys['target_count'],
+                        'missing_count': keys['missing_count'],
+                        'missing_recids': keys['missing_sample'],
+                        'message': f"{keys['missing_count']} recids missing in target"
                     }
-                
+
                 return {
                     'status': 'PASSED',
-                    'source_count': len(source_recids),
-                    'target_count': len(source_recids),
-                    'source_recid_count': len(source_recids),
-                    'target_recid_count': len(target_recids),
-                    'matched_count': len(source_recids),
+                    'source_count': keys['source_count'],
+                    'target_count': keys['source_count'],
+                    'source_recid_count': keys['source_count'],
+                    'target_recid_count': keys['target_count'],
+                    'matched_count': keys['source_count'],
                     'message': (
                         'All source recids found in target'
-                        if len(source_recids) > 0
+                        if keys['source_count'] > 0
                         else 'Source returned 0 recids; validation treated as PASS'
                     )
                 }
@@ -1121,59 +1649,63 @@ class TestCSVDrivenETLValidation:
 
             elif normalized_validation in ('record_level_dataframe_comparison', 'record_level_comparison', 'insert_record_validation_group', 'update_record_validation_group', 'delete_record_validation_group'):
                 key_columns = self._csv_list(test_case, 'key_columns', ['recid'])
-                if source_data and target_data:
-                    source_cols = set(source_data[0].keys()) if hasattr(source_data[0], 'keys') else set()
-                    target_cols = set(target_data[0].keys()) if hasattr(target_data[0], 'keys') else set()
+                if self._has_rows(source_data) and self._has_rows(target_data):
+                    source_cols = self._column_names(source_data)
+                    target_cols = self._column_names(target_data)
                     if 'TableName' in source_cols and 'TableName' in target_cols and key_columns == ['recid']:
                         key_columns = ['TableName', 'recid']
 
                 source_query = str(test_case.get('source_query', ''))
                 target_query = str(test_case.get('target_query', ''))
                 if '{recid_list}' in source_query or '{recid_list}' in target_query:
-                    source_keys = self._extract_key_set(source_data, key_columns)
-                    target_keys = self._extract_key_set(target_data, key_columns)
+                    keys = compare_keys(source_data, target_data, key_columns)
 
-                    if not source_keys:
+                    if not keys['source_count']:
                         return {
                             'status': 'PASSED',
                             'source_count': 0,
                             'target_count': 0,
                             'source_recid_count': 0,
-                            'target_recid_count': len(target_keys),
+                            'target_recid_count': keys['target_count'],
                             'matched_count': 0,
                             'message': 'Source returned 0 recids; validation treated as PASS'
                         }
 
-                    missing_keys = source_keys - target_keys
-                    if missing_keys:
+                    if keys['missing_count']:
                         return {
                             'status': 'FAILED',
-                            'source_count': len(source_keys),
-                            'target_count': len(target_keys),
-                            'source_recid_count': len(source_keys),
-                            'target_recid_count': len(target_keys),
-                            'missing_count': len(missing_keys),
-                            'message': f'{len(missing_keys)} source keys missing in target. Sample: {list(missing_keys)[:10]}'
+                            'source_count': keys['source_count'],
+                            'target_count': keys['target_count'],
+                            'source_recid_count': keys['source_count'],
+                            'target_recid_count': keys['target_count'],
+                            'missing_count': keys['missing_count'],
+                            'message': (
+                                f"{keys['missing_count']} source keys missing in target. "
+                                f"Sample: {keys['missing_sample']}"
+                            )
                         }
 
                     return {
                         'status': 'PASSED',
-                        'source_count': len(source_keys),
-                        'target_count': len(target_keys),
-                        'source_recid_count': len(source_keys),
-                        'target_recid_count': len(target_keys),
-                        'matched_count': len(source_keys),
-                        'message': f'All {len(source_keys)} source keys found in target'
+                        'source_count': keys['source_count'],
+                        'target_count': keys['target_count'],
+                        'source_recid_count': keys['source_count'],
+                        'target_recid_count': keys['target_count'],
+                        'matched_count': keys['source_count'],
+                        'message': f"All {keys['source_count']} source keys found in target"
                     }
 
                 compare_columns = self._csv_list(test_case, 'compare_columns', [])
                 compare_cols_arg = compare_columns if compare_columns else None
+                source_table, target_table = self._normalization_tables(test_case)
 
                 summary = self.validator.record_level_dataframe_comparison(
                     source_data=source_data,
                     target_data=target_data,
                     key_columns=key_columns,
-                    compare_columns=compare_cols_arg
+                    compare_columns=compare_cols_arg,
+                    source_table=source_table,
+                    target_table=target_table
                 )
                 return {
                     'status': 'PASSED',
@@ -1183,6 +1715,65 @@ class TestCSVDrivenETLValidation:
                     'message': f"Record-level comparison passed for keys {key_columns}"
                 }
 
+            elif self._is_row_hash_validation(normalized_validation):
+                key_columns = self._csv_list(test_case, 'key_columns', ['recid'])
+                compare_columns = self._csv_list(test_case, 'compare_columns', [])
+                hash_mode = resolve_hash_mode(self._csv_value(test_case, 'hash_mode', 'auto'), compare_columns)
+                source_df = source_data if isinstance(source_data, pd.DataFrame) else pd.DataFrame(list(source_data or []))
+                target_df = target_data if isinstance(target_data, pd.DataFrame) else pd.DataFrame(list(target_data or []))
+
+                if hash_mode == 'local':
+                    if not compare_columns:
+                        compare_columns = [
+                            col for col in source_df.columns
+                            if col in target_df.columns and col not in key_columns
+                        ]
+                    column_kinds = local_column_kinds(
+                        source_df, target_df, compare_columns, *self._normalization_tables(test_case)
+                    )
+                    source_hashes = compute_row_hashes(source_df, key_columns, column_kinds)
+                    target_hashes = compute_row_hashes(target_df, key_columns, column_kinds)
+                else:
+                    source_hashes, target_hashes = source_df, target_df
+
+                summary = self.validator.row_hash_comparison(
+                    source_hashes, target_hashes, key_columns, raise_on_mismatch=False
+                )
+                if summary['passed']:
+                    return {
+                        'status': 'PASSED',
+                        'source_count': summary['source_key_count'],
+                        'target_count': summary['target_key_count'],
+                        'matched_count': summary['source_key_count'],
+                        'message': (
+                            f"Row-hash comparison passed for {summary['source_key_count']} keys "
+                            f"({hash_mode} hashing, keys {key_columns})"
+                        )
+                    }
+
+                samples = self._row_hash_mismatch_samples(
+                    test_case, hash_mode, key_columns, summary['sample_hash_mismatches'], source_df, target_df
+                )
+                AllureEventRecorder.attach(
+                    str(samples),
+                    name='Row-hash Mismatch Samples',
+                    attachment_type=allure.attachment_type.TEXT
+                )
+                return {
+                    'status': 'FAILED',
+                    'source_count': summary['source_key_count'],
+                    'target_count': summary['target_key_count'],
+                    'missing_count': summary['missing_in_target_count'],
+                    'message': (
+                        f"Row-hash comparison failed ({hash_mode} hashing): "
+                        f"missing_in_target={summary['missing_in_target_count']}, "
+                        f"extra_in_target={summary['extra_in_target_count']}, "
+                        f"hash_mismatches={summary['hash_mismatch_count']}. "
+                        f"Missing sample: {summary['sample_missing_in_target']}. "
+                        f"Mismatch rows sample: {samples}"
+                    )
+                }
+
             elif normalized_validation in ('incremental_validation', 'incremental_delta_validation'):
                 watermark_column = self._csv_value(test_case, 'watermark_column', 'dpmodifieddatetime')
                 key_columns = self._csv_list(test_case, 'key_columns', ['recid'])
@@ -1197,12 +1788,25 @@ class TestCSVDrivenETLValidation:
                     delta_end=delta_end or None,
                     allow_empty_delta=True
                 )
+                message = f"Incremental validation passed for range {summary['delta_start']} to {summary['delta_end']}"
+                if self._stateful_incremental(test_case):
+                    if summary['max_source_watermark'] is None:
+                        message = "Incremental validation passed: no source rows after the stored watermark"
+                    else:
+                        stored = self._watermark_state().advance(
+                            *self._watermark_state_key(test_case),
+                            watermark_column,
+                            summary['max_source_watermark'],
+                            rows_validated=summary['source_delta_rows'],
+                            test_id=str(test_case.get('test_id', '')),
+                        )
+                        message += f"; watermark advanced to {stored}"
                 return {
                     'status': 'PASSED',
                     'source_count': summary['source_delta_rows'],
                     'target_count': summary['target_delta_rows'],
                     'matched_count': summary['source_delta_rows'] - summary['missing_key_count'],
-                    'message': f"Incremental validation passed for range {summary['delta_start']} to {summary['delta_end']}"
+                    'message': message
                 }
 
             elif normalized_validation in ('duplicate_check', 'duplicate_checks', 'duplicate_checks_primary_keys'):
@@ -1239,32 +1843,74 @@ class TestCSVDrivenETLValidation:
                     'message': 'No duplicate groups found in source and target',
                 }
 
-            elif normalized_validation in ('aggregate_validation', 'aggregate_validations'):
-                aggregate_columns = self._csv_list(test_case, 'aggregate_columns', [])
-                aggregate_functions = self._csv_list(test_case, 'aggregate_functions', ['sum'])
+            elif self._is_aggregate_validation(normalized_validation):
+                aggregate_config = self._aggregate_config(test_case)
+                aggregate_columns = list(aggregate_config)
+                aggregate_functions = aggregate_config[aggregate_columns[0]]
                 tolerance = self._csv_float(test_case, 'aggregate_tolerance', 0.0)
 
-                if not aggregate_columns:
-                    raise AssertionError("aggregate_columns is required for aggregate_validation.")
-
-                aggregate_config = {col: aggregate_functions for col in aggregate_columns}
-                self.validator.aggregate_validations(
-                    source_data=source_data,
-                    target_data=target_data,
-                    aggregate_config=aggregate_config,
-                    tolerance=tolerance
-                )
+                if self._pushdown_applies(
+                    test_case, validation_type, test_case.get('source_query', ''), test_case.get('target_query', '')
+                ):
+                    # Each side returned a single row of aggregates computed on the endpoint.
+                    self.validator.aggregate_value_comparison(
+                        aggregates_from_result(source_data, aggregate_config),
+                        aggregates_from_result(target_data, aggregate_config),
+                        tolerance=tolerance
+                    )
+                    source_count = aggregate_row_count(source_data)
+                    target_count = aggregate_row_count(target_data)
+                else:
+                    self.validator.aggregate_validations(
+                        source_data=source_data,
+                        target_data=target_data,
+                        aggregate_config=aggregate_config,
+                        tolerance=tolerance
+                    )
+                    source_count = len(source_data)
+                    target_count = len(target_data)
                 return {
                     'status': 'PASSED',
-                    'source_count': len(source_data),
-                    'target_count': len(target_data),
-                    'matched_count': len(source_data),
+                    'source_count': source_count,
+                    'target_count': target_count,
+                    'matched_count': source_count,
                     'message': (
                         f"Aggregate validation passed for columns {aggregate_columns} "
                         f"with functions {aggregate_functions}"
                     )
                 }
 
+            elif self._is_distribution_validation(normalized_validation):
+                group_columns = self._csv_list(test_case, 'group_columns', [])
+                tolerance = self._csv_float(test_case, 'distribution_tolerance', 0.0)
+                if self._pushdown_applies(
+                    test_case, validation_type, test_case.get('source_query', ''), test_case.get('target_query', '')
+                ):
+                    # Each side returned one (group columns, row_count) row per group.
+                    count_columns = group_columns + [ROW_COUNT_COLUMN]
+                    source_counts, target_counts = (
+                        data if isinstance(data, pd.DataFrame) else pd.DataFrame(list(data or []), columns=count_columns)
+                        for data in (source_data, target_data)
+                    )
+                    summary = self.validator.group_count_comparison(
+                        source_counts, target_counts, group_columns, tolerance=tolerance
+                    )
+                    source_count = int(pd.to_numeric(source_counts[ROW_COUNT_COLUMN]).sum())
+                    target_count = int(pd.to_numeric(target_counts[ROW_COUNT_COLUMN]).sum())
+                else:
+                    summary = self.validator.group_by_distribution_validation(
+                        source_data, target_data, group_columns, tolerance=tolerance
+                    )
+                    source_count = len(source_data)
+                    target_count = len(target_data)
+                return {
+                    'status': 'PASSED',
+                    'source_count': source_count,
+                    'target_count': target_count,
+                    'matched_count': summary['group_count'],
+                    'message': f"Distribution matched for {summary['group_count']} groups on {group_columns}"
+                }
+
             elif normalized_validation in ('referential_integrity', 'referential_integrity_validation'):
                 child_fk_columns = self._csv_list(test_case, 'child_fk_columns', ['recid'])
                 parent_pk_columns = self._csv_list(test_case, 'parent_pk_columns', child_fk_columns)
@@ -1326,7 +1972,7 @@ class TestCSVDrivenETLValidation:
     
     @pytest.mark.fabric
     @pytest.mark.etl
-    def test_csv_driven_validation(self, test_case):
+    def test_csv_driven_validation(self, test_case, request):
         """Execute CSV-driven ETL validation test"""
         
         test_id = test_case['test_id']
@@ -1344,7 +1990,7 @@ class TestCSVDrivenETLValidation:
         allure.dynamic.label("Target_Lakehouse", lakehouses['target_lakehouse'])
         allure.dynamic.label("Validation", validation_type.replace('_', ' ').title())
         
-        result = self._execute_validation(test_case)
+        result = self._result_for_test_case(test_case, request)
         
         source_count = int(result.get('source_count', 0))
         target_count = int(result.get('target_count', 0))
@@ -0,0 +1,145 @@
+import asyncio
+import gc
+import threading
+import time
+
+import pytest
+
+import utils.async_query_client as async_client_module
+from utils.async_query_client import (
+    AsyncFabricClient,
+    AsyncQueryClient,
+    EndpointScheduler,
+    gather_queries,
+    run_queries,
+)
+from utils.fabric_client import FabricClient
+
+
+class _SlowClient:
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.order = []
+
+    def execute_query(self, query, result_format='records'):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.order.append(query)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        if query == 'fail':
+            raise RuntimeError('boom')
+        return [{'query': query, 'format': result_format}]
+
+
+class TestAsyncQueryClient:
+    """Async façade with bounded, prioritized concurrency per endpoint."""
+
+    def test_concurrency_is_bounded_per_endpoint(self):
+        client = _SlowClient()
+        first = AsyncQueryClient(client, endpoint_key='bronze.example', max_concurrency=3)
+        second = AsyncQueryClient(client, endpoint_key='bronze.example', max_concurrency=3)
+
+        results = run_queries([(first if i % 2 else second, f'q{i}') for i in range(12)])
+
+        assert [row[0]['query'] for row in results] == [f'q{i}' for i in range(12)]
+        assert client.peak == 3
+
+    def test_queued_queries_start_by_priority(self):
+        client = _SlowClient()
+        async_client = AsyncQueryClient(client, endpoint_key='silver.example', max_concurrency=1)
+
+        async def scenario():
+            blocker = asyncio.ensure_future(async_client.execute_query('blocker'))
+            await asyncio.sleep(0)
+            queued = [
+                asyncio.ensure_future(async_client.execute_query(query, priority=priority))
+                for query, priority in (('low', 5), ('high', 0), ('mid', 2))
+            ]
+            await asyncio.gather(blocker, *queued)
+
+        asyncio.run(scenario())
+
+        assert client.order == ['blocker', 'high', 'mid', 'low']
+
+    def test_errors_are_returned_in_request_order(self):
+        async_client = AsyncQueryClient(_SlowClient(delay=0))
+
+        results = run_queries([(async_client, 'ok'), (async_client, 'fail')], return_exceptions=True)
+
+        assert results[0] == [{'query': 'ok', 'format': 'records'}]
+        assert isinstance(results[1], RuntimeError)
+        with pytest.raises(RuntimeError, match='boom'):
+            run_queries([(async_client, 'fail')])
+
+    def test_cancelled_waiter_does_not_leak_its_slot(self):
+        async def scenario():
+            scheduler = EndpointScheduler(1)
+            await scheduler.acquire()
+            waiter = asyncio.ensure_future(scheduler.acquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+            scheduler.release()
+            await asyncio.wait_for(scheduler.acquire(), timeout=1)
+            return scheduler.snapshot()
+
+        assert asyncio.run(scenario()) == {'limit': 1, 'active': 1, 'queued': 0}
+
+    def test_fabric_client_limits_follow_connection_strategy(self):
+        pooled = FabricClient('BRONZE')
+        pooled.connection_strategy = 'pool'
+        single = FabricClient('BRONZE')
+        single.connection_strategy = 'reuse'
+
+        pooled_async = AsyncFabricClient(pooled)
+        single_async = AsyncFabricClient(single)
+
+        assert pooled_async.endpoint_key == pooled.sql_endpoint
+        assert pooled_async.max_concurrency == pooled.config.getint('FABRIC', 'FABRIC_POOL_SIZE', fallback=4)
+        assert single_async.endpoint_key[0] == 'client'
+        assert single_async.endpoint_key != AsyncFabricClient(single).endpoint_key
+        assert single_async.max_concurrency == 1
+
+    def test_private_endpoint_threads_are_shut_down_on_close(self):
+        async_client = AsyncQueryClient(_SlowClient(delay=0))
+        async_client.client.close = lambda: None
+        run_queries([(async_client, 'q')])
+        executor = async_client_module._executors[async_client.endpoint_key]
+
+        async_client.close()
+
+        assert async_client.endpoint_key not in async_client_module._executors
+        assert executor._shutdown
+
+    def test_collected_private_clients_release_their_threads(self):
+        async_client = AsyncQueryClient(_SlowClient(delay=0))
+        run_queries([(async_client, 'q')])
+        key = async_client.endpoint_key
+
+        del async_client
+        gc.collect()
+
+        assert key not in async_client_module._executors
+
+    def test_gather_passes_result_format(self):
+        async_client = AsyncQueryClient(_SlowClient(delay=0))
+
+        results = asyncio.run(gather_queries([(async_client, 'q')], result_format='dataframe'))
+
+        assert results == [[{'query': 'q', 'format': 'dataframe'}]]
+
+    def test_run_queries_inside_a_running_loop_points_to_gather_queries(self):
+        async_client = AsyncQueryClient(_SlowClient(delay=0))
+
+        async def scenario():
+            with pytest.raises(RuntimeError, match='gather_queries'):
+                run_queries([(async_client, 'q')])
+            return await gather_queries([(async_client, 'q')])
+
+        assert asyncio.run(scenario()) == [[{'query': 'q', 'format': 'records'}]]
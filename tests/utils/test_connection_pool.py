@@ -0,0 +1,113 @@
+import threading
+import time
+
+import pytest
+
+from utils.connection_pool import ConnectionPool
+from utils.sqlite_client import SQLiteClient
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.rollbacks = 0
+
+    def rollback(self):
+        if self.closed:
+            raise RuntimeError('connection already closed')
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+class TestConnectionPool:
+    """Shared DB-API connection pool used by the database clients."""
+
+    def test_reuses_connections_and_resets_them_on_return(self):
+        pool = ConnectionPool('db', _FakeConnection, reset=lambda conn: conn.rollback())
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        assert first is second
+        assert first.rollbacks == 2
+        assert pool.snapshot()['created'] == 1
+        assert pool.snapshot()['reused'] == 1
+
+    def test_checkout_waits_at_max_size(self):
+        pool = ConnectionPool('db', _FakeConnection, max_size=1, checkout_timeout_seconds=2)
+        held = pool.checkout()
+        borrowed = []
+        waiter = threading.Thread(target=lambda: borrowed.append(pool.checkout()))
+        waiter.start()
+
+        time.sleep(0.05)
+        assert borrowed == []
+        pool.release(held)
+        waiter.join(1)
+        assert borrowed == [held]
+        assert pool.snapshot()['checkout_waits'] >= 1
+
+    def test_checkout_times_out(self):
+        pool = ConnectionPool('db', _FakeConnection, max_size=1, checkout_timeout_seconds=0.05)
+        pool.checkout()
+
+        with pytest.raises(RuntimeError, match='Timed out'):
+            pool.checkout()
+
+    def test_idle_connections_beyond_min_size_expire(self):
+        pool = ConnectionPool('db', _FakeConnection, min_size=1, idle_timeout_seconds=0.05)
+        connections = [pool.checkout() for _ in range(3)]
+        for connection in connections:
+            pool.release(connection)
+
+        time.sleep(0.1)
+        with pool.connection():
+            pass
+
+        assert sum(connection.closed for connection in connections) == 2
+        assert pool.snapshot()['open'] == 1
+        assert pool.snapshot()['closed_idle'] == 2
+
+    def test_broken_connections_are_discarded(self):
+        pool = ConnectionPool('db', _FakeConnection, reset=lambda conn: conn.rollback())
+        connection = pool.checkout()
+        connection.closed = True
+        pool.release(connection)
+
+        assert pool.checkout() is not connection
+        assert pool.snapshot()['discarded'] == 1
+
+    def test_idle_connections_failing_validation_are_replaced(self):
+        def ping(conn):
+            if conn.closed:
+                raise RuntimeError('server closed the connection')
+            return True
+
+        pool = ConnectionPool('db', _FakeConnection, validate=ping)
+        with pool.connection() as first:
+            pass
+        first.closed = True
+
+        with pool.connection() as second:
+            assert second is not first
+        assert pool.snapshot()['discarded'] == 1
+        assert pool.snapshot()['created'] == 2
+
+    def test_sqlite_client_reuses_one_connection(self, tmp_path):
+        client = SQLiteClient(str(tmp_path / 'etl.db'))
+        client.execute_query("INSERT INTO etl_logs (source_name) VALUES (?)", ('api',))
+
+        assert client.fetch_one("SELECT COUNT(*) FROM etl_logs")[0] == 1
+        assert client.pool.snapshot()['created'] == 1
+        assert client.pool.snapshot()['checkouts'] == 3
+
+    def test_sqlite_memory_client_keeps_one_database(self):
+        client = SQLiteClient(':memory:')
+        client.execute_query("INSERT INTO etl_logs (source_name) VALUES (?)", ('api',))
+
+        assert client.fetch_one("SELECT COUNT(*) FROM etl_logs")[0] == 1
+        assert SQLiteClient(':memory:').fetch_one("SELECT COUNT(*) FROM etl_logs")[0] == 0
@@ -0,0 +1,59 @@
+import pandas as pd
+
+from utils.count_batching import (
+    build_batched_count_query,
+    fan_out_counts,
+    parse_count_query,
+    plan_count_batches,
+)
+from utils.query_memo import QueryMemo
+
+
+class _Client:
+    sql_endpoint = 'bronze.example'
+
+    def execute_query(self, query, result_format='records'):
+        raise AssertionError(f'unexpected round trip: {query}')
+
+
+class TestCountBatching:
+    """Simple count queries from many rows collapse into a few statements."""
+
+    def test_only_simple_count_queries_are_batchable(self):
+        count = parse_count_query("select count(*) AS row_count from LH_AX.fullload.CUSTTABLE where isdelete = 0;")
+
+        assert count.column == 'row_count'
+        assert (count.lakehouse, count.schema) == ('LH_AX', 'FULLLOAD')
+        assert count.body == 'from LH_AX.fullload.CUSTTABLE where isdelete = 0'
+        assert parse_count_query('SELECT COUNT(*) FROM LH.dbo.t GROUP BY status') is None
+        assert parse_count_query('SELECT COUNT(*) FROM LH.dbo.t WHERE recid IN ({recid_list})') is None
+        assert parse_count_query('SELECT recid FROM LH.dbo.t') is None
+
+    def test_counts_are_grouped_per_endpoint_and_schema(self):
+        queries = [
+            ('bronze', 'SELECT COUNT(*) FROM LH_AX.fullload.A'),
+            ('bronze', 'SELECT COUNT(*) FROM LH_AX.fullload.B'),
+            ('bronze', 'SELECT COUNT(*) FROM LH_AX.fullload.B'),
+            ('bronze', 'SELECT COUNT(*) FROM LH_AX.fullload.C'),
+            ('bronze', 'SELECT COUNT(*) FROM LH_AX.dbo.ONLY_ONE'),
+            ('silver', 'SELECT COUNT(*) FROM LH_AX.fullload.A'),
+        ]
+
+        batches = plan_count_batches(queries, batch_size=2)
+
+        assert [(batch.endpoint, len(batch.counts)) for batch in batches] == [('bronze', 2), ('bronze', 1)]
+        assert build_batched_count_query(batches[0].counts) == (
+            'SELECT (SELECT COUNT(*) FROM LH_AX.fullload.A) AS [c0], '
+            '(SELECT COUNT(*) FROM LH_AX.fullload.B) AS [c1]'
+        )
+
+    def test_fanned_out_counts_serve_rows_from_the_memo(self):
+        queries = ['SELECT COUNT(*) FROM LH.dbo.A', 'SELECT COUNT(*) AS row_count FROM LH.dbo.B WHERE x = 1']
+        (batch,) = plan_count_batches([('bronze.example', query) for query in queries])
+        counts = fan_out_counts(batch.counts, pd.DataFrame({'c0': [7], 'c1': [3]}))
+        memo = QueryMemo()
+        for query, (column, value) in counts.items():
+            memo.prime('bronze.example', query, 'records', [{column: value}])
+
+        assert memo.execute(_Client(), queries[0]) == [{'': 7}]
+        assert memo.execute(_Client(), queries[1]) == [{'row_count': 3}]
@@ -0,0 +1,175 @@
+import sqlite3
+from contextlib import contextmanager
+
+import pyodbc
+import pytest
+
+from utils.db_backend import DBAPIBackend, QueryResult, first_value, to_format_paramstyle
+from utils.db_client import DatabaseClient
+from utils.fabric_client import FabricClient
+from utils.sqlite_client import SQLiteClient
+
+
+class _RecordingClient(DBAPIBackend):
+    """Runs statements on an in-memory SQLite database after recording them."""
+
+    def __init__(self, paramstyle='qmark'):
+        self.paramstyle = paramstyle
+        self.connection = sqlite3.connect(':memory:')
+        self.sent = []
+
+    def _backend_connection(self):
+        client = self
+
+        class _Borrowed:
+            def __enter__(self):
+                return _Connection(client)
+
+            def __exit__(self, *exc):
+                return False
+
+        return _Borrowed()
+
+
+class _Connection:
+    def __init__(self, client):
+        self.client = client
+
+    def cursor(self):
+        return _Cursor(self.client)
+
+    def commit(self):
+        self.client.connection.commit()
+
+
+class _Cursor:
+    def __init__(self, client):
+        self.client = client
+        self.cursor = client.connection.cursor()
+
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+    def execute(self, query, params=()):
+        self.client.sent.append(query)
+        # Translate back so SQLite can run what a format-style driver would receive.
+        return self.cursor.execute(query.replace('%s', '?').replace('%%', '%'), params)
+
+
+class _PsycopgCursor:
+    """Enough of a psycopg2 cursor for ``execute_batch``: each execute is one page."""
+
+    def __init__(self):
+        self.pages = []
+        self.rowcount = -1
+
+    def mogrify(self, query, params):
+        return (query % tuple(repr(value) for value in params)).encode()
+
+    def execute(self, statement):
+        self.pages.append(statement.count(b';') + 1)
+        self.rowcount = 1
+
+    def close(self):
+        pass
+
+
+class TestDBAPIBackend:
+    """execute/execute_many/stream/fetch_frame shared by the database clients."""
+
+    def test_sqlite_client_round_trip_with_bind_parameters(self, tmp_path):
+        client = SQLiteClient(str(tmp_path / 'etl.db'))
+        inserted = client.execute_many(
+            "INSERT INTO products (id, title, price, category) VALUES (?, ?, ?, ?)",
+            [(i, f"p'{i}", i * 1.5, 'a' if i % 2 else 'b') for i in range(1, 8)],
+        )
+
+        result = client.execute("SELECT COUNT(*) AS n FROM products WHERE category = ?", ('a',))
+        assert inserted == 7
+        assert result.columns == ['n']
+        assert result.scalar() == 4
+        assert result[0][0] == 4
+
+        frame = client.fetch_frame("SELECT id, title FROM products WHERE price > ? ORDER BY id", (6,))
+        assert frame['id'].tolist() == [5, 6, 7]
+        assert frame['title'].iloc[0] == "p'5"
+
+        batches = list(client.stream("SELECT id FROM products ORDER BY id", batch_size=3))
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+        assert batches[0][0] == (1,)
+
+        updated = client.execute("UPDATE products SET price = ? WHERE id <= ?", (0, 2))
+        assert updated.rows == [] and updated.rowcount == 2
+
+    def test_format_paramstyle_keeps_literals_and_escapes_percent(self):
+        query = "SELECT '?', \"a?\" FROM t WHERE x = ? AND y LIKE 'a%' AND z = ?"
+
+        assert to_format_paramstyle(query) == (
+            "SELECT '?', \"a?\" FROM t WHERE x = %s AND y LIKE 'a%%' AND z = %s"
+        )
+
+    def test_format_paramstyle_skips_comments(self):
+        query = "SELECT ? -- customer's id?\nFROM t /* it's 100% ? */ WHERE x = ?"
+
+        assert to_format_paramstyle(query) == (
+            "SELECT %s -- customer's id?\nFROM t /* it's 100%% ? */ WHERE x = %s"
+        )
+
+    def test_clients_must_provide_a_backend_connection(self):
+        class _Incomplete(DBAPIBackend):
+            pass
+
+        with pytest.raises(TypeError, match='_backend_connection'):
+            _Incomplete()
+
+    def test_format_clients_translate_only_parameterized_queries(self):
+        client = _RecordingClient(paramstyle='format')
+
+        client.execute("SELECT 'a%' LIKE 'a%'")
+        assert client.execute("SELECT ? + 1, 'a%'", (1,)).rows == [(2, 'a%')]
+        assert client.sent == ["SELECT 'a%' LIKE 'a%'", "SELECT %s + 1, 'a%%'"]
+
+    def test_first_value_accepts_every_client_shape(self, tmp_path):
+        client = SQLiteClient(str(tmp_path / 'etl.db'))
+        sqlite_rows = client.execute_query("SELECT 3")
+
+        assert first_value(sqlite_rows) == 3
+        assert first_value([(4, 'x')]) == 4
+        assert first_value([{'row_count': 5}]) == 5
+        assert first_value(QueryResult(['n'], [(6,)])) == 6
+        assert first_value([], default=0) == 0
+        assert first_value(7) == 7
+
+    def test_fabric_execute_runs_under_the_retry_loop(self, monkeypatch):
+        client = FabricClient('BRONZE')
+        client.connection_strategy = 'pool'
+        client._get_limiter = lambda: None
+        attempts = []
+
+        def run_once(query, params):
+            attempts.append(params)
+            if len(attempts) == 1:
+                raise pyodbc.Error('08S01', 'Communication link failure')
+            return QueryResult(['n'], [(1,)])
+
+        monkeypatch.setattr(client, '_execute_once', run_once)
+
+        assert client.execute("SELECT ?", (1,)).scalar() == 1
+        assert attempts == [(1,), (1,)]
+
+    def test_postgres_batches_report_unknown_row_count(self, monkeypatch):
+        client = DatabaseClient()
+        cursor = _PsycopgCursor()
+        commits = []
+
+        @contextmanager
+        def connection():
+            yield type('Conn', (), {'cursor': lambda self: cursor, 'commit': lambda self: commits.append(1)})()
+
+        monkeypatch.setattr(client, 'get_connection', connection)
+
+        affected = client.execute_many("INSERT INTO t (id, name) VALUES (?, ?)", [(i, 'x') for i in range(2500)])
+
+        assert cursor.pages == [1000, 1000, 500]
+        assert affected == -1
+        assert commits == [1]
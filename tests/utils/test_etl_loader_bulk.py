@@ -0,0 +1,92 @@
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import psycopg2
+
+import utils.etl_loader as etl_loader_module
+from utils.etl_loader import ETLLoader
+
+
+class _FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, query, params=None):
+        self.connection.statements.append(' '.join(query.split()))
+
+    def fetchone(self):
+        return (7,)
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.merged = []
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class _FakeDatabaseClient:
+    def __init__(self):
+        self.connection = _FakeConnection()
+        self.connections_opened = 0
+
+    @contextmanager
+    def get_connection(self):
+        self.connections_opened += 1
+        yield self.connection
+
+
+def _fake_execute_values(cursor, query, rows, page_size=None):
+    if any(row[2] == 'bad' for row in rows):
+        raise psycopg2.DataError('invalid input syntax for type numeric')
+    cursor.connection.merged.append([row[0] for row in rows])
+
+
+def _product(product_id, price=9.99):
+    return {'id': product_id, 'title': f'p{product_id}', 'price': price, 'category': 'c', 'rating': {'rate': 4.1}}
+
+
+def _loader(products, batch_size, monkeypatch):
+    monkeypatch.setattr(etl_loader_module, 'execute_values', _fake_execute_values)
+    loader = ETLLoader()
+    loader.batch_size = batch_size
+    loader.db_client = _FakeDatabaseClient()
+    loader.api_client = SimpleNamespace(get=lambda endpoint: SimpleNamespace(json=lambda: products))
+    return loader
+
+
+class TestETLLoaderBulkUpsert:
+    """Products are staged and merged per batch over one connection."""
+
+    def test_batches_share_one_connection_and_one_merge_each(self, monkeypatch):
+        loader = _loader([_product(i) for i in range(1, 8)], 3, monkeypatch)
+
+        assert loader.load_products_from_api() == (7, 0)
+
+        connection = loader.db_client.connection
+        assert loader.db_client.connections_opened == 1
+        assert connection.merged == [[1, 2, 3], [4, 5, 6], [7]]
+        merges = [statement for statement in connection.statements if statement.startswith('INSERT INTO products (')]
+        assert len(merges) == 3
+        assert 'ON CONFLICT (id) DO UPDATE' in merges[0]
+
+    def test_bad_rows_are_isolated_within_a_failed_batch(self, monkeypatch):
+        products = [_product(i, price='bad' if i in (2, 6) else 1.0) for i in range(1, 9)]
+        products.append({'title': 'no id'})
+        loader = _loader(products, 4, monkeypatch)
+
+        assert loader.load_products_from_api() == (6, 3)
+
+        merged = sorted(row for batch in loader.db_client.connection.merged for row in batch)
+        assert merged == [1, 3, 4, 5, 7, 8]
+        assert loader.db_client.connection.rollbacks > 0
@@ -0,0 +1,108 @@
+import pytest
+
+from utils.fabric_client import FabricClient
+
+
+class _FakeCursor:
+    description = [('recid',), ('amount',)]
+
+    def __init__(self, rows):
+        self._rows = list(rows)
+        self.arraysize = 1
+        self.fetchmany_sizes = []
+        self.closed = False
+
+    def execute(self, query):
+        self.query = query
+
+    def fetchmany(self, size):
+        self.fetchmany_sizes.append(size)
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+    def fetchall(self):
+        raise AssertionError('fetchall must not be used; results are fetched in batches')
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeConnection:
+    def __init__(self, rows):
+        self.cursors = []
+        self._rows = rows
+
+    def cursor(self):
+        cursor = _FakeCursor(self._rows)
+        self.cursors.append(cursor)
+        return cursor
+
+
+@pytest.fixture
+def client():
+    fabric_client = FabricClient('BRONZE')
+    fabric_client.connection_strategy = 'reuse'
+    fabric_client.connection = _FakeConnection([(recid, recid * 10) for recid in range(5)])
+    return fabric_client
+
+
+class TestFabricClientStreaming:
+    """fetchmany-based streaming for large Fabric result sets."""
+
+    def test_iter_batches_yields_bounded_dict_batches(self, client):
+        batches = list(client.iter_batches('SELECT recid, amount FROM t', batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert batches[0][0] == {'recid': 0, 'amount': 0}
+        cursor = client.connection.cursors[-1]
+        assert cursor.arraysize == 2
+        assert cursor.closed
+
+    def test_iter_batches_columnar_format(self, client):
+        batches = list(client.iter_batches('SELECT recid, amount FROM t', batch_size=3, row_format='columns'))
+
+        assert batches[0] == {'recid': [0, 1, 2], 'amount': [0, 10, 20]}
+        assert batches[1] == {'recid': [3, 4], 'amount': [30, 40]}
+
+    def test_abandoned_stream_closes_cursor(self, client):
+        stream = client.iter_batches('SELECT recid, amount FROM t', batch_size=1)
+        next(stream)
+        stream.close()
+
+        assert client.connection.cursors[-1].closed
+
+    def test_execute_query_uses_configured_arraysize(self, client):
+        client.fetch_arraysize = 4
+
+        rows = client.execute_query('SELECT recid, amount FROM t')
+
+        assert len(rows) == 5
+        assert client.connection.cursors[-1].fetchmany_sizes[0] == 4
+
+
+class TestFabricClientColumnarResults:
+    """execute_query result_format='dataframe' / 'numpy'."""
+
+    def test_dataframe_result_is_built_column_wise(self, client):
+        frame = client.execute_query('SELECT recid, amount FROM t', result_format='dataframe')
+
+        assert list(frame.columns) == ['recid', 'amount']
+        assert frame['amount'].tolist() == [0, 10, 20, 30, 40]
+
+    def test_numpy_result_returns_one_array_per_column(self, client):
+        arrays = client.execute_query('SELECT recid, amount FROM t', result_format='numpy')
+
+        assert set(arrays) == {'recid', 'amount'}
+        assert arrays['recid'].tolist() == [0, 1, 2, 3, 4]
+
+    def test_empty_dataframe_keeps_columns(self, client):
+        client.connection = _FakeConnection([])
+
+        frame = client.execute_query('SELECT recid, amount FROM t', result_format='dataframe')
+
+        assert frame.empty
+        assert list(frame.columns) == ['recid', 'amount']
+
+    def test_unknown_result_format_is_rejected(self, client):
+        with pytest.raises(ValueError, match='result_format'):
+            client.execute_query('SELECT recid, amount FROM t', result_format='arrow')
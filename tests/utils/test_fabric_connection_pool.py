@@ -0,0 +1,145 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pyodbc
+
+import utils.fabric_client as fabric_client_module
+from utils.fabric_client import FabricClient
+from utils.fabric_connection_pool import FabricConnectionPool, FabricTokenCache, pack_access_token
+
+
+class _FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, query):
+        if not self.connection.alive:
+            raise pyodbc.Error('08S01', 'Communication link failure')
+
+    def fetchone(self):
+        return (1,)
+
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.alive = True
+        self.closed = False
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def close(self):
+        self.closed = True
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestFabricConnectionPool:
+    """Pool semantics for shared Fabric SQL endpoint sessions."""
+
+    def test_reuses_released_connections(self):
+        pool = FabricConnectionPool('endpoint', _FakeConnection, size=2)
+
+        first = pool.checkout()
+        pool.release(first)
+        second = pool.checkout()
+
+        assert second is first
+        assert pool.snapshot()['created'] == 1
+
+    def test_checkout_waits_when_pool_is_exhausted(self):
+        pool = FabricConnectionPool('endpoint', _FakeConnection, size=1)
+        held = pool.checkout()
+        borrowed = []
+
+        worker = threading.Thread(target=lambda: borrowed.append(pool.checkout()))
+        worker.start()
+        time.sleep(0.05)
+        assert not borrowed
+
+        pool.release(held)
+        worker.join(timeout=2)
+        assert borrowed == [held]
+        assert pool.snapshot()['checkout_waits'] >= 1
+
+    def test_dead_idle_connection_is_replaced_in_background(self):
+        pool = FabricConnectionPool(
+            'endpoint', _FakeConnection, size=1, validate_after_idle_seconds=0
+        )
+        stale = pool.checkout()
+        pool.release(stale)
+        stale.connection.alive = False
+        time.sleep(0.01)
+
+        fresh = pool.checkout()
+
+        assert fresh is not stale
+        assert stale.connection.closed
+        assert pool.snapshot()['discarded'] == 1
+
+    def test_discarded_connection_is_replaced_to_keep_pool_warm(self):
+        pool = FabricConnectionPool('endpoint', _FakeConnection, size=1)
+
+        pool.release(pool.checkout(), discard=True)
+
+        assert _wait_for(lambda: pool.snapshot()['idle'] == 1)
+        assert pool.snapshot()['replaced_in_background'] == 1
+
+
+class TestFabricTokenCache:
+    def test_token_is_reused_until_refresh_margin(self):
+        calls = []
+
+        class _Credential:
+            def get_token(self, scope):
+                calls.append(scope)
+                return SimpleNamespace(token=f"token-{len(calls)}", expires_on=time.time() + 3600)
+
+        cache = FabricTokenCache(refresh_margin_seconds=300)
+
+        assert cache.get_token('tenant', _Credential) == 'token-1'
+        assert cache.get_token('tenant', _Credential) == 'token-1'
+        assert len(calls) == 1
+
+        cache.invalidate('tenant')
+        assert cache.get_token('tenant', _Credential) == 'token-2'
+
+    def test_rejected_login_refreshes_the_cached_token(self, monkeypatch):
+        issued, connected = [], []
+
+        class _Credential:
+            def get_token(self, scope):
+                issued.append(f"token-{len(issued) + 1}")
+                return SimpleNamespace(token=issued[-1], expires_on=time.time() + 3600)
+
+        def connect(conn_str, attrs_before):
+            connected.append(attrs_before[fabric_client_module.SQL_COPT_SS_ACCESS_TOKEN])
+            if len(connected) == 1:
+                raise pyodbc.Error('28000', "Login failed for user '<token-identified principal>'. (18456)")
+            connection = _FakeConnection()
+            connection.cursor = lambda: SimpleNamespace(
+                execute=lambda query: None, description=[('n',)], fetchall=lambda: [(1,)], rowcount=-1, close=lambda: None
+            )
+            return connection
+
+        client = FabricClient('BRONZE')
+        client.connection_strategy = 'reuse'
+        client._get_limiter = lambda: None
+        client._credential_key = lambda: ('test', 'login-refresh')
+        client._build_credential = _Credential
+        monkeypatch.setattr(fabric_client_module.pyodbc, 'drivers', lambda: ['ODBC Driver 18 for SQL Server'])
+        monkeypatch.setattr(fabric_client_module.pyodbc, 'connect', connect)
+
+        assert client.execute('SELECT 1').scalar() == 1
+        assert connected == [pack_access_token('token-1'), pack_access_token('token-2')]
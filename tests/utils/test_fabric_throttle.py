@@ -0,0 +1,171 @@
+import threading
+
+import pyodbc
+import pytest
+
+import utils.fabric_client as fabric_client_module
+from utils.fabric_client import FabricClient
+from utils.fabric_throttle import (
+    FAILED,
+    SUCCEEDED,
+    THROTTLED,
+    AdaptiveConcurrencyLimiter,
+    backoff_delay,
+    is_throttle_error,
+    is_timeout_error,
+)
+
+
+class _ScriptedClient(FabricClient):
+    """Raises the scripted errors in order, then returns rows."""
+
+    def __init__(self, errors, limiter):
+        super().__init__('BRONZE')
+        self.connection_strategy = 'pool'
+        self.errors = list(errors)
+        self.limiter = limiter
+        self.attempts = 0
+        self.backoff_base_seconds = 0
+
+    def _get_limiter(self):
+        return self.limiter
+
+    def _run_query_once(self, query, result_format='records'):
+        self.attempts += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return [{'value': 1}]
+
+
+class _StreamConnection:
+    def cursor(self):
+        rows = [(1,), (2,)]
+        return type('Cursor', (), {
+            'description': [('value',)],
+            'execute': lambda self, query: None,
+            'fetchmany': lambda self, size: [rows.pop(0)] if rows else [],
+            'close': lambda self: None,
+        })()
+
+
+class TestFabricThrottle:
+    """AIMD endpoint limits and backoff on throttled Fabric queries."""
+
+    def test_classifies_throttle_and_timeout_errors(self):
+        assert is_throttle_error(pyodbc.Error('42000', 'Request was throttled. Retry later'))
+        assert is_throttle_error(pyodbc.Error('42000', 'CapacityLimitExceeded: the capacity limit was reached'))
+        assert not is_throttle_error(pyodbc.Error('42000', "Column 'capacity' is invalid"))
+        assert not is_throttle_error(pyodbc.Error('HYT00', '[HYT00] Query timeout expired'))
+        assert is_timeout_error(pyodbc.Error('HYT00', '[HYT00] Query timeout expired'))
+        assert not is_throttle_error(pyodbc.Error('08S01', 'Communication link failure'))
+        assert not is_throttle_error(pyodbc.Error('42S02', "Invalid object name 'dbo.t'"))
+
+    def test_backoff_is_jittered_and_capped(self):
+        delays = [backoff_delay(attempt, 1, 5) for attempt in range(8) for _ in range(20)]
+
+        assert all(0 <= delay <= 5 for delay in delays)
+        assert max(backoff_delay(0, 1, 5) for _ in range(50)) <= 1
+        assert len(set(delays)) > 1
+
+    def test_limit_halves_once_per_burst_and_grows_only_under_load(self):
+        limiter = AdaptiveConcurrencyLimiter('endpoint', initial_limit=8, max_limit=9)
+        tokens = [limiter.acquire() for _ in range(8)]
+        for token in tokens:
+            limiter.release(token, THROTTLED)
+        assert limiter.snapshot()['limit'] == 4
+
+        for _ in range(10):
+            tokens = [limiter.acquire() for _ in range(limiter.limit)]
+            for token in tokens:
+                limiter.release(token, SUCCEEDED)
+        assert limiter.limit == 9
+        limiter.limit = 6
+
+        # Unsaturated successes do not raise the limit.
+        for _ in range(20):
+            limiter.release(limiter.acquire(), SUCCEEDED)
+        assert limiter.limit == 6
+
+    def test_acquire_blocks_at_limit_and_reports_queue_depth(self):
+        limiter = AdaptiveConcurrencyLimiter('endpoint', initial_limit=1)
+        token = limiter.acquire()
+        acquired = threading.Event()
+        waiter = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+        waiter.start()
+
+        assert not acquired.wait(0.1)
+        assert limiter.snapshot()['queued'] == 1
+        limiter.release(token, FAILED)
+        assert acquired.wait(1)
+        waiter.join()
+        assert limiter.snapshot()['active'] == 1
+
+    def test_throttled_query_is_retried_with_backoff(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(fabric_client_module.time, 'sleep', sleeps.append)
+        limiter = AdaptiveConcurrencyLimiter('endpoint', initial_limit=4)
+        client = _ScriptedClient([pyodbc.Error('42000', 'throttled')] * 2, limiter)
+
+        assert client.execute_query('SELECT 1') == [{'value': 1}]
+        assert client.attempts == 3
+        assert len(sleeps) == 2
+        assert limiter.snapshot()['throttled'] == 2
+        assert limiter.snapshot()['active'] == 0
+
+    def test_retries_stop_at_configured_maximum(self, monkeypatch):
+        monkeypatch.setattr(fabric_client_module.time, 'sleep', lambda seconds: None)
+        client = _ScriptedClient([pyodbc.Error('42000', 'Request was throttled')] * 5, None)
+        client.throttle_max_retries = 2
+
+        with pytest.raises(RuntimeError, match='failed after 2 retries'):
+            client.execute_query('SELECT 1')
+        assert client.attempts == 3
+
+    def test_timeouts_have_their_own_smaller_retry_budget(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(fabric_client_module.time, 'sleep', sleeps.append)
+        limiter = AdaptiveConcurrencyLimiter('endpoint', initial_limit=4)
+        client = _ScriptedClient([pyodbc.Error('HYT00', 'Query timeout expired')] * 5, limiter)
+
+        with pytest.raises(RuntimeError, match='failed after 1 retries'):
+            client.execute_query('SELECT 1')
+        assert client.attempts == 2
+        assert len(sleeps) == 1
+        assert limiter.snapshot()['throttled'] == 2
+
+    def test_other_transient_errors_retry_once_without_backoff(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(fabric_client_module.time, 'sleep', sleeps.append)
+        client = _ScriptedClient([pyodbc.Error('08S01', 'Communication link failure')] * 2, None)
+
+        with pytest.raises(RuntimeError, match='failed after 1 retries'):
+            client.execute_query('SELECT 1')
+        assert client.attempts == 2
+        assert sleeps == []
+
+    def test_non_odbc_errors_return_their_limiter_slot(self):
+        limiter = AdaptiveConcurrencyLimiter('endpoint', initial_limit=1)
+        client = _ScriptedClient([ValueError('bad result_format'), RuntimeError('pool checkout timed out')], limiter)
+
+        with pytest.raises(ValueError):
+            client.execute_query('SELECT 1')
+        with pytest.raises(RuntimeError, match='pool checkout'):
+            client.execute_query('SELECT 1')
+        assert client.execute_query('SELECT 1') == [{'value': 1}]
+        assert limiter.snapshot()['active'] == 0
+        assert limiter.snapshot()['failed'] == 2
+
+    def test_streams_hold_a_limiter_slot_until_closed(self):
+        limiter = AdaptiveConcurrencyLimiter('endpoint', initial_limit=2)
+        client = _ScriptedClient([], limiter)
+        client.connection_strategy = 'reuse'
+        client.connection = _StreamConnection()
+
+        stream = client.iter_batches('SELECT 1', batch_size=1)
+        next(stream)
+        assert limiter.snapshot()['active'] == 1
+        stream.close()
+
+        assert list(client.iter_batches('SELECT 1', batch_size=1)) == [[{'value': 1}], [{'value': 2}]]
+        assert limiter.snapshot()['active'] == 0
+        assert limiter.snapshot()['succeeded'] == 2
@@ -0,0 +1,79 @@
+import tracemalloc
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from utils.key_comparison import compare_keys, distinct_key_count
+
+
+class TestKeyComparison:
+    """Missing/extra keys from sorted NumPy arrays."""
+
+    def test_single_key_counts_and_samples(self):
+        source = [{'recid': recid} for recid in (5, 3, 3, 1, None, 9)]
+        target = [{'recid': 3.0}, {'recid': 1}, {'recid': 7}, {'other': 1}]
+
+        result = compare_keys(source, target, ['recid'])
+
+        assert result == {
+            'source_count': 4,
+            'target_count': 3,
+            'matched_count': 2,
+            'missing_count': 2,
+            'extra_count': 1,
+            'missing_sample': [5.0, 9.0],
+            'extra_sample': [7.0],
+        }
+
+    def test_composite_keys_from_records_and_dataframes(self):
+        source = pd.DataFrame({'TableName': ['A', 'A', 'B'], 'recid': [1, 2, 1]})
+        target = [{'TableName': 'A', 'recid': 1}, {'TableName': 'B', 'recid': 1}, {'TableName': 'B', 'recid': 2}]
+
+        result = compare_keys(source, target, ['TableName', 'recid'], sample_size=1)
+
+        assert result['missing_sample'] == [('A', 2)]
+        assert result['extra_sample'] == [('B', 2)]
+        assert distinct_key_count(target, ['TableName']) == 2
+
+    def test_text_and_numeric_keys_do_not_match(self):
+        result = compare_keys([{'recid': '10'}, {'recid': 11}], [{'recid': 10}, {'recid': 11.0}], ['recid'])
+
+        assert result['matched_count'] == 1
+        assert result['missing_sample'] == ['10']
+        assert result['extra_sample'] == [10]
+
+    def test_decimal_keys_match_numbers_regardless_of_scale(self):
+        source = [{'recid': Decimal('2.0')}, {'recid': Decimal('3.000000')}, {'recid': Decimal('12345678901234567890')}]
+        target = [{'recid': 2}, {'recid': Decimal('3')}, {'recid': Decimal('12345678901234567890.000')}]
+
+        result = compare_keys(source, target, ['recid'])
+
+        assert result['matched_count'] == 3
+        assert result['missing_count'] == result['extra_count'] == 0
+
+    def test_uint64_composite_keys(self):
+        source = pd.DataFrame({'recid': np.array([2 ** 64 - 1, 5], dtype=np.uint64), 'company': [1, 2]})
+        target = pd.DataFrame({'recid': np.array([2 ** 64 - 1, 6], dtype=np.uint64), 'company': [1, 2]})
+
+        result = compare_keys(source, target, ['recid', 'company'])
+
+        assert result['missing_sample'] == [(5, 2)]
+        assert result['extra_sample'] == [(6, 2)]
+
+    def test_uses_less_memory_than_sets_of_tuples(self):
+        rows = pd.DataFrame({'company': np.arange(200_000) % 7, 'recid': np.arange(200_000)})
+        records = rows.to_dict(orient='records')
+
+        tracemalloc.start()
+        keys = {tuple(row.get(col) for col in ('company', 'recid')) for row in records}
+        set_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del keys
+
+        tracemalloc.start()
+        compare_keys(rows, rows, ['company', 'recid'])
+        array_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        assert array_peak < set_peak / 2
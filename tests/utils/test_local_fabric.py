@@ -0,0 +1,118 @@
+import pytest
+
+from utils.local_fabric import (
+    LocalFabricClient,
+    close_local_databases,
+    generate_lakehouse_data,
+    translate_tsql,
+)
+from utils.row_hash import build_row_hash_query, server_column_kinds
+
+
+@pytest.fixture
+def lakehouses(tmp_path):
+    pytest.importorskip('duckdb')
+    summary = generate_lakehouse_data(
+        str(tmp_path),
+        ['custtrans'],
+        3000,
+        ['LH_AX_APAC', 'LH_AX_ITALY'],
+        'LH_Finance',
+        source_schema='fullload',
+        mismatch_rate=0.03,
+    )
+    yield str(tmp_path), summary
+    close_local_databases()
+
+
+def _client(layer, data_dir):
+    client = LocalFabricClient(layer, data_dir=data_dir)
+    client.query_cache = None
+    return client
+
+
+class TestLocalFabric:
+    """DuckDB stand-in for Fabric SQL endpoints."""
+
+    def test_translates_tsql_used_by_validation_queries(self):
+        assert translate_tsql("SELECT TOP 0 1 AS dummy") == "SELECT 1 AS dummy LIMIT 0"
+        assert translate_tsql(
+            "SELECT TOP 2 PERCENT recid FROM LH.dbo.t WHERE isdelete = 1"
+        ) == "SELECT recid FROM LH.dbo.t WHERE isdelete = 1 LIMIT 2%"
+        assert translate_tsql(
+            "SELECT COUNT_BIG(*) AS [n] FROM t WHERE CONVERT(date, modified) >= '2024-01-01' AND x = N'a'"
+        ) == "SELECT COUNT(*) AS \"n\" FROM t WHERE CAST(modified AS date) >= '2024-01-01' AND x = 'a'"
+        assert translate_tsql(
+            "SELECT CONVERT(varchar(20), ISNULL(d.activefrom, '1900-01-01'), 120) AS [ActiveFrom] FROM d WITH (NOLOCK)"
+        ) == (
+            "SELECT strftime(CAST(COALESCE(d.activefrom, '1900-01-01') AS TIMESTAMP), '%Y-%m-%d %H:%M:%S') "
+            "AS \"ActiveFrom\" FROM d"
+        )
+
+    def test_translation_leaves_string_literals_alone(self):
+        query = "SELECT * FROM (SELECT TOP (5) a FROM t) AS x WHERE b = 'SELECT TOP 3 [x] ISNULL('' N'"
+
+        assert translate_tsql(query) == (
+            "SELECT * FROM (SELECT a FROM t LIMIT 5) AS x WHERE b = 'SELECT TOP 3 [x] ISNULL('' N'"
+        )
+
+    def test_row_hash_and_watermark_queries_translate(self):
+        hashed = translate_tsql(
+            "SELECT [recid], CONVERT(VARCHAR(64), HASHBYTES('SHA2_256', CONCAT_WS(N'|', [a], [b])), 2) AS [h] FROM t"
+        )
+        incremental = translate_tsql("SELECT * FROM t WHERE [m] > CAST('2024-01-01 00:00:00.000000' AS DATETIME2(6))")
+
+        assert hashed == (
+            "SELECT \"recid\", CAST(upper(sha256(CAST(CONCAT_WS('|', \"a\", \"b\") AS VARCHAR))) AS VARCHAR(64)) "
+            "AS \"h\" FROM t"
+        )
+        assert incremental.endswith("CAST('2024-01-01 00:00:00.000000' AS TIMESTAMP)")
+
+    def test_three_part_names_resolve_against_generated_lakehouses(self, lakehouses):
+        data_dir, summary = lakehouses
+        bronze, silver = _client('BRONZE', data_dir), _client('SILVER', data_dir)
+
+        source = bronze.execute_query("SELECT COUNT(*) AS row_count FROM LH_AX_APAC.fullload.custtrans")
+        target = silver.execute_query(
+            "SELECT COUNT(*) AS row_count FROM LH_Finance.dbo.custtrans WHERE lhname = 'LH_AX_APAC'"
+        )
+
+        assert source == [{'row_count': 3000}]
+        # 1% of rows are missing from the target and 1% more are target-only.
+        assert 2900 < target[0]['row_count'] < 3100
+        assert summary['custtrans']['source_rows'] == 6000
+        assert bronze.sql_endpoint == silver.sql_endpoint
+
+    def test_result_formats_and_errors_follow_the_fabric_contract(self, lakehouses):
+        data_dir, _ = lakehouses
+        client = _client('BRONZE', data_dir)
+
+        frame = client.execute_query(
+            "SELECT TOP 5 [recid], amountcur FROM [LH_AX_ITALY].[fullload].[custtrans] ORDER BY recid",
+            result_format='dataframe',
+        )
+        assert frame['recid'].tolist() == [1, 2, 3, 4, 5]
+        assert client.execute("SELECT COUNT(*) FROM LH_AX_ITALY.fullload.custtrans WHERE recid <= ?", (10,)).scalar() == 10
+
+        with pytest.raises(RuntimeError, match='FABRIC_BRONZE query failed'):
+            client.execute_query("SELECT * FROM LH_AX_ITALY.fullload.missing_table")
+
+    def test_server_row_hashes_match_across_column_types(self, lakehouses):
+        data_dir, _ = lakehouses
+        client = _client('BRONZE', data_dir)
+        typed = "SELECT recid, amountcur, createddatetime FROM LH_AX_APAC.fullload.custtrans"
+        as_text = (
+            "SELECT recid, CAST(amountcur AS VARCHAR) || ' ' AS amountcur, createddatetime "
+            "FROM LH_AX_APAC.fullload.custtrans"
+        )
+        columns = ['amountcur', 'createddatetime']
+        kinds = server_column_kinds(client.describe_columns(typed), client.describe_columns(as_text), columns)
+
+        hashes = [
+            client.execute_query(f"{build_row_hash_query(query, ['recid'], columns, kinds)} ORDER BY recid")
+            for query in (typed, as_text)
+        ]
+
+        assert kinds == {'amountcur': 'numeric', 'createddatetime': 'datetime'}
+        assert hashes[0] == hashes[1]
+        assert len(hashes[0]) == 3000
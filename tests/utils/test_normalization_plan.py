@@ -0,0 +1,73 @@
+import pandas as pd
+import pytest
+
+from utils.predefined_validations import PredefinedValidations
+
+
+@pytest.fixture(autouse=True)
+def _fresh_plans():
+    PredefinedValidations.clear_normalization_plans()
+    yield
+    PredefinedValidations.clear_normalization_plans()
+
+
+class TestNormalizationPlan:
+    """Per-column normalization kinds inferred once and reused."""
+
+    def test_kinds_follow_dtype_and_sample(self):
+        infer = PredefinedValidations._infer_normalization_kind
+
+        assert infer(pd.Series([1, 2, None])) == 'passthrough'
+        assert infer(pd.Series(['1', '2.5', ' 3 '], dtype=object)) == 'numeric'
+        assert infer(pd.Series([' a', 'b ', None], dtype=object)) == 'text'
+        assert infer(pd.Series(pd.to_datetime(['2024-01-01', None]))) == 'numeric'
+
+    def test_planned_normalization_matches_inferred(self):
+        series = pd.Series([' x ', '10', None], dtype=object)
+
+        kind = PredefinedValidations._infer_normalization_kind(series)
+
+        assert kind == 'text'
+        assert PredefinedValidations._normalize_series(series, kind).tolist()[:2] == ['x', '10']
+
+    def test_large_columns_are_inferred_from_a_sample(self):
+        values = [str(value) for value in range(10_000)]
+        values[::3] = ['n/a'] * len(values[::3])
+
+        kind = PredefinedValidations._infer_normalization_kind(pd.Series(values, dtype=object), sample_size=500)
+
+        assert kind == 'text'
+
+    def test_kind_is_cached_per_table_and_column(self, monkeypatch):
+        calls = []
+        original = PredefinedValidations._infer_normalization_kind
+
+        def counting(series, sample_size=2000):
+            calls.append(series.name)
+            return original(series, sample_size)
+
+        monkeypatch.setattr(PredefinedValidations, '_infer_normalization_kind', staticmethod(counting))
+        source = pd.DataFrame({'recid': [1, 2], 'amount': ['1.0', '2.0']}, dtype=object)
+        target = pd.DataFrame({'recid': [1, 2], 'amount': [1.0, 2.0]})
+
+        for _ in range(3):
+            PredefinedValidations.record_level_dataframe_comparison(
+                source, target, ['recid'], source_table='LH_B.t', target_table='LH_S.t'
+            )
+
+        assert calls == ['amount', 'amount']
+
+    def test_values_outside_the_cached_sample_are_compared_as_text(self):
+        sampled = pd.DataFrame({'recid': [1, 2], 'code': ['1', '2']}, dtype=object)
+        PredefinedValidations.record_level_dataframe_comparison(
+            sampled, sampled, ['recid'], source_table='LH_B.t', target_table='LH_S.t'
+        )
+        source = pd.DataFrame({'recid': [1, 2, 3], 'code': ['1', '2', 'N/A']}, dtype=object)
+        target = pd.DataFrame({'recid': [1, 2, 3], 'code': ['1', '2', 'missing']}, dtype=object)
+
+        with pytest.raises(AssertionError, match="'mismatch_count': 1") as failure:
+            PredefinedValidations.record_level_dataframe_comparison(
+                source, target, ['recid'], source_table='LH_B.t', target_table='LH_S.t'
+            )
+
+        assert "'code_target': 'missing'" in str(failure.value)
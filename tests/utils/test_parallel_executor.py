@@ -0,0 +1,92 @@
+import threading
+import time
+
+import pytest
+
+from utils.parallel_executor import (
+    AllureEventRecorder,
+    ParallelRowExecutor,
+    format_timing_report,
+    run_concurrently,
+)
+
+
+class TestParallelRowExecutor:
+    """Bounded worker pool used by the CSV-driven Fabric suite."""
+
+    def test_runs_rows_concurrently_within_worker_bound(self):
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def work(row):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.05)
+            with lock:
+                state['active'] -= 1
+            return row * 2
+
+        executions = ParallelRowExecutor(max_workers=3).run(
+            range(9), fn=work, key=lambda row: f"ROW_{row}"
+        )
+
+        assert {key: item.result() for key, item in executions.items()} == {
+            f"ROW_{row}": row * 2 for row in range(9)
+        }
+        assert state['peak'] == 3
+        assert all(item.elapsed_seconds >= 0.05 for item in executions.values())
+
+    def test_errors_are_captured_per_row(self):
+        def work(row):
+            if row == 'bad':
+                raise RuntimeError('endpoint unavailable')
+            return row
+
+        executions = ParallelRowExecutor(max_workers=2).run(
+            ['good', 'bad'], fn=work, key=str
+        )
+
+        assert executions['good'].result() == 'good'
+        with pytest.raises(RuntimeError, match='endpoint unavailable'):
+            executions['bad'].result()
+        assert '[ERROR]' in format_timing_report(executions.values(), wall_seconds=1.0)
+
+    def test_allure_events_are_buffered_on_worker_threads(self):
+        def work(row):
+            with AllureEventRecorder.step(f"Execute {row}"):
+                AllureEventRecorder.attach('payload', name='Sample')
+            return row
+
+        executions = ParallelRowExecutor(max_workers=1).run(['TEST_01'], fn=work, key=str)
+
+        events = executions['TEST_01'].events
+        assert events[0]['title'] == 'Execute TEST_01'
+        assert events[0]['children'][0]['name'] == 'Sample'
+
+
+class TestRunConcurrently:
+    """Same-row source/target query fan-out."""
+
+    def test_calls_overlap_and_results_keep_argument_order(self):
+        def slow(value):
+            time.sleep(0.1)
+            return value
+
+        started = time.perf_counter()
+        results = run_concurrently(lambda: slow('source'), lambda: slow('target'))
+
+        assert results == ['source', 'target']
+        assert time.perf_counter() - started < 0.19
+
+    def test_first_error_in_argument_order_is_raised_after_all_calls_finish(self):
+        finished = []
+
+        def fail(name):
+            time.sleep(0.02)
+            finished.append(name)
+            raise RuntimeError(name)
+
+        with pytest.raises(RuntimeError, match='source'):
+            run_concurrently(lambda: fail('source'), lambda: fail('target'))
+        assert sorted(finished) == ['source', 'target']
@@ -0,0 +1,56 @@
+import pandas as pd
+import pytest
+
+from utils.partitioned_comparison import hash_partition_ids
+from utils.predefined_validations import PredefinedValidations
+
+
+def _frames(rows=200):
+    source = pd.DataFrame({
+        'recid': range(rows),
+        'amount': [float(recid) for recid in range(rows)],
+        'name': [f"item-{recid}" for recid in range(rows)],
+    })
+    return source, source.copy()
+
+
+class TestPartitionedRecordComparison:
+    """Hash-bucketed record_level_dataframe_comparison."""
+
+    def test_partitioned_match_returns_same_summary_as_single_merge(self):
+        source, target = _frames()
+
+        in_memory = PredefinedValidations.record_level_dataframe_comparison(source, target, ['recid'])
+        partitioned = PredefinedValidations.record_level_dataframe_comparison(
+            source, target, ['recid'], partition_count=8
+        )
+
+        assert partitioned == in_memory
+
+    def test_partitioned_counts_missing_extra_and_mismatches(self):
+        source, target = _frames()
+        target = target[target['recid'] != 5]
+        target = pd.concat([target, pd.DataFrame({'recid': [999], 'amount': [1.0], 'name': ['x']})])
+        target.loc[target['recid'].isin([10, 11]), 'amount'] = -1.0
+
+        with pytest.raises(AssertionError) as partitioned_error:
+            PredefinedValidations.record_level_dataframe_comparison(
+                source, target, ['recid'], partition_count=8
+            )
+        with pytest.raises(AssertionError) as in_memory_error:
+            PredefinedValidations.record_level_dataframe_comparison(source, target, ['recid'])
+
+        for error in (partitioned_error, in_memory_error):
+            message = str(error.value)
+            assert "'missing_in_target_count': 1" in message
+            assert "'extra_in_target_count': 1" in message
+            assert "'mismatch_count': 2" in message
+
+    def test_int_and_float_keys_land_in_same_bucket(self):
+        ints = pd.DataFrame({'recid': [1, 2, 3]})
+        floats = pd.DataFrame({'recid': [1.0, 2.0, 3.0]})
+
+        assert (
+            hash_partition_ids(ints, ['recid'], 4, [True]).tolist()
+            == hash_partition_ids(floats, ['recid'], 4, [True]).tolist()
+        )
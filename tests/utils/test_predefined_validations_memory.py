@@ -0,0 +1,82 @@
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks import CASES, build_dataset
+from utils.predefined_validations import PredefinedValidations
+
+
+def _peak_bytes(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _frame(rows=500_000):
+    return pd.DataFrame({
+        'recid': np.arange(rows),
+        'amount': np.linspace(0, 1, rows),
+        'isdelete': np.zeros(rows, dtype=np.int64),
+    })
+
+
+class TestCopyFreeValidations:
+    """DataFrame inputs are read in place, never copied or modified."""
+
+    def test_dataframe_input_is_not_copied(self):
+        df = _frame(rows=10)
+
+        assert PredefinedValidations._to_dataframe(df) is df
+
+    def test_dataframe_input_is_copied_without_copy_on_write(self, monkeypatch):
+        df = _frame(rows=10)
+        monkeypatch.setattr(PredefinedValidations, '_copy_on_write_active', staticmethod(lambda: False))
+
+        assert PredefinedValidations._to_dataframe(df) is not df
+        assert PredefinedValidations._to_dataframe(df, copy=False) is df
+
+    @pytest.mark.parametrize('case', CASES, ids=lambda case: case.method)
+    def test_every_validation_leaves_its_inputs_unchanged(self, case):
+        data = build_dataset(300, mismatch_rate=0.03, seed=3)
+        source, target = data.source.copy(), data.target.copy()
+
+        try:
+            case.prepare(data)()
+        except AssertionError:
+            pass
+
+        pd.testing.assert_frame_equal(data.source, source)
+        pd.testing.assert_frame_equal(data.target, target)
+
+    def test_null_check_stays_within_memory_budget(self):
+        df = _frame()
+        frame_bytes = df.memory_usage(deep=True).sum()
+
+        peak = _peak_bytes(
+            lambda: PredefinedValidations.null_checks_mandatory_columns(df, ['recid', 'amount', 'isdelete'])
+        )
+
+        assert peak < frame_bytes * 0.25
+
+    def test_inputs_are_left_unchanged(self):
+        source = pd.DataFrame({
+            'recid': [1, 2],
+            'amount': ['1.0', ' 2 '],
+            'modified': ['2024-01-01', '2024-01-02'],
+            'name': ['a', '  '],
+        }, dtype=object)
+        snapshot = source.copy()
+
+        PredefinedValidations.incremental_delta_validation(source, source, 'modified', ['recid'])
+        PredefinedValidations.custom_column_comparison(
+            source, source.rename(columns={'amount': 'amount_t'}), ['recid'], {'amount': 'amount_t'},
+            source_transformers={'amount': lambda series: series.str.strip()},
+        )
+        PredefinedValidations.null_checks_mandatory_columns(source, ['recid'])
+
+        pd.testing.assert_frame_equal(source, snapshot)
@@ -0,0 +1,99 @@
+import os
+import time
+
+import pytest
+
+from utils.fabric_client import FabricClient
+from utils.query_cache import QueryResultCache
+
+
+COLUMNS = ['recid', 'amount']
+VALUES = [[1, 2, 3], [10.0, None, 30.0]]
+
+
+class _CountingClient(FabricClient):
+    def __init__(self, cache):
+        super().__init__('BRONZE')
+        self.query_cache = cache
+        self.fetches = 0
+
+    @property
+    def sql_endpoint(self):
+        return 'bronze.example'
+
+    def _run_columnar_once(self, query):
+        self.fetches += 1
+        return list(COLUMNS), [list(column) for column in VALUES]
+
+
+def _age(cache, key, seconds):
+    data_path = os.path.join(cache.directory, key + '.pkl.gz')
+    stamp = time.time() - seconds
+    os.utime(data_path, (stamp, stamp))
+
+
+class TestQueryResultCache:
+    """Columnar on-disk cache with TTL and LRU eviction."""
+
+    def test_round_trip_and_key_separation(self, tmp_path):
+        cache = QueryResultCache(str(tmp_path))
+        cache.put('bronze.example', 'SELECT * FROM t ', COLUMNS, VALUES)
+
+        assert cache.get('bronze.example', 'SELECT * FROM t') == (COLUMNS, VALUES)
+        assert cache.get('silver.example', 'SELECT * FROM t') is None
+        assert cache.get('bronze.example', 'SELECT * FROM t', freshness_token='2024-06-01') is None
+
+    def test_expired_entries_are_dropped_on_read(self, tmp_path):
+        cache = QueryResultCache(str(tmp_path), ttl_seconds=60)
+        cache.put('bronze.example', 'SELECT 1', COLUMNS, VALUES)
+        assert cache.entries()[0]['expired'] is False
+
+        cache.ttl_seconds = 1e-9
+        assert cache.get('bronze.example', 'SELECT 1') is None
+        assert cache.entries() == []
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = QueryResultCache(str(tmp_path))
+        keys = [cache.put('bronze.example', f'SELECT {n}', COLUMNS, VALUES) for n in range(3)]
+        for age, key in zip((30, 20, 10), keys):
+            _age(cache, key, age)
+        cache.get('bronze.example', 'SELECT 0')
+
+        cache.max_bytes = sum(entry['bytes'] for entry in cache.entries())
+        cache.put('bronze.example', 'SELECT 3', COLUMNS, VALUES)
+
+        cached = {entry['query'] for entry in cache.entries()}
+        assert cached == {'SELECT 0', 'SELECT 2', 'SELECT 3'}
+
+    def test_purge_filters_by_endpoint(self, tmp_path):
+        cache = QueryResultCache(str(tmp_path))
+        cache.put('bronze.example', 'SELECT 1', COLUMNS, VALUES)
+        cache.put('silver.example', 'SELECT 1', COLUMNS, VALUES)
+
+        assert cache.purge(endpoint='silver.example') == 1
+        assert [entry['endpoint'] for entry in cache.entries()] == ['bronze.example']
+        assert cache.purge() == 1
+
+
+class TestFabricClientQueryCache:
+    """execute_query serves repeated queries from the cache in every result format."""
+
+    @pytest.mark.parametrize('result_format', ['records', 'dataframe', 'numpy'])
+    def test_second_query_is_served_from_cache(self, tmp_path, result_format):
+        client = _CountingClient(QueryResultCache(str(tmp_path)))
+
+        first = client.execute_query('SELECT * FROM t', result_format=result_format)
+        second = client.execute_query('SELECT * FROM t', result_format=result_format)
+
+        assert client.fetches == 1
+        if result_format == 'records':
+            assert second == first == [
+                {'recid': 1, 'amount': 10.0},
+                {'recid': 2, 'amount': None},
+                {'recid': 3, 'amount': 30.0},
+            ]
+        elif result_format == 'dataframe':
+            assert second.equals(first)
+            assert list(second.columns) == COLUMNS
+        else:
+            assert list(second['recid']) == [1, 2, 3]
@@ -0,0 +1,97 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from utils.query_memo import QueryMemo, load_query_memo, session_stats
+
+
+class _SlowClient:
+    """Counts executions and blocks until released, to exercise in-flight joins."""
+
+    sql_endpoint = 'bronze.example'
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+    def execute_query(self, query, result_format='records'):
+        self.calls.append((query, result_format))
+        self.started.set()
+        self.release.wait(5)
+        if 'broken' in query:
+            raise RuntimeError('query failed')
+        if result_format == 'dataframe':
+            return pd.DataFrame({'row_count': [3]})
+        return [{'row_count': 3}]
+
+
+class TestQueryMemo:
+    """Identical resolved queries run once per run."""
+
+    def test_repeated_queries_run_once_per_format(self):
+        client = _SlowClient()
+        client.release.set()
+        memo = QueryMemo()
+
+        first = memo.execute(client, 'SELECT COUNT(*) FROM t')
+        second = memo.execute(client, '  SELECT COUNT(*) FROM t')
+        frame = memo.execute(client, 'SELECT COUNT(*) FROM t', 'dataframe')
+
+        assert first == second == [{'row_count': 3}]
+        assert first is not second
+        assert frame['row_count'].tolist() == [3]
+        assert len(client.calls) == 2
+        assert memo.stats()['hit_rate'] == pytest.approx(1 / 3)
+
+    def test_concurrent_callers_join_the_running_query(self):
+        client = _SlowClient()
+        memo = QueryMemo()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(memo.execute(client, 'SELECT 1')))
+            for _ in range(4)
+        ]
+        threads[0].start()
+        client.started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        while memo.stats()['in_flight_hits'] < 3:
+            time.sleep(0.01)
+        client.release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(client.calls) == 1
+        assert results == [[{'row_count': 3}]] * 4
+        assert 'hit rate 75.0%' in memo.format_report()
+
+    def test_failures_are_not_memoized_and_budget_is_enforced(self):
+        client = _SlowClient()
+        client.release.set()
+        memo = QueryMemo(max_bytes=1)
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match='query failed'):
+                memo.execute(client, 'SELECT broken')
+            memo.execute(client, 'SELECT 1')
+
+        assert len(client.calls) == 4
+        assert memo.stats()['memoized_results'] == 0
+
+    def test_session_stats_sum_every_memo(self, tmp_path):
+        client = _SlowClient()
+        client.release.set()
+        before = session_stats()
+
+        for memo in (QueryMemo(), QueryMemo()):
+            memo.execute(client, 'SELECT 1')
+            memo.execute(client, 'SELECT 1')
+            memo.clear()
+        after = session_stats()
+
+        assert after['requests'] - before['requests'] == 4
+        assert after['hits'] - before['hits'] == 2
+        assert load_query_memo(str(tmp_path / 'missing.properties')).max_bytes == 64 * 1024 * 1024
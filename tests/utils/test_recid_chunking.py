@@ -0,0 +1,50 @@
+import threading
+
+import pandas as pd
+
+from utils.recid_chunking import (
+    can_chunk_query,
+    chunk_recids,
+    merge_chunk_results,
+    run_chunked,
+)
+
+
+class TestRecidChunking:
+    """Large recid lists run as bounded chunks with merged results."""
+
+    def test_only_row_level_queries_are_chunked(self):
+        assert can_chunk_query('SELECT recid, amount FROM LH.dbo.t WHERE recid IN ({recid_list})')
+        assert not can_chunk_query('SELECT COUNT(*) FROM LH.dbo.t WHERE recid IN ({recid_list})')
+        assert not can_chunk_query('SELECT DISTINCT status FROM LH.dbo.t WHERE recid IN ({recid_list})')
+        assert not can_chunk_query('SELECT recid FROM LH.dbo.t')
+
+    def test_negated_or_nested_recid_filters_are_not_chunked(self):
+        assert can_chunk_query('SELECT a.recid FROM LH.dbo.t a WHERE a.status = 1 AND a.recid IN ( {recid_list} )')
+        assert not can_chunk_query('SELECT recid FROM LH.dbo.t WHERE recid NOT IN ({recid_list})')
+        assert not can_chunk_query('SELECT count(recid) AS n FROM LH.dbo.t WHERE recid IN ({recid_list})')
+        assert not can_chunk_query(
+            'SELECT recid FROM LH.dbo.t s WHERE NOT EXISTS '
+            '(SELECT 1 FROM LH.dbo.u u WHERE u.recid = s.recid AND u.recid IN ({recid_list}))'
+        )
+        assert not can_chunk_query(
+            'SELECT recid FROM LH.dbo.t WHERE parent IN (SELECT recid FROM LH.dbo.u WHERE recid IN ({recid_list}))'
+        )
+        assert not can_chunk_query("SELECT recid FROM LH.dbo.t WHERE name = '{recid_list}'")
+
+    def test_chunks_are_distinct_and_bounded(self):
+        assert chunk_recids([3, 1, 3, 2, 5, 1, 4], 2) == [[3, 1], [2, 5], [4]]
+
+    def test_chunk_results_merge_in_order(self):
+        threads = set()
+
+        def run_chunk(chunk):
+            threads.add(threading.current_thread().name)
+            return [{'recid': recid} for recid in chunk]
+
+        results = run_chunked(run_chunk, chunk_recids(range(10), 3), max_workers=3)
+
+        assert merge_chunk_results(results) == [{'recid': recid} for recid in range(10)]
+        assert all(name.startswith('recid-chunk') for name in threads)
+        frames = [pd.DataFrame({'recid': [1, 2]}), pd.DataFrame({'recid': [3]})]
+        assert merge_chunk_results(frames)['recid'].tolist() == [1, 2, 3]
@@ -0,0 +1,122 @@
+import datetime
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from utils.predefined_validations import PredefinedValidations
+from utils.row_hash import (
+    build_key_filter_query,
+    build_row_hash_query,
+    compute_row_hashes,
+    local_column_kinds,
+    resolve_hash_mode,
+    server_column_kinds,
+)
+
+
+class TestRowHashQueries:
+    """T-SQL wrappers for server-side fingerprints and sample fetches."""
+
+    def test_row_hash_query_wraps_source_query(self):
+        query = build_row_hash_query('SELECT * FROM LH.dbo.t;', ['recid'], ['amount', 'name'])
+
+        assert query.startswith("SELECT [recid], CONVERT(VARCHAR(64), HASHBYTES('SHA2_256'")
+        assert "COALESCE(LTRIM(RTRIM(CAST([amount] AS NVARCHAR(MAX)))), N'<NULL>')" in query
+        assert query.endswith('FROM (SELECT * FROM LH.dbo.t) AS fingerprint_src')
+
+    def test_single_compare_column_is_hashed_without_concat_ws(self):
+        query = build_row_hash_query('SELECT * FROM t', ['recid'], ['amount'])
+
+        assert "CONCAT_WS" not in query
+        assert "HASHBYTES('SHA2_256', COALESCE(LTRIM(RTRIM(CAST([amount] AS NVARCHAR(MAX)))), N'<NULL>'))" in query
+
+    def test_column_kinds_pick_canonical_server_forms(self):
+        kinds = server_column_kinds(
+            {'amount': Decimal, 'posted': datetime.datetime, 'name': str, 'qty': int},
+            {'amount': str, 'posted': datetime.datetime, 'name': str, 'qty': datetime.date},
+            ['amount', 'posted', 'name', 'qty', 'missing'],
+        )
+        query = build_row_hash_query('SELECT * FROM t', ['recid'], ['amount', 'posted'], kinds)
+
+        assert kinds == {'amount': 'numeric', 'posted': 'datetime', 'name': 'text', 'qty': 'text', 'missing': 'text'}
+        assert "COALESCE(CONVERT(VARCHAR(64), TRY_CAST([amount] AS DECIMAL(38, 6))), LTRIM(RTRIM(" in query
+        assert "COALESCE(CONVERT(VARCHAR(33), TRY_CAST([posted] AS DATETIME2(6)), 126), LTRIM(RTRIM(" in query
+
+    def test_wide_compare_lists_nest_concat_ws_within_its_arity(self):
+        columns = [f'c{index}' for index in range(300)]
+        query = build_row_hash_query('SELECT * FROM t', ['recid'], columns)
+
+        hashed = query[query.index("HASHBYTES('SHA2_256', ") + len("HASHBYTES('SHA2_256', "):query.index(', 2) AS')]
+        assert hashed.startswith("CONCAT_WS(N'|', CONCAT_WS(N'|', COALESCE(LTRIM(RTRIM(CAST([c0]")
+        assert query.count('CONCAT_WS') == 3
+        assert query.count('COALESCE') == 300
+        assert "CONCAT_WS(N'|', COALESCE(LTRIM(RTRIM(CAST([c253]" in query
+
+    def test_key_filter_query_quotes_composite_keys(self):
+        query = build_key_filter_query('SELECT * FROM t', ['TableName', 'recid'], [("O'Brien", 7)])
+
+        assert query.endswith("WHERE ([TableName] = N'O''Brien' AND [recid] = 7)")
+
+    def test_auto_mode_falls_back_to_local_without_compare_columns(self):
+        assert resolve_hash_mode('auto', ['amount']) == 'server'
+        assert resolve_hash_mode('', []) == 'local'
+        with pytest.raises(ValueError, match='compare_columns'):
+            resolve_hash_mode('server', [])
+
+
+class TestLocalRowHashComparison:
+    """Local fingerprints compared through PredefinedValidations.row_hash_comparison."""
+
+    def test_equal_values_hash_equal_across_dtypes(self):
+        source = pd.DataFrame({'recid': [1, 2], 'amount': [1.0, 2.5], 'name': ['a ', None]})
+        target = pd.DataFrame({'recid': [1, 2], 'amount': ['1', '2.5'], 'name': ['a', None]})
+        kinds = local_column_kinds(source, target, ['amount', 'name'])
+
+        summary = PredefinedValidations.row_hash_comparison(
+            compute_row_hashes(source, ['recid'], kinds),
+            compute_row_hashes(target, ['recid'], kinds),
+            ['recid'],
+        )
+
+        assert summary['passed']
+        assert summary['source_key_count'] == 2
+
+    def test_non_numeric_values_keep_numeric_columns_as_text(self):
+        source = pd.DataFrame({'recid': [1, 2, 3], 'code': ['1', '2', 'N/A']})
+        target = pd.DataFrame({'recid': [1, 2, 3], 'code': ['1', '2', 'n/a']})
+        kinds = local_column_kinds(source, target, ['code'])
+
+        summary = PredefinedValidations.row_hash_comparison(
+            compute_row_hashes(source, ['recid'], kinds),
+            compute_row_hashes(target, ['recid'], kinds),
+            ['recid'],
+            raise_on_mismatch=False,
+        )
+
+        assert kinds == {'code': 'text'}
+        assert summary['sample_hash_mismatches'] == [{'recid': 3}]
+
+    def test_reports_missing_extra_and_changed_keys(self):
+        source = pd.DataFrame({'recid': [1, 2, 3], 'amount': [10, 20, 30]})
+        target = pd.DataFrame({'recid': [1, 2, 4], 'amount': [10, 21, 40]})
+        kinds = local_column_kinds(source, target, ['amount'])
+
+        summary = PredefinedValidations.row_hash_comparison(
+            compute_row_hashes(source, ['recid'], kinds),
+            compute_row_hashes(target, ['recid'], kinds),
+            ['recid'],
+            raise_on_mismatch=False,
+        )
+
+        assert not summary['passed']
+        assert summary['sample_missing_in_target'] == [{'recid': 3}]
+        assert summary['sample_extra_in_target'] == [{'recid': 4}]
+        assert summary['sample_hash_mismatches'] == [{'recid': 2}]
+
+    def test_mismatch_raises_by_default(self):
+        source = pd.DataFrame({'recid': [1], 'row_hash': ['AA']})
+        target = pd.DataFrame({'recid': [1], 'row_hash': ['BB']})
+
+        with pytest.raises(AssertionError, match='Row-hash comparison failed'):
+            PredefinedValidations.row_hash_comparison(source, target, ['recid'])
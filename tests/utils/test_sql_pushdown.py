@@ -0,0 +1,92 @@
+import math
+
+import pandas as pd
+import pytest
+
+from utils.predefined_validations import PredefinedValidations
+from utils.sql_pushdown import (
+    aggregates_from_result,
+    build_aggregate_query,
+    build_distribution_query,
+    can_wrap_query,
+    output_columns,
+)
+
+
+class TestSqlPushdown:
+    """T-SQL compiled from CSV aggregate/distribution configs."""
+
+    def test_aggregate_query_computes_all_functions_in_one_select(self):
+        query = build_aggregate_query('SELECT * FROM LH.dbo.t;', {'amount': ['sum', 'MAX']})
+
+        assert query == (
+            "SELECT COUNT_BIG(*) AS [row_count], SUM(CAST([amount] AS FLOAT)) AS [amount__sum], "
+            "MAX([amount]) AS [amount__max] FROM (SELECT * FROM LH.dbo.t) AS pushdown_src"
+        )
+
+    def test_unsupported_aggregate_is_rejected(self):
+        with pytest.raises(AssertionError, match="Unsupported aggregate 'avg'"):
+            build_aggregate_query('SELECT 1', {'amount': ['avg']})
+
+    def test_distribution_query_skips_null_groups(self):
+        query = build_distribution_query('SELECT * FROM t', ['company', 'status'])
+
+        assert 'WHERE [company] IS NOT NULL AND [status] IS NOT NULL' in query
+        assert query.endswith('GROUP BY [company], [status]')
+
+    def test_only_queries_with_known_columns_are_wrapped(self):
+        query = "SELECT TOP 5 PERCENT t.[company], CAST(amount AS FLOAT) AS amount, 'x,y' AS tag, LEN(name) FROM t"
+
+        assert output_columns(query) == ['company', 'amount', 'tag']
+        assert can_wrap_query(query, ['amount', 'Company'])
+        assert not can_wrap_query(query, ['name'])
+        assert not can_wrap_query('SELECT * FROM t', ['amount'])
+        assert not can_wrap_query('WITH x AS (SELECT amount FROM t) SELECT amount FROM x', ['amount'])
+        assert not can_wrap_query('SELECT amount FROM t ORDER BY amount', ['amount'])
+        assert can_wrap_query(
+            'SELECT amount FROM (SELECT TOP 10 amount FROM t ORDER BY amount DESC) AS latest', ['amount']
+        )
+
+    def test_null_aggregates_match_pandas_empty_results(self):
+        values = aggregates_from_result(
+            [{'row_count': 0, 'amount__sum': None, 'amount__min': None}], {'amount': ['sum', 'min']}
+        )
+
+        assert values['amount']['sum'] == 0.0
+        assert math.isnan(values['amount']['min'])
+
+
+class TestPushedDownComparisons:
+    """Pushed-down results compare like locally computed ones."""
+
+    def test_pushed_aggregates_match_local_aggregates(self):
+        rows = pd.DataFrame({'amount': [1.5, 2.5, 4.0]})
+        pushed = [{'row_count': 3, 'amount__sum': 8.0, 'amount__max': 4.0}]
+        config = {'amount': ['sum', 'max']}
+
+        assert PredefinedValidations.aggregate_value_comparison(
+            aggregates_from_result(pushed, config), aggregates_from_result(pushed, config)
+        ) == PredefinedValidations.aggregate_validations(rows, rows, config)
+
+    def test_group_counts_report_mismatched_groups(self):
+        source = pd.DataFrame({'status': ['open', 'closed'], 'row_count': [10, 4]})
+        target = pd.DataFrame({'status': ['open', 'closed'], 'row_count': [10, 5]})
+
+        with pytest.raises(AssertionError, match="'status': 'closed'"):
+            PredefinedValidations.group_count_comparison(source, target, ['status'])
+        assert PredefinedValidations.group_count_comparison(
+            source, target, ['status'], tolerance=30.0
+        )['group_count'] == 2
+
+    def test_worst_drifting_groups_are_reported_first(self):
+        source = pd.DataFrame({'company': ['A', 'B', 'C', 'D'], 'row_count': [100, 10, 50, 1000]})
+        target = pd.DataFrame({'company': ['A', 'B', 'C', 'D', 'E'], 'row_count': [101, 20, 75, 1500, 1]})
+
+        with pytest.raises(AssertionError) as error:
+            PredefinedValidations.group_count_comparison(source, target, ['company'], max_mismatch_rows=3)
+
+        message = str(error.value)
+        assert 'failed for 5 of 5 groups' in message
+        order = [message.index(f"'company': '{company}'") for company in ('E', 'B', 'D')]
+        assert order == sorted(order)
+        assert "'company': 'A'" not in message
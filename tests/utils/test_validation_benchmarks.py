@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from benchmarks import CASES, build_dataset, compare_reports, measure, parse_size, public_validation_methods, run_benchmarks
+
+
+def _report(method, rows, **measured):
+    result = {"method": method, "rows": rows, "outcome": "passed", "min_seconds": 0.1, "peak_memory_bytes": 1000}
+    result.update(measured)
+    return {"results": [result]}
+
+
+class TestSyntheticData:
+    """Deterministic source/target frames with a known mismatch split."""
+
+    def test_mismatches_split_into_missing_changed_and_extra_rows(self):
+        data = build_dataset(3_000, mismatch_rate=0.03, seed=1)
+
+        assert (data.missing_rows, data.changed_rows, data.extra_rows) == (30, 30, 30)
+        assert len(data.source) == 3_000
+        assert len(data.target) == 3_000
+        assert len(set(data.source['recid']) - set(data.target['recid'])) == 30
+        merged = data.source.merge(data.target, on='recid', suffixes=('_s', '_t'))
+        assert int((merged['amountcur_s'] != merged['amountcur_t']).sum()) == 30
+
+    def test_same_seed_builds_same_frames(self):
+        first, second = build_dataset(500, seed=7), build_dataset(500, seed=7)
+
+        assert first.target.equals(second.target)
+
+    def test_parse_size_accepts_labels_and_numbers(self):
+        assert [parse_size(label) for label in ('10k', '1m', '10M', '200k', '2500')] == [
+            10_000, 1_000_000, 10_000_000, 200_000, 2_500,
+        ]
+
+
+class TestBenchmarkHarness:
+    """Every validation runs at a small size and reports timings and memory."""
+
+    def test_every_validation_method_has_a_case(self):
+        assert sorted(case.method for case in CASES) == public_validation_methods()
+
+    def test_helpers_are_not_counted_as_validations(self):
+        methods = public_validation_methods()
+
+        assert 'shared_scan' not in methods
+        assert 'clear_normalization_plans' not in methods
+        assert 'row_count_comparison' in methods
+
+    def test_run_benchmarks_reports_every_case_without_errors(self):
+        report = run_benchmarks([300], mismatch_rate=0.03, repeats=1)
+
+        assert len(report['results']) == len(CASES)
+        errors = [result for result in report['results'] if result['outcome'] == 'error']
+        assert errors == []
+        assert {'min_seconds', 'mean_seconds', 'peak_memory_bytes'} <= set(report['results'][0])
+        assert report['metadata']['repeats'] == 1
+        json.dumps(report)
+
+    def test_measure_records_assertion_failures_as_failed(self):
+        def failing():
+            raise AssertionError('mismatch')
+
+        measured = measure(failing, repeats=2)
+
+        assert measured['outcome'] == 'failed'
+        assert measured['repeats'] == 2
+
+
+class TestCompareReports:
+    """Regressions are flagged per method and row count."""
+
+    def test_slower_and_larger_runs_are_regressions(self):
+        regressions = compare_reports(
+            _report('row_count_comparison', 1000),
+            _report('row_count_comparison', 1000, min_seconds=0.2, peak_memory_bytes=2000),
+        )
+
+        assert sorted(regression['metric'] for regression in regressions) == ['min_seconds', 'peak_memory_bytes']
+        assert regressions[0]['change'] == pytest.approx(1.0)
+
+    def test_changes_within_tolerance_and_noise_floor_are_ignored(self):
+        baseline = _report('row_count_comparison', 1000, min_seconds=0.001)
+        current = _report('row_count_comparison', 1000, min_seconds=0.004, peak_memory_bytes=1200)
+
+        assert compare_reports(baseline, current) == []
+
+    def test_new_error_is_a_regression(self):
+        current = {'results': [{'method': 'row_count_comparison', 'rows': 1000, 'outcome': 'error', 'error': 'boom'}]}
+
+        regressions = compare_reports(_report('row_count_comparison', 1000), current)
+
+        assert regressions == [{
+            'method': 'row_count_comparison', 'rows': 1000, 'metric': 'outcome', 'baseline': 'passed', 'current': 'error',
+        }]
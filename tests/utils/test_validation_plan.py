@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+
+from utils.predefined_validations import PredefinedValidations
+from utils.validation_plan import ValidationPlan
+
+
+def _rows():
+    return [
+        {'recid': 1, 'amount': 10.0, 'status': 'open', 'modified': '2024-01-01'},
+        {'recid': 2, 'amount': -5.0, 'status': 'open', 'modified': '2024-01-02'},
+        {'recid': 2, 'amount': 3.0, 'status': ' ', 'modified': '2024-01-03'},
+    ]
+
+
+class TestValidationPlan:
+    """Several checks over one dataset with shared scans."""
+
+    def test_results_match_individual_validations(self):
+        results = (
+            ValidationPlan(_rows())
+            .add('null_checks_mandatory_columns', mandatory_columns=['recid'])
+            .add('date_range_validation', date_column='modified', min_date='2024-01-01')
+            .add('negative_value_validation', columns=['amount'])
+            .add('duplicate_checks_primary_keys', primary_keys=['recid'])
+            .add('null_checks_mandatory_columns', name='status_nulls', mandatory_columns=['status'])
+            .run()
+        )
+
+        assert results['null_checks_mandatory_columns']['result'] == (
+            PredefinedValidations.null_checks_mandatory_columns(_rows(), ['recid'])
+        )
+        assert results['date_range_validation']['result'] == (
+            pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-03')
+        )
+        assert results['negative_value_validation']['status'] == 'FAILED'
+        assert "{'amount': 1}" in results['negative_value_validation']['message']
+        assert 'found 2 duplicate rows' in results['duplicate_checks_primary_keys']['message']
+        assert "{'status': 1}" in results['status_nulls']['message']
+
+    def test_group_sizes_are_shared_between_checks(self, monkeypatch):
+        df = pd.DataFrame(_rows())
+        calls = []
+        original_groupby = pd.DataFrame.groupby
+
+        def counting_groupby(self, *args, **kwargs):
+            calls.append(args)
+            return original_groupby(self, *args, **kwargs)
+
+        monkeypatch.setattr(pd.DataFrame, 'groupby', counting_groupby)
+        ValidationPlan(df).add(
+            'duplicate_checks_primary_keys', primary_keys=['status']
+        ).add(
+            'group_by_distribution_validation', target_data=df.copy(), group_columns=['status']
+        ).run()
+
+        # One groupby for the plan dataset (shared) plus one for the other side.
+        assert len(calls) == 2
+
+    def test_raise_on_failure_and_unknown_checks(self):
+        plan = ValidationPlan(_rows()).add('negative_value_validation', columns=['amount'])
+
+        with pytest.raises(AssertionError, match='1 of 1 checks failed'):
+            plan.run(raise_on_failure=True)
+        with pytest.raises(ValueError, match='Unknown validation'):
+            plan.add('_to_dataframe')
@@ -0,0 +1,51 @@
+import pandas as pd
+
+from utils.predefined_validations import PredefinedValidations
+from utils.watermark_state import WatermarkStore, build_incremental_query, format_watermark
+
+
+class TestWatermarkState:
+    """Persisted watermarks and the delta predicate pushed into source/target SQL."""
+
+    def test_incremental_query_filters_after_watermark(self):
+        query = build_incremental_query('SELECT * FROM LH.dbo.t;', 'modified', '2024-03-01T10:00:00.5+01:00')
+
+        assert query == (
+            "SELECT * FROM (SELECT * FROM LH.dbo.t) AS incremental_src "
+            "WHERE [modified] > CAST('2024-03-01 09:00:00.500000' AS DATETIME2(6))"
+        )
+
+    def test_store_round_trip_is_case_insensitive_and_scoped_to_column(self, tmp_path):
+        store = WatermarkStore(str(tmp_path / 'state' / 'watermarks.db'))
+        assert store.get('LH_AX', 'LH_Finance', 'CustTable', 'modified') is None
+
+        stored = store.advance('LH_AX', 'LH_Finance', 'CustTable', 'modified', pd.Timestamp('2024-03-01 10:00'), 5, 'T1')
+
+        assert stored == '2024-03-01 10:00:00.000000'
+        assert store.get('lh_ax', 'LH_FINANCE', 'custtable', 'Modified') == stored
+        assert store.get('LH_AX', 'LH_Finance', 'CustTable', 'created') is None
+        assert store.get('LH_AX', 'LH_Gold', 'CustTable', 'modified') is None
+
+        store.advance('LH_AX', 'LH_Finance', 'CustTable', 'modified', '2024-03-02', 2, 'T1')
+        assert [entry['watermark'] for entry in store.entries()] == ['2024-03-02 00:00:00.000000']
+
+    def test_reset_filters_by_table(self, tmp_path):
+        store = WatermarkStore(str(tmp_path / 'watermarks.db'))
+        store.advance('LH_AX', 'LH_Finance', 'a', 'modified', '2024-01-01')
+        store.advance('LH_AX', 'LH_Finance', 'b', 'modified', '2024-01-01')
+
+        assert store.reset(table_name='A') == 1
+        assert [entry['table_name'] for entry in store.entries()] == ['b']
+        assert store.reset() == 1
+
+    def test_validation_reports_max_source_watermark_in_range(self):
+        source = pd.DataFrame({'recid': [1, 2, 3], 'modified': ['2024-01-01', '2024-01-03', '2024-01-05']})
+
+        summary = PredefinedValidations.incremental_delta_validation(
+            source, source, 'modified', ['recid'], delta_end='2024-01-04'
+        )
+        empty = PredefinedValidations.incremental_delta_validation(source.iloc[:0], source, 'modified', ['recid'])
+
+        assert pd.Timestamp(summary['max_source_watermark']) == pd.Timestamp('2024-01-03')
+        assert format_watermark(summary['max_source_watermark']) == '2024-01-03 00:00:00.000000'
+        assert empty['max_source_watermark'] is None
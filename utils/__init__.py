@@ -3,6 +3,7 @@ from .db_client import DatabaseClient
 from .base_test import BaseTest
 from .data_validator import DataValidator
 from .predefined_validations import PredefinedValidations
+from .validation_plan import ValidationPlan
 from .logger import setup_logging, get_logger
 
 __all__ = [
@@ -11,6 +12,7 @@ __all__ = [
     'BaseTest',
     'DataValidator',
     'PredefinedValidations',
+    'ValidationPlan',
     'setup_logging',
     'get_logger'
 ]
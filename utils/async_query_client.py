@@ -0,0 +1,208 @@
+"""Asyncio façade over the synchronous query clients.
+
+pyodbc and the Snowflake connector block, so ``AsyncQueryClient`` runs a
+client's ``execute_query`` on a thread pool bounded per endpoint. Callers can
+schedule many queries with ``asyncio.gather``; at most ``max_concurrency`` of
+them hold a thread for one endpoint and the rest wait in the event loop,
+lowest ``priority`` value first.
+"""
+
+import asyncio
+import atexit
+import functools
+import heapq
+import itertools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, Iterable, List, Tuple
+
+from utils.fabric_client import create_fabric_client
+
+
+class EndpointScheduler:
+    """Admit at most ``limit`` queries at once; queued queries start by priority, then arrival.
+
+    Bound to one event loop and only used from that loop's thread.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(1, int(limit))
+        self.active = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    async def acquire(self, priority: int = 0) -> None:
+        # Live waiters only exist while every slot is taken; release hands slots over directly.
+        if self.active < self.limit:
+            self.active += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before cancellation; pass it on.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+    def snapshot(self) -> Dict[str, int]:
+        return {"limit": self.limit, "active": self.active, "queued": self.queued}
+
+
+_schedulers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, EndpointScheduler]]" = (
+    weakref.WeakKeyDictionary()
+)
+_executors: Dict[Hashable, ThreadPoolExecutor] = {}
+_registry_lock = threading.Lock()
+_client_ids = itertools.count()
+
+
+def _scheduler_for(key: Hashable, limit: int) -> EndpointScheduler:
+    loop = asyncio.get_running_loop()
+    with _registry_lock:
+        schedulers = _schedulers.setdefault(loop, {})
+        scheduler = schedulers.get(key)
+        if scheduler is None:
+            scheduler = EndpointScheduler(limit)
+            schedulers[key] = scheduler
+        return scheduler
+
+
+def _executor_for(key: Hashable, limit: int) -> ThreadPoolExecutor:
+    """Process-wide worker threads per endpoint, shared by every event loop."""
+    with _registry_lock:
+        executor = _executors.get(key)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max(1, int(limit)), thread_name_prefix="etl-async-query")
+            _executors[key] = executor
+        return executor
+
+
+def scheduler_snapshots() -> Dict[Hashable, Dict[str, int]]:
+    """Limit, running and queued query counts per endpoint for the current event loop."""
+    with _registry_lock:
+        schedulers = dict(_schedulers.get(asyncio.get_running_loop(), {}))
+    return {key: scheduler.snapshot() for key, scheduler in schedulers.items()}
+
+
+def _release_endpoint(key: Hashable) -> None:
+    """Drop a private endpoint's schedulers and shut down its worker threads."""
+    with _registry_lock:
+        executor = _executors.pop(key, None)
+        for schedulers in _schedulers.values():
+            schedulers.pop(key, None)
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+@atexit.register
+def shutdown_executors() -> None:
+    with _registry_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=False)
+
+
+class AsyncQueryClient:
+    """Run a synchronous client's ``execute_query`` without blocking the event loop.
+
+    ``endpoint_key`` groups clients that share capacity. By default every client
+    is its own endpoint with one query at a time, which is what single-connection
+    clients such as ``SQLServerClient`` and ``SnowflakeClient`` can handle.
+    Such a private endpoint's worker thread is shut down by ``close`` or when
+    the client is garbage collected.
+    """
+
+    def __init__(self, client: Any, endpoint_key: Hashable = None, max_concurrency: int = 1):
+        self.client = client
+        self.max_concurrency = max(1, int(max_concurrency))
+        if endpoint_key is not None:
+            self.endpoint_key = endpoint_key
+            self._release = None
+        else:
+            self.endpoint_key = ("client", next(_client_ids))
+            self._release = weakref.finalize(self, _release_endpoint, self.endpoint_key)
+
+    async def execute_query(self, query: str, *args: Any, priority: int = 0, **kwargs: Any) -> Any:
+        """Wait for an endpoint slot, then run the query on the endpoint's thread pool."""
+        scheduler = _scheduler_for(self.endpoint_key, self.max_concurrency)
+        await scheduler.acquire(priority)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                _executor_for(self.endpoint_key, self.max_concurrency),
+                functools.partial(self.client.execute_query, query, *args, **kwargs),
+            )
+        finally:
+            scheduler.release()
+
+    def close(self) -> None:
+        if self._release is not None:
+            self._release()
+        self.client.close()
+
+
+class AsyncFabricClient(AsyncQueryClient):
+    """Async ``FabricClient``; pooled clients share FABRIC_POOL_SIZE slots per SQL endpoint.
+
+    Non-pooled clients keep one connection that must not be used from two
+    threads, so they run one query at a time.
+    """
+
+    def __init__(self, client: Any = "BRONZE"):
+        if isinstance(client, str):
+            client = create_fabric_client(client)
+        if client.supports_concurrent_queries:
+            super().__init__(
+                client,
+                endpoint_key=client.sql_endpoint,
+                max_concurrency=client.config.getint("FABRIC", "FABRIC_POOL_SIZE", fallback=4),
+            )
+        else:
+            super().__init__(client)
+
+    async def execute_query(self, query: str, result_format: str = "records", priority: int = 0) -> Any:
+        return await super().execute_query(query, result_format, priority=priority)
+
+
+async def gather_queries(
+    requests: Iterable[Tuple[AsyncQueryClient, str]], return_exceptions: bool = False, **kwargs: Any
+) -> List[Any]:
+    """Run ``(client, query)`` pairs concurrently; results come back in request order."""
+    return await asyncio.gather(
+        *(client.execute_query(query, **kwargs) for client, query in requests),
+        return_exceptions=return_exceptions,
+    )
+
+
+def run_queries(
+    requests: Iterable[Tuple[AsyncQueryClient, str]], return_exceptions: bool = False, **kwargs: Any
+) -> List[Any]:
+    """Synchronous entry point to ``gather_queries`` for code not running an event loop.
+
+    Inside a running loop (async code, Jupyter) ``await gather_queries(...)`` instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            "run_queries() cannot be called from a running event loop; "
+            "use 'await gather_queries(...)' instead."
+        )
+    return asyncio.run(gather_queries(list(requests), return_exceptions=return_exceptions, **kwargs))
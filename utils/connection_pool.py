@@ -0,0 +1,248 @@
+"""Process-wide pools of reusable DB-API connections for the database clients.
+
+``DatabaseClient``, ``SQLiteClient`` and ``SnowflakeClient`` used to open a new
+connection for every ``execute_query``/``fetch_one`` call. They now borrow one
+from a ``ConnectionPool`` shared by every client with the same connection
+settings. Connections are opened on demand up to ``max_size``. Idle
+connections beyond ``min_size`` are closed after ``idle_timeout_seconds``.
+Fabric SQL endpoints keep their own pool in ``fabric_connection_pool``.
+"""
+
+import atexit
+import configparser
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional
+
+
+def load_pool_settings(config_file: str = "config/master.properties") -> Dict[str, float]:
+    """Read DB_POOL_* settings from the [DATABASE] section."""
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    return {
+        "min_size": config.getint("DATABASE", "DB_POOL_MIN_SIZE", fallback=1),
+        "max_size": config.getint("DATABASE", "DB_POOL_MAX_SIZE", fallback=5),
+        "idle_timeout_seconds": config.getfloat("DATABASE", "DB_POOL_IDLE_TIMEOUT_SECONDS", fallback=300),
+        "checkout_timeout_seconds": config.getfloat("DATABASE", "DB_POOL_CHECKOUT_TIMEOUT_SECONDS", fallback=30),
+    }
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of connections created by ``connect``.
+
+    ``reset`` runs on every returned connection (typically a rollback, so no
+    transaction is left open between borrowers); a connection whose reset fails
+    or that ``is_usable`` rejects is closed instead of reused. ``validate`` runs
+    only when an idle connection is borrowed again, for a round-trip check (such
+    as ``SELECT 1``) that catches connections the server dropped while idle.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        connect: Callable[[], Any],
+        min_size: int = 1,
+        max_size: int = 5,
+        idle_timeout_seconds: float = 300,
+        checkout_timeout_seconds: float = 30,
+        reset: Optional[Callable[[Any], None]] = None,
+        is_usable: Optional[Callable[[Any], bool]] = None,
+        validate: Optional[Callable[[Any], bool]] = None,
+    ):
+        self.name = name
+        self.max_size = max(1, int(max_size))
+        self.min_size = min(max(0, int(min_size)), self.max_size)
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.checkout_timeout_seconds = checkout_timeout_seconds
+        self._connect = connect
+        self._reset = reset
+        self._is_usable = is_usable
+        self._validate = validate
+        self._cond = threading.Condition()
+        self._idle: deque = deque()
+        self._open = 0
+        self._closed = False
+        self.stats = {
+            "checkouts": 0,
+            "created": 0,
+            "reused": 0,
+            "discarded": 0,
+            "closed_idle": 0,
+            "checkout_waits": 0,
+        }
+
+    def checkout(self) -> Any:
+        """Borrow an idle connection, open a new one below ``max_size``, or wait for one."""
+        deadline = time.monotonic() + self.checkout_timeout_seconds
+        while True:
+            connection = None
+            expired: List[Any] = []
+            try:
+                with self._cond:
+                    expired = self._expire_idle_locked()
+                    self._wait_for_slot_locked(deadline)
+                    if self._idle:
+                        connection, _ = self._idle.pop()
+                    else:
+                        self._open += 1
+                    self.stats["checkouts"] += 1
+            finally:
+                for stale in expired:
+                    self._close_quietly(stale)
+
+            if connection is None:
+                return self._open_new()
+            if self._reusable(connection):
+                with self._cond:
+                    self.stats["reused"] += 1
+                return connection
+            self._discard(connection)
+
+    def _reusable(self, connection: Any) -> bool:
+        if self._is_usable is not None and not self._is_usable(connection):
+            return False
+        if self._validate is None:
+            return True
+        try:
+            return bool(self._validate(connection))
+        except Exception:
+            return False
+
+    def _wait_for_slot_locked(self, deadline: float) -> None:
+        """Wait until an idle connection exists or another may be opened."""
+        while True:
+            if self._closed:
+                raise RuntimeError(f"Connection pool {self.name} is closed.")
+            if self._idle or self._open < self.max_size:
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RuntimeError(
+                    f"Timed out after {self.checkout_timeout_seconds}s waiting for a "
+                    f"connection from pool {self.name} (max size {self.max_size})."
+                )
+            self.stats["checkout_waits"] += 1
+            self._cond.wait(remaining)
+
+    def release(self, connection: Any, discard: bool = False) -> None:
+        """Return a borrowed connection, resetting it first, or close it when ``discard``."""
+        if not discard and self._reset is not None:
+            try:
+                self._reset(connection)
+            except Exception:
+                discard = True
+        if not discard and self._is_usable is not None and not self._is_usable(connection):
+            discard = True
+        if discard:
+            self._discard(connection)
+            return
+        with self._cond:
+            if not self._closed:
+                self._idle.append((connection, time.monotonic()))
+                self._cond.notify()
+                return
+            self._open -= 1
+        self._close_quietly(connection)
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Borrow a connection for the duration of a ``with`` block."""
+        connection = self.checkout()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self) -> None:
+        """Close every idle connection; borrowed ones are closed when released."""
+        with self._cond:
+            self._closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for connection in idle:
+            self._close_quietly(connection)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "open": self._open,
+                "idle": len(self._idle),
+                "in_use": self._open - len(self._idle),
+                **self.stats,
+            }
+
+    def _expire_idle_locked(self) -> List[Any]:
+        """Drop connections idle longer than the timeout, keeping ``min_size`` open."""
+        if self.idle_timeout_seconds is None or self.idle_timeout_seconds <= 0:
+            return []
+        cutoff = time.monotonic() - self.idle_timeout_seconds
+        expired = []
+        # The oldest idle connections are at the left; checkout reuses from the right.
+        while self._idle and self._open > self.min_size and self._idle[0][1] < cutoff:
+            connection, _ = self._idle.popleft()
+            self._open -= 1
+            self.stats["closed_idle"] += 1
+            expired.append(connection)
+        return expired
+
+    def _open_new(self) -> Any:
+        try:
+            connection = self._connect()
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.stats["created"] += 1
+        return connection
+
+    def _discard(self, connection: Any) -> None:
+        self._close_quietly(connection)
+        with self._cond:
+            self._open -= 1
+            self.stats["discarded"] += 1
+            self._cond.notify()
+
+    @staticmethod
+    def _close_quietly(connection: Any) -> None:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+_pools: Dict[Hashable, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(key: Hashable, connect: Callable[[], Any], **pool_options: Any) -> ConnectionPool:
+    """Return the process-wide pool for ``key``, creating it on first use."""
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            name = key if isinstance(key, str) else ":".join(str(part) for part in key)
+            pool = ConnectionPool(name, connect, **pool_options)
+            _pools[key] = pool
+        return pool
+
+
+def pool_snapshots() -> Dict[str, Dict[str, int]]:
+    with _pools_lock:
+        pools = list(_pools.values())
+    return {pool.name: pool.snapshot() for pool in pools}
+
+
+@atexit.register
+def close_all_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
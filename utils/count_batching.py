@@ -0,0 +1,106 @@
+"""Batch simple ``SELECT COUNT(*)`` queries from many CSV rows into a few statements.
+
+Before rows execute, every resolved query of the form
+``SELECT COUNT(*) [AS alias] FROM lakehouse.schema.table [WHERE ...]`` is
+grouped by endpoint and lakehouse/schema. Each group runs as one
+``SELECT (SELECT COUNT(*) ...) AS [c0], (SELECT COUNT(*) ...) AS [c1], ...``.
+Each count is then fanned back out in the shape the original query would have
+returned.
+"""
+
+import configparser
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+_IDENTIFIER = r"(?:\[[^\]]+\]|\w+)"
+COUNT_QUERY_PATTERN = re.compile(
+    rf"^\s*SELECT\s+COUNT\s*\(\s*(?:\*|1)\s*\)(?:\s+AS\s+(?P<alias>{_IDENTIFIER}))?"
+    rf"\s+(?P<body>FROM\s+(?P<lakehouse>{_IDENTIFIER})\.(?P<schema>{_IDENTIFIER})\.{_IDENTIFIER}"
+    r"(?:\s+WHERE\s+.*?)?)\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+# Clauses that change what the statement returns or cannot sit inside a scalar subquery.
+UNBATCHABLE_PATTERN = re.compile(r"\b(?:GROUP\s+BY|ORDER\s+BY|HAVING|UNION|JOIN|OPTION)\b|[;{}]", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class CountQuery:
+    """One simple count query and the column name it returns its count under."""
+
+    query: str
+    body: str
+    column: str
+    lakehouse: str
+    schema: str
+
+
+@dataclass
+class CountBatch:
+    """Distinct count queries for one endpoint and lakehouse/schema."""
+
+    endpoint: str
+    lakehouse: str
+    schema: str
+    counts: List[CountQuery] = field(default_factory=list)
+
+
+def load_count_batch_size(config_file: str = "config/master.properties") -> int:
+    """Counts per batched statement from [TESTING] COUNT_BATCH_SIZE; 0 disables batching."""
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    return max(0, config.getint("TESTING", "COUNT_BATCH_SIZE", fallback=50))
+
+
+def parse_count_query(query: str) -> Optional[CountQuery]:
+    """Return the parsed count query, or None when it is not safe to batch."""
+    match = COUNT_QUERY_PATTERN.match(str(query or ""))
+    if match is None or UNBATCHABLE_PATTERN.search(match.group("body")):
+        return None
+    alias = match.group("alias") or ""
+    return CountQuery(
+        query=query.strip(),
+        body=match.group("body").strip(),
+        # pyodbc reports an unaliased COUNT(*) column with an empty name.
+        column=alias.strip("[]"),
+        lakehouse=match.group("lakehouse").strip("[]").upper(),
+        schema=match.group("schema").strip("[]").upper(),
+    )
+
+
+def plan_count_batches(queries: Iterable[Tuple[str, str]], batch_size: int = 50) -> List[CountBatch]:
+    """Group ``(endpoint, query)`` pairs into batches of at most ``batch_size`` distinct counts.
+
+    Groups with a single distinct count are left out; they gain nothing from batching.
+    """
+    groups: Dict[Tuple[str, str, str], Dict[str, CountQuery]] = {}
+    for endpoint, query in queries:
+        count = parse_count_query(query)
+        if count is None:
+            continue
+        groups.setdefault((endpoint, count.lakehouse, count.schema), {}).setdefault(count.query, count)
+
+    batches: List[CountBatch] = []
+    size = max(1, int(batch_size))
+    for (endpoint, lakehouse, schema), counts in groups.items():
+        if len(counts) < 2:
+            continue
+        distinct = list(counts.values())
+        for start in range(0, len(distinct), size):
+            batches.append(CountBatch(endpoint, lakehouse, schema, distinct[start:start + size]))
+    return batches
+
+
+def build_batched_count_query(counts: List[CountQuery]) -> str:
+    """One statement returning every count as a column ``c0``, ``c1``, ..."""
+    columns = ", ".join(f"(SELECT COUNT(*) {count.body}) AS [c{index}]" for index, count in enumerate(counts))
+    return f"SELECT {columns}"
+
+
+def fan_out_counts(counts: List[CountQuery], result: Any) -> Dict[str, Tuple[str, int]]:
+    """Map each original query to ``(column, count)`` from the batched result row."""
+    rows = result.to_dict(orient="records") if hasattr(result, "to_dict") else list(result or [])
+    if not rows:
+        raise AssertionError("Batched count query returned no rows.")
+    row = rows[0]
+    return {count.query: (count.column, int(row[f"c{index}"])) for index, count in enumerate(counts)}
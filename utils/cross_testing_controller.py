@@ -2,6 +2,7 @@ import pandas as pd
 import os
 import requests
 import time
+from utils.db_backend import first_value
 
 class CrossTestingController:
     def __init__(self, csv_file="cross_testing_example.csv"):
@@ -47,8 +48,7 @@ class CrossTestingController:
             api_response = requests.get("https://fakestoreapi.com/products", verify=False)
             api_count = len(api_response.json()) if api_response.status_code == 200 else 0
             
-            db_result = db_client.execute_query("SELECT COUNT(*) FROM products")
-            db_count = db_result[0][0] if db_result else 0
+            db_count = db_client.execute("SELECT COUNT(*) FROM products").scalar(0)
             
             return 1 if api_count == db_count else 0
             
@@ -57,8 +57,7 @@ class CrossTestingController:
             api_response = requests.get("https://fakestoreapi.com/products/1", verify=False)
             api_price = api_response.json().get('price', 0) if api_response.status_code == 200 else 0
             
-            db_result = db_client.execute_query("SELECT price FROM products WHERE id = 1")
-            db_price = db_result[0][0] if db_result else 0
+            db_price = db_client.execute("SELECT price FROM products WHERE id = ?", (1,)).scalar(0)
             
             return 1 if abs(api_price - db_price) < 0.01 else 0
         
@@ -68,20 +67,14 @@ class CrossTestingController:
         """Execute performance validation"""
         if test_case['test_id'] == 'PERF_01':
             start_time = time.time()
-            db_client.execute_query("SELECT COUNT(*) FROM products")
+            db_client.execute("SELECT COUNT(*) FROM products")
             execution_time = time.time() - start_time
             return execution_time  # Should be less than threshold
         return 0
     
     def validate_result(self, actual_result, expected_condition, test_case=None):
         """Enhanced validation with cross-testing support"""
-        if isinstance(actual_result, list) and len(actual_result) > 0:
-            if hasattr(actual_result[0], '__getitem__'):
-                actual_value = actual_result[0][0]
-            else:
-                actual_value = actual_result[0]
-        else:
-            actual_value = actual_result
+        actual_value = first_value(actual_result)
         
         condition = expected_condition.upper()
         
@@ -1,5 +1,6 @@
 import pandas as pd
 import os
+from utils.db_backend import first_value
 
 class CSVTestController:
     def __init__(self, csv_file="test_cases.csv"):
@@ -31,14 +32,7 @@ class CSVTestController:
     
     def validate_result(self, actual_result, expected_condition, expected_value=None):
         """Validate test result based on condition"""
-        # Handle SQLite Row objects
-        if isinstance(actual_result, list) and len(actual_result) > 0:
-            if hasattr(actual_result[0], '__getitem__'):
-                actual_value = actual_result[0][0]
-            else:
-                actual_value = actual_result[0]
-        else:
-            actual_value = actual_result
+        actual_value = first_value(actual_result)
         
         condition = expected_condition.upper()
         
@@ -0,0 +1,227 @@
+"""One DB-API backend interface shared by every database client.
+
+``FabricClient``, ``SQLServerClient``, ``SnowflakeClient``, ``SQLiteClient`` and
+``DatabaseClient`` each keep their historical ``execute_query`` (dicts,
+``sqlite3.Row`` or tuples depending on the driver). ``DBAPIBackend`` adds the
+same four methods to all of them:
+
+``execute(query, params=None)``
+    Run one statement and return a ``QueryResult``.
+``execute_many(query, seq_of_params)``
+    Run one statement for every parameter tuple in a single driver batch and
+    return the affected row count (-1 when the driver cannot report it).
+``stream(query, params=None, batch_size=None)``
+    Yield row tuples in ``fetchmany`` batches without holding the full result.
+``fetch_frame(query, params=None)``
+    Return the result as a pandas DataFrame.
+
+Queries always use ``?`` placeholders with values passed separately, never
+formatted into the SQL text. Clients whose driver uses ``%s`` placeholders
+(psycopg2, Snowflake) set ``paramstyle = "format"`` and the placeholders are
+translated before the query is sent.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import pandas as pd
+
+
+@dataclass
+class QueryResult:
+    """Rows of one statement as plain tuples, with their column names.
+
+    Indexing and iteration go over ``rows``, so existing ``result[0][0]``
+    callers keep working. ``rowcount`` is the driver's affected row count
+    for statements that return no rows.
+    """
+
+    columns: List[str] = field(default_factory=list)
+    rows: List[tuple] = field(default_factory=list)
+    rowcount: int = -1
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[tuple]:
+        return iter(self.rows)
+
+    def __getitem__(self, index):
+        return self.rows[index]
+
+    def scalar(self, default: Any = None) -> Any:
+        """First column of the first row, or ``default`` for an empty result."""
+        if not self.rows or not self.rows[0]:
+            return default
+        return self.rows[0][0]
+
+    def records(self) -> List[Dict[str, Any]]:
+        return [dict(zip(self.columns, row)) for row in self.rows]
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame.from_records(self.rows, columns=self.columns)
+
+
+def first_value(result: Any, default: Any = None) -> Any:
+    """Scalar value of a query result in any of the clients' return shapes.
+
+    Accepts a ``QueryResult``, a list of tuples, ``sqlite3.Row``/``pyodbc.Row``
+    objects or row dicts, or an already scalar value (returned unchanged).
+    """
+    if isinstance(result, QueryResult):
+        return result.scalar(default)
+    if isinstance(result, list):
+        if not result:
+            return default
+        row = result[0]
+        if isinstance(row, dict):
+            return next(iter(row.values()), default)
+        if isinstance(row, (str, bytes)) or not hasattr(row, "__getitem__"):
+            return row
+        return row[0] if len(row) else default
+    return result
+
+
+def to_format_paramstyle(query: str) -> str:
+    """Translate ``?`` placeholders to ``%s``, escaping literal ``%`` as ``%%``.
+
+    Quoted strings and identifiers and ``--``/``/* */`` comments are copied
+    unchanged, so ``'?'``, ``"col?"`` and an apostrophe in a comment do not
+    affect placeholder translation.
+    """
+    out: List[str] = []
+    position, length = 0, len(query)
+    while position < length:
+        char = query[position]
+        if char in ("'", '"'):
+            end = query.find(char, position + 1)
+        elif query.startswith("--", position):
+            end = query.find("\n", position + 2)
+        elif query.startswith("/*", position):
+            end = query.find("*/", position + 2)
+            end = end + 1 if end != -1 else end
+        else:
+            out.append("%s" if char == "?" else "%%" if char == "%" else char)
+            position += 1
+            continue
+        # Copy the literal or comment through its closing delimiter (or to the end).
+        end = length if end == -1 else end + 1
+        out.append(query[position:end].replace("%", "%%"))
+        position = end
+    return "".join(out)
+
+
+class DBAPIBackend(ABC):
+    """Mixin adding ``execute``/``execute_many``/``stream``/``fetch_frame`` to a client.
+
+    Subclasses provide ``_backend_connection()``, a context manager yielding a
+    DB-API connection, and may override ``_run_backend`` to wrap each
+    operation (``FabricClient`` runs it under its retry and throttling loop)
+    and ``_executemany`` to use a faster driver batch API; it returns the
+    affected row count, or -1 when that API does not report one.
+    """
+
+    paramstyle = "qmark"
+    stream_batch_size = 5000
+    # pyodbc only: send an executemany batch as one parameter array instead of
+    # one round trip per row.
+    fast_executemany = False
+
+    @abstractmethod
+    def _backend_connection(self):
+        """Context manager yielding a DB-API connection for one operation."""
+
+    def _run_backend(self, operation, query: str, *args: Any) -> Any:
+        return operation(query, *args)
+
+    def _prepare_query(self, query: str, has_params: bool) -> str:
+        if has_params and self.paramstyle == "format":
+            return to_format_paramstyle(query)
+        return query
+
+    @staticmethod
+    def _run_statement(cursor, query: str, params: Optional[Sequence[Any]]) -> None:
+        if params is None:
+            cursor.execute(query)
+        else:
+            cursor.execute(query, tuple(params))
+
+    @staticmethod
+    def _columns(cursor) -> List[str]:
+        return [column[0] for column in cursor.description or ()]
+
+    def _executemany(self, cursor, query: str, seq_of_params: List[tuple]) -> int:
+        if self.fast_executemany:
+            cursor.fast_executemany = True
+        cursor.executemany(query, seq_of_params)
+        return cursor.rowcount
+
+    def execute(self, query: str, params: Optional[Sequence[Any]] = None) -> QueryResult:
+        """Run one statement; rows are fetched when it returns any, else it is committed."""
+        return self._run_backend(self._execute_once, query, params)
+
+    def _execute_once(self, query: str, params: Optional[Sequence[Any]]) -> QueryResult:
+        with self._backend_connection() as connection:
+            cursor = connection.cursor()
+            try:
+                self._run_statement(cursor, self._prepare_query(query, params is not None), params)
+                if cursor.description is not None:
+                    return QueryResult(
+                        self._columns(cursor),
+                        [tuple(row) for row in cursor.fetchall()],
+                        cursor.rowcount,
+                    )
+                connection.commit()
+                return QueryResult(rowcount=cursor.rowcount)
+            finally:
+                cursor.close()
+
+    def execute_many(self, query: str, seq_of_params: Sequence[Sequence[Any]]) -> int:
+        """Run ``query`` once per parameter tuple in one batch and commit.
+
+        Returns the affected row count, or -1 when the driver's batch API does
+        not report it (``DatabaseClient``'s psycopg2 ``execute_batch``).
+        """
+        batch = [tuple(params) for params in seq_of_params]
+        if not batch:
+            return 0
+        return self._run_backend(self._execute_many_once, query, batch)
+
+    def _execute_many_once(self, query: str, batch: List[tuple]) -> int:
+        with self._backend_connection() as connection:
+            cursor = connection.cursor()
+            try:
+                rowcount = self._executemany(cursor, self._prepare_query(query, True), batch)
+                connection.commit()
+                return rowcount
+            finally:
+                cursor.close()
+
+    def stream(
+        self,
+        query: str,
+        params: Optional[Sequence[Any]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[List[tuple]]:
+        """Yield lists of row tuples of at most ``batch_size`` rows.
+
+        The connection stays checked out until the generator is exhausted or
+        closed. Streams are not retried, since rows may already be consumed.
+        """
+        batch_size = batch_size or self.stream_batch_size
+        with self._backend_connection() as connection:
+            cursor = connection.cursor()
+            try:
+                self._run_statement(cursor, self._prepare_query(query, params is not None), params)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        return
+                    yield [tuple(row) for row in rows]
+            finally:
+                cursor.close()
+
+    def fetch_frame(self, query: str, params: Optional[Sequence[Any]] = None) -> pd.DataFrame:
+        """Return the query result as a DataFrame."""
+        return self.execute(query, params).to_frame()
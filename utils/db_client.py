@@ -1,12 +1,17 @@
 import psycopg2
+from psycopg2.extras import execute_batch
 import logging
 import os
 from contextlib import contextmanager
 from dotenv import load_dotenv
+from utils.connection_pool import get_pool, load_pool_settings
+from utils.db_backend import DBAPIBackend
 
 load_dotenv()
 
-class DatabaseClient:
+class DatabaseClient(DBAPIBackend):
+    paramstyle = "format"
+    
     def __init__(self):
         self.host = os.getenv('DB_HOST', 'localhost')
         self.port = os.getenv('DB_PORT', '5432')
@@ -14,27 +19,57 @@ class DatabaseClient:
         self.user = os.getenv('DB_USER', 'postgres')
         self.password = os.getenv('DB_PASSWORD', 'password')
         self.logger = logging.getLogger(__name__)
+        self.pool_settings = load_pool_settings()
+    
+    def _connect(self):
+        conn = psycopg2.connect(
+            host=self.host,
+            port=self.port,
+            database=self.database,
+            user=self.user,
+            password=self.password
+        )
+        self.logger.info("Database connection established")
+        return conn
+    
+    @property
+    def pool(self):
+        """Shared pool for this host/database/user; uncommitted work is rolled back on return"""
+        return get_pool(
+            ('postgresql', self.host, self.port, self.database, self.user),
+            self._connect,
+            reset=lambda conn: conn.rollback(),
+            is_usable=lambda conn: not conn.closed,
+            validate=self._ping,
+            **self.pool_settings
+        )
+    
+    @staticmethod
+    def _ping(conn):
+        """Catch connections the server closed while they sat idle in the pool"""
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        conn.rollback()
+        return True
     
     @contextmanager
     def get_connection(self):
-        conn = None
         try:
-            conn = psycopg2.connect(
-                host=self.host,
-                port=self.port,
-                database=self.database,
-                user=self.user,
-                password=self.password
-            )
-            self.logger.info("Database connection established")
-            yield conn
+            with self.pool.connection() as conn:
+                yield conn
         except Exception as e:
             self.logger.error(f"Database connection failed: {e}")
             raise
-        finally:
-            if conn:
-                conn.close()
-                self.logger.info("Database connection closed")
+    
+    def _backend_connection(self):
+        return self.get_connection()
+    
+    def _executemany(self, cursor, query, seq_of_params):
+        # psycopg2's executemany is a round trip per row; execute_batch sends pages of statements.
+        execute_batch(cursor, query, seq_of_params, page_size=1000)
+        # Each page runs as one multi-statement execute whose rowcount covers only its last
+        # statement, so there is no total to report.
+        return -1
     
     def execute_query(self, query: str, params: tuple = None):
         with self.get_connection() as conn:
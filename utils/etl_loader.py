@@ -1,69 +1,69 @@
 import requests
 import psycopg2
+import yaml
+from psycopg2.extras import execute_values
 from datetime import datetime
 import logging
 from utils.db_client import DatabaseClient
 from utils.api_client import APIClient
 
+PRODUCT_COLUMNS = "id, title, price, description, category, image, rating_rate, rating_count"
+
+# Later duplicates of an id in the feed win, as they did with per-row upserts.
+MERGE_PRODUCTS_QUERY = f"""
+INSERT INTO products ({PRODUCT_COLUMNS})
+SELECT DISTINCT ON (id) {PRODUCT_COLUMNS}
+FROM products_stage
+ORDER BY id, load_seq DESC
+ON CONFLICT (id) DO UPDATE SET
+    title = EXCLUDED.title,
+    price = EXCLUDED.price,
+    description = EXCLUDED.description,
+    category = EXCLUDED.category,
+    image = EXCLUDED.image,
+    rating_rate = EXCLUDED.rating_rate,
+    rating_count = EXCLUDED.rating_count,
+    updated_at = CURRENT_TIMESTAMP;
+"""
+
 class ETLLoader:
-    def __init__(self):
+    def __init__(self, config_file='config/config.yaml'):
         self.db_client = DatabaseClient()
         self.api_client = APIClient()
         self.logger = logging.getLogger(__name__)
+        with open(config_file, 'r') as f:
+            config = yaml.safe_load(f) or {}
+        self.batch_size = max(1, int((config.get('etl') or {}).get('batch_size', 1000)))
     
     def load_products_from_api(self):
-        """Load products from API to database"""
-        start_time = datetime.now()
-        
+        """Load products from API to database in set-based batches over one connection"""
         try:
             # Get products from API
             response = self.api_client.get("/products")
             products = response.json()
             
-            # Log ETL start
-            etl_log_id = self._log_etl_start("products_api", len(products))
-            
-            success_count = 0
+            rows = []
             failed_count = 0
-            
             for product in products:
                 try:
-                    # Insert/Update product
-                    query = """
-                    INSERT INTO products (id, title, price, description, category, image, rating_rate, rating_count)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (id) DO UPDATE SET
-                        title = EXCLUDED.title,
-                        price = EXCLUDED.price,
-                        description = EXCLUDED.description,
-                        category = EXCLUDED.category,
-                        image = EXCLUDED.image,
-                        rating_rate = EXCLUDED.rating_rate,
-                        rating_count = EXCLUDED.rating_count,
-                        updated_at = CURRENT_TIMESTAMP;
-                    """
-                    
-                    rating = product.get('rating', {})
-                    params = (
-                        product['id'],
-                        product['title'],
-                        product['price'],
-                        product.get('description'),
-                        product['category'],
-                        product.get('image'),
-                        rating.get('rate'),
-                        rating.get('count')
-                    )
-                    
-                    self.db_client.execute_query(query, params)
-                    success_count += 1
-                    
-                except Exception as e:
-                    self.logger.error(f"Failed to insert product {product.get('id')}: {e}")
+                    rows.append(self._product_row(product))
+                except (KeyError, TypeError, AttributeError) as e:
+                    self.logger.error(f"Failed to insert product {self._product_id(product)}: invalid record ({e})")
                     failed_count += 1
             
-            # Log ETL completion
-            self._log_etl_end(etl_log_id, success_count, failed_count)
+            with self.db_client.get_connection() as conn:
+                # Log ETL start
+                etl_log_id = self._log_etl_start(conn, "products_api", len(products))
+                self._create_product_stage(conn)
+                
+                success_count = 0
+                for start in range(0, len(rows), self.batch_size):
+                    loaded, failed = self._load_product_batch(conn, rows[start:start + self.batch_size])
+                    success_count += loaded
+                    failed_count += failed
+                
+                # Log ETL completion
+                self._log_etl_end(conn, etl_log_id, success_count, failed_count)
             
             return success_count, failed_count
             
@@ -71,24 +71,83 @@ class ETLLoader:
             self.logger.error(f"ETL process failed: {e}")
             raise
     
-    def _log_etl_start(self, source_name, total_records):
+    @staticmethod
+    def _product_id(product):
+        return product.get('id') if isinstance(product, dict) else None
+    
+    @staticmethod
+    def _product_row(product):
+        """Flatten one API product into the staging column order"""
+        rating = product.get('rating') or {}
+        return (
+            product['id'],
+            product['title'],
+            product['price'],
+            product.get('description'),
+            product['category'],
+            product.get('image'),
+            rating.get('rate'),
+            rating.get('count')
+        )
+    
+    def _create_product_stage(self, conn):
+        """Create the session staging table (committed so batch rollbacks keep it)"""
+        cursor = conn.cursor()
+        cursor.execute(f"""
+        CREATE TEMP TABLE IF NOT EXISTS products_stage AS
+        SELECT {PRODUCT_COLUMNS}, 0 AS load_seq FROM products WITH NO DATA;
+        """)
+        conn.commit()
+    
+    def _load_product_batch(self, conn, batch):
+        """Stage and merge one batch; a failing batch is split until bad rows are isolated"""
+        if not batch:
+            return 0, 0
+        try:
+            cursor = conn.cursor()
+            execute_values(
+                cursor,
+                f"INSERT INTO products_stage ({PRODUCT_COLUMNS}, load_seq) VALUES %s",
+                [row + (seq,) for seq, row in enumerate(batch)],
+                page_size=len(batch)
+            )
+            cursor.execute(MERGE_PRODUCTS_QUERY)
+            cursor.execute("TRUNCATE products_stage;")
+            conn.commit()
+            return len(batch), 0
+        except psycopg2.Error as e:
+            conn.rollback()
+            if len(batch) == 1:
+                self.logger.error(f"Failed to insert product {batch[0][0]}: {e}")
+                return 0, 1
+            middle = len(batch) // 2
+            first_loaded, first_failed = self._load_product_batch(conn, batch[:middle])
+            second_loaded, second_failed = self._load_product_batch(conn, batch[middle:])
+            return first_loaded + second_loaded, first_failed + second_failed
+    
+    def _log_etl_start(self, conn, source_name, total_records):
         """Log ETL process start"""
         query = """
         INSERT INTO etl_logs (source_name, records_processed, start_time, status)
         VALUES (%s, %s, %s, 'RUNNING')
         RETURNING id;
         """
-        result = self.db_client.execute_query(query, (source_name, total_records, datetime.now()))
-        return result[0][0] if result else None
+        cursor = conn.cursor()
+        cursor.execute(query, (source_name, total_records, datetime.now()))
+        result = cursor.fetchone()
+        conn.commit()
+        return result[0] if result else None
     
-    def _log_etl_end(self, etl_log_id, success_count, failed_count):
+    def _log_etl_end(self, conn, etl_log_id, success_count, failed_count):
         """Log ETL process completion"""
         query = """
         UPDATE etl_logs 
         SET records_success = %s, records_failed = %s, end_time = %s, status = 'COMPLETED'
         WHERE id = %s;
         """
-        self.db_client.execute_query(query, (success_count, failed_count, datetime.now(), etl_log_id))
+        cursor = conn.cursor()
+        cursor.execute(query, (success_count, failed_count, datetime.now(), etl_log_id))
+        conn.commit()
 
 if __name__ == "__main__":
     loader = ETLLoader()
@@ -1,13 +1,38 @@
 """Microsoft Fabric Lakehouse Client for ETL Testing"""
 
 import pyodbc
-import struct
 import configparser
-from typing import Optional
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 from azure.identity import ClientSecretCredential, InteractiveBrowserCredential
 
+from utils.db_backend import DBAPIBackend
+from utils.fabric_connection_pool import (
+    SQL_COPT_SS_ACCESS_TOKEN,
+    get_pool,
+    pack_access_token,
+    token_cache,
+)
+from utils.fabric_throttle import (
+    FAILED,
+    SUCCEEDED,
+    THROTTLED,
+    backoff_delay,
+    get_limiter,
+    is_throttle_error,
+    is_timeout_error,
+)
+from utils.query_cache import load_query_cache
+
+
+class FabricClient(DBAPIBackend):
+    fast_executemany = True
 
-class FabricClient:
     def __init__(self, layer="BRONZE"):
         self.config = configparser.ConfigParser()
         self.config.read("config/master.properties")
@@ -19,69 +44,117 @@ class FabricClient:
             fallback="reuse",
         ).strip().lower()
         self.retry_attempts = 1
+        self.fetch_arraysize = self.config.getint(
+            "FABRIC", "FABRIC_FETCH_ARRAYSIZE", fallback=5000
+        )
+        self.query_cache = load_query_cache()
+        self.adaptive_limit_enabled = self.config.getboolean(
+            "FABRIC", "FABRIC_ADAPTIVE_LIMIT_ENABLED", fallback=True
+        )
+        self.throttle_max_retries = self.config.getint(
+            "FABRIC", "FABRIC_THROTTLE_MAX_RETRIES", fallback=4
+        )
+        self.timeout_max_retries = self.config.getint(
+            "FABRIC", "FABRIC_TIMEOUT_MAX_RETRIES", fallback=1
+        )
+        self.backoff_base_seconds = self.config.getfloat(
+            "FABRIC", "FABRIC_BACKOFF_BASE_SECONDS", fallback=1
+        )
+        self.backoff_max_seconds = self.config.getfloat(
+            "FABRIC", "FABRIC_BACKOFF_MAX_SECONDS", fallback=30
+        )
 
-    def connect(self):
-        """Connect to Microsoft Fabric Lakehouse SQL Endpoint"""
+    @property
+    def supports_concurrent_queries(self) -> bool:
+        """True when one client may run several queries at once (pooled sessions)."""
+        return self.connection_strategy == "pool"
 
-        # ---- Safety check: enforce correct ODBC driver ----
-        required_driver = "ODBC Driver 18 for SQL Server"
-        if required_driver not in pyodbc.drivers():
-            raise RuntimeError(
-                "ODBC Driver 18 for SQL Server is required for Microsoft Fabric"
-            )
-
-        # ---- Read SQL endpoint ----
+    @property
+    def sql_endpoint(self) -> str:
         layer_name = self.layer.split("_")[1]
-        sql_endpoint = self.config.get(self.layer, f"{layer_name}_SQL_ENDPOINT")
+        return self.config.get(self.layer, f"{layer_name}_SQL_ENDPOINT")
 
-        # ---- Authentication ----
+    def _credential_key(self):
         auth_method = self.config.get(
             "FABRIC", "FABRIC_AUTH_METHOD", fallback="Interactive"
         )
+        tenant_id = self.config.get("FABRIC", "FABRIC_TENANT_ID")
+        client_id = self.config.get("FABRIC", "FABRIC_CLIENT_ID", fallback="")
+        return auth_method, tenant_id, client_id
+
+    def _build_credential(self):
+        """Create the Azure credential configured in the [FABRIC] section."""
+        auth_method, tenant_id, client_id = self._credential_key()
 
         if auth_method == "ServicePrincipal":
-            tenant_id = self.config.get("FABRIC", "FABRIC_TENANT_ID")
-            client_id = self.config.get("FABRIC", "FABRIC_CLIENT_ID")
             client_secret = self.config.get("FABRIC", "FABRIC_CLIENT_SECRET")
 
-            credential = ClientSecretCredential(
+            return ClientSecretCredential(
                 tenant_id=tenant_id,
                 client_id=client_id,
                 client_secret=client_secret,
             )
-        else:
-            # Interactive browser authentication (MFA supported)
-            tenant_id = self.config.get("FABRIC", "FABRIC_TENANT_ID")
-            credential = InteractiveBrowserCredential(tenant_id=tenant_id)
-
-        # ---- Acquire access token ----
-        token = credential.get_token(
-            "https://database.windows.net/.default"
-        ).token
-
-        # ---- Convert token for pyodbc ----
-        token_bytes = token.encode("utf-16-le")
-        token_struct = struct.pack(
-            f"<I{len(token_bytes)}s", len(token_bytes), token_bytes
-        )
+
+        # Interactive browser authentication (MFA supported)
+        return InteractiveBrowserCredential(tenant_id=tenant_id)
+
+    def _open_connection(self):
+        """Open a new pyodbc connection using the process-wide token cache."""
+
+        # ---- Safety check: enforce correct ODBC driver ----
+        required_driver = "ODBC Driver 18 for SQL Server"
+        if required_driver not in pyodbc.drivers():
+            raise RuntimeError(
+                "ODBC Driver 18 for SQL Server is required for Microsoft Fabric"
+            )
+
+        # ---- Acquire access token (cached until shortly before expiry) ----
+        token = token_cache.get_token(self._credential_key(), self._build_credential)
 
         # ---- ODBC Driver 18 connection string ----
         conn_str = (
             "Driver={ODBC Driver 18 for SQL Server};"
-            f"Server={sql_endpoint};"
+            f"Server={self.sql_endpoint};"
             "Encrypt=yes;"
             "TrustServerCertificate=no;"
             "Connection Timeout=30;"
         )
 
-        # ---- Connect ----
-        self.connection = pyodbc.connect(
+        return pyodbc.connect(
             conn_str,
-            attrs_before={1256: token_struct},
+            attrs_before={SQL_COPT_SS_ACCESS_TOKEN: pack_access_token(token)},
         )
 
+    def connect(self):
+        """Connect to Microsoft Fabric Lakehouse SQL Endpoint"""
+        self.connection = self._open_connection()
         return self.connection
 
+    def _get_pool(self):
+        """Return the shared pool for this layer's SQL endpoint."""
+        return get_pool(
+            self.sql_endpoint,
+            self._open_connection,
+            size=self.config.getint("FABRIC", "FABRIC_POOL_SIZE", fallback=4),
+            max_lifetime_seconds=self.config.getfloat(
+                "FABRIC", "FABRIC_POOL_MAX_LIFETIME_SECONDS", fallback=2700
+            ),
+            validate_after_idle_seconds=self.config.getfloat(
+                "FABRIC", "FABRIC_POOL_VALIDATE_AFTER_IDLE_SECONDS", fallback=60
+            ),
+        )
+
+    def _get_limiter(self):
+        """Return the shared adaptive concurrency limiter for this layer's SQL endpoint."""
+        if not self.adaptive_limit_enabled:
+            return None
+        return get_limiter(
+            self.sql_endpoint,
+            initial_limit=self.config.getint("FABRIC", "FABRIC_LIMIT_INITIAL", fallback=4),
+            min_limit=self.config.getint("FABRIC", "FABRIC_LIMIT_MIN", fallback=1),
+            max_limit=self.config.getint("FABRIC", "FABRIC_LIMIT_MAX", fallback=16),
+        )
+
     def _ensure_connection(self):
         """Ensure an active connection exists."""
         if self.connection is None:
@@ -119,50 +192,315 @@ class FabricClient:
         )
         return any(marker in message for marker in transient_markers)
 
-    def _run_query_once(self, query: str):
+    @staticmethod
+    def _is_auth_error(exc: pyodbc.Error) -> bool:
+        """Login rejected by the endpoint, e.g. for an expired or revoked access token."""
+        message = " ".join(str(arg) for arg in getattr(exc, "args", ()) if arg).lower()
+        return "18456" in message or "login failed" in message
+
+    @contextmanager
+    def _borrowed_connection(self):
+        """Yield a connection for one query, checked out from the pool when pooled."""
+        if self.connection_strategy != "pool":
+            yield self._ensure_connection()
+            return
+
+        pool = self._get_pool()
+        pooled = pool.checkout()
+        discard = False
+        try:
+            yield pooled.connection
+        except pyodbc.Error as exc:
+            discard = self._is_transient_pyodbc_error(exc)
+            raise
+        except Exception:
+            discard = True
+            raise
+        finally:
+            pool.release(pooled, discard=discard)
+
+    def _backend_connection(self):
+        return self._borrowed_connection()
+
+    def _run_backend(self, operation, query: str, *args: Any) -> Any:
+        """Run ``execute``/``execute_many`` under the endpoint limit and retry loop."""
+        return self._execute_with_retry(operation, query, *args)
+
+    def fetch_frame(self, query: str, params=None) -> pd.DataFrame:
+        """Unparameterized queries use the columnar (and cached) ``execute_query`` path."""
+        if params is None:
+            return self.execute_query(query, result_format="dataframe")
+        return super().fetch_frame(query, params)
+
+    def describe_columns(self, query: str) -> Dict[str, Any]:
+        """Return ``{column: type_code}`` for ``query``'s result without fetching rows."""
+        probe = f"SELECT TOP 0 * FROM ({query.strip().rstrip(';')}) AS describe_src"
+        return self._execute_with_retry(self._describe_once, probe)
+
+    def _describe_once(self, query: str) -> Dict[str, Any]:
+        with self._borrowed_connection() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query)
+                return {column[0]: column[1] for column in cursor.description or ()}
+            finally:
+                cursor.close()
+
+    def _run_query_once(self, query: str, result_format: str = "records"):
         """Execute one query attempt and always close the cursor."""
-        connection = self._ensure_connection()
+        with self._borrowed_connection() as connection:
+            if result_format != "records":
+                columns, values = self._fetch_columnar(connection, query, self.fetch_arraysize)
+                return self._build_columnar_result(columns, values, result_format)
+
+            rows: List[Dict[str, Any]] = []
+            for batch in self._fetch_batches(connection, query, self.fetch_arraysize, "dict"):
+                rows.extend(batch)
+            return rows
+
+    def _run_columnar_once(self, query: str) -> Tuple[List[str], List[List[Any]]]:
+        """Execute one query attempt and return its ``(columns, values)`` payload."""
+        with self._borrowed_connection() as connection:
+            return self._fetch_columnar(connection, query, self.fetch_arraysize)
+
+    @staticmethod
+    def _fetch_columnar(connection, query: str, batch_size: int) -> Tuple[List[str], List[List[Any]]]:
+        """Fetch a result column-wise: one value list per column, no per-row dicts."""
         cursor: Optional[pyodbc.Cursor] = None
         try:
             cursor = connection.cursor()
+            cursor.arraysize = batch_size
             cursor.execute(query)
             if cursor.description is None:
-                return []
+                return [], []
 
             columns = [col[0] for col in cursor.description]
-            rows = cursor.fetchall()
-            return [dict(zip(columns, row)) for row in rows]
+            values: List[List[Any]] = [[] for _ in columns]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return columns, values
+                for column_values, batch_values in zip(values, zip(*rows)):
+                    column_values.extend(batch_values)
+        finally:
+            if cursor is not None:
+                cursor.close()
+
+    @staticmethod
+    def _build_columnar_result(columns: List[str], values: List[List[Any]], result_format: str) -> Any:
+        """Turn column value lists into row dicts, a DataFrame or a dict of NumPy arrays."""
+        if result_format == "records":
+            return [dict(zip(columns, row)) for row in zip(*values)]
+        if result_format == "dataframe":
+            frame = pd.DataFrame({position: column for position, column in enumerate(values)})
+            # Assign names afterwards so duplicate/unnamed columns (e.g. COUNT(*)) survive.
+            frame.columns = columns
+            return frame
+        if result_format == "numpy":
+            return {column: np.asarray(column_values) for column, column_values in zip(columns, values)}
+        raise ValueError(
+            f"Unsupported result_format '{result_format}'. Use 'records', 'dataframe' or 'numpy'."
+        )
+
+    @staticmethod
+    def _fetch_batches(connection, query: str, batch_size: int, row_format: str) -> Iterator[Any]:
+        """Execute a query and yield ``fetchmany`` batches; always closes the cursor."""
+        cursor: Optional[pyodbc.Cursor] = None
+        try:
+            cursor = connection.cursor()
+            cursor.arraysize = batch_size
+            cursor.execute(query)
+            if cursor.description is None:
+                return
+
+            columns = [col[0] for col in cursor.description]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield FabricClient._shape_batch(columns, rows, row_format)
         finally:
             if cursor is not None:
                 cursor.close()
 
-    def execute_query(self, query):
-        """Execute SQL query and return results."""
+    @staticmethod
+    def _shape_batch(columns: List[str], rows: List[Any], row_format: str) -> Any:
+        """Convert one fetched batch into dict rows, tuples or column lists."""
+        if row_format == "dict":
+            return [dict(zip(columns, row)) for row in rows]
+        if row_format == "tuple":
+            return [tuple(row) for row in rows]
+        if row_format == "columns":
+            return {column: list(values) for column, values in zip(columns, zip(*rows))}
+        raise ValueError(
+            f"Unsupported row_format '{row_format}'. Use 'dict', 'tuple' or 'columns'."
+        )
+
+    def iter_batches(
+        self,
+        query: str,
+        batch_size: Optional[int] = None,
+        row_format: str = "dict",
+    ) -> Iterator[Any]:
+        """Stream query results in ``fetchmany`` batches instead of one materialized list.
+
+        row_format:
+            "dict" yields lists of row dicts, "tuple" yields lists of tuples and
+            "columns" yields ``{column: [values]}`` per batch.
+
+        A transient error before the first batch is retried once on a fresh
+        connection. Errors after rows have been yielded are raised as-is because
+        the consumer has already seen part of the result. The stream holds an
+        endpoint limiter slot until it is exhausted or closed.
+        """
+        batch_size = int(batch_size or self.fetch_arraysize)
         if self.connection_strategy == "reconnect_per_query":
             self._reconnect()
 
-        try:
-            return self._run_query_once(query)
-        except pyodbc.Error as exc:
-            if self._is_transient_pyodbc_error(exc):
-                self._reconnect()
-                try:
-                    print(
-                        f"[FabricClient:{self.layer}] transient query error detected; "
-                        "reconnecting and retrying once."
-                    )
-                    return self._run_query_once(query)
-                except pyodbc.Error as retry_exc:
+        limiter = self._get_limiter()
+        yielded = False
+        for attempt in range(self.retry_attempts + 1):
+            token = limiter.acquire() if limiter is not None else None
+            outcome = FAILED
+            try:
+                with self._borrowed_connection() as connection:
+                    for batch in self._fetch_batches(connection, query, batch_size, row_format):
+                        yielded = True
+                        yield batch
+                outcome = SUCCEEDED
+                return
+            except GeneratorExit:
+                # The consumer stopped early; the endpoint itself did fine.
+                outcome = SUCCEEDED
+                raise
+            except pyodbc.Error as exc:
+                if is_throttle_error(exc) or is_timeout_error(exc):
+                    outcome = THROTTLED
+                if yielded or attempt >= self.retry_attempts or not self._is_transient_pyodbc_error(exc):
                     raise RuntimeError(
-                        f"{self.layer} query failed after reconnect retry: "
-                        f"{retry_exc.__class__.__name__}: {retry_exc}"
-                    ) from retry_exc
+                        f"{self.layer} streaming query failed: {exc.__class__.__name__}: {exc}"
+                    ) from exc
+                if self.connection_strategy != "pool":
+                    self._reconnect()
+            finally:
+                if limiter is not None:
+                    limiter.release(token, outcome)
+
+    def execute_query(self, query, result_format="records"):
+        """Execute SQL query and return results.
+
+        result_format:
+            "records" (default) returns a list of row dicts, "dataframe" a pandas
+            DataFrame and "numpy" a ``{column: ndarray}`` dict. The columnar
+            formats are built directly from fetched batches without row dicts.
+
+        When [QUERY_CACHE] is enabled, results are looked up by endpoint, query
+        text and freshness token before going to Fabric, and stored afterwards.
+        """
+        if self.query_cache is None:
+            return self._execute_with_retry(self._run_query_once, query, result_format)
+
+        cached = self.query_cache.get(self.sql_endpoint, query)
+        if cached is None:
+            cached = self._execute_with_retry(self._run_columnar_once, query)
+            self.query_cache.put(self.sql_endpoint, query, *cached)
+        else:
+            print(f"[FabricClient:{self.layer}] query result served from local cache.")
+        return self._build_columnar_result(*cached, result_format)
+
+    def _back_off(self, attempt: int, max_retries: int, reason: str) -> None:
+        """Sleep before retry ``attempt`` (1-based) and reopen a non-pooled connection."""
+        delay = backoff_delay(attempt - 1, self.backoff_base_seconds, self.backoff_max_seconds)
+        print(f"[FabricClient:{self.layer}] {reason}; retry {attempt}/{max_retries} in {delay:.1f}s.")
+        time.sleep(delay)
+        if self.connection_strategy != "pool":
+            self._reconnect()
+
+    def _execute_with_retry(self, run_query, query, *args):
+        """Run one query under the endpoint's concurrency limit, retrying on failure.
+
+        Throttling errors are retried up to ``throttle_max_retries`` times and
+        timeouts up to ``timeout_max_retries`` times, each after a jittered
+        exponential backoff. Other transient ODBC errors reconnect and retry
+        once; a rejected login first drops the cached access token so the new
+        connection gets a fresh one.
+        """
+        if self.connection_strategy == "reconnect_per_query":
+            self._reconnect()
+
+        limiter = self._get_limiter()
+        throttle_retries = 0
+        timeout_retries = 0
+        reconnect_retried = False
+        while True:
+            token = limiter.acquire() if limiter is not None else None
+            try:
+                result = run_query(query, *args)
+            except pyodbc.Error as exc:
+                throttled = is_throttle_error(exc)
+                timed_out = not throttled and is_timeout_error(exc)
+                if limiter is not None:
+                    limiter.release(token, THROTTLED if throttled or timed_out else FAILED)
+                error = exc
+            except BaseException:
+                # Non-ODBC errors (auth, bad result_format, pool timeout, Ctrl+C) must
+                # still return the slot, or the shared endpoint limiter drains.
+                if limiter is not None:
+                    limiter.release(token, FAILED)
+                raise
+            else:
+                if limiter is not None:
+                    limiter.release(token, SUCCEEDED)
+                return result
+
+            if throttled and throttle_retries < self.throttle_max_retries:
+                throttle_retries += 1
+                self._back_off(throttle_retries, self.throttle_max_retries, "endpoint throttled")
+                continue
+            if timed_out and timeout_retries < self.timeout_max_retries:
+                timeout_retries += 1
+                self._back_off(timeout_retries, self.timeout_max_retries, "query timed out")
+                continue
+            overloaded = throttled or timed_out
+            auth_failed = not overloaded and self._is_auth_error(error)
+            if auth_failed:
+                token_cache.invalidate(self._credential_key())
+            if not overloaded and not reconnect_retried and (auth_failed or self._is_transient_pyodbc_error(error)):
+                reconnect_retried = True
+                if self.connection_strategy != "pool":
+                    self._reconnect()
+                reason = "login failed; refreshed the access token" if auth_failed else "transient query error detected"
+                print(f"[FabricClient:{self.layer}] {reason}; reconnecting and retrying once.")
+                continue
+            retries = throttle_retries + timeout_retries + int(reconnect_retried)
+            if retries:
+                raise RuntimeError(
+                    f"{self.layer} query failed after {retries} retries: "
+                    f"{error.__class__.__name__}: {error}"
+                ) from error
             raise RuntimeError(
-                f"{self.layer} query failed: {exc.__class__.__name__}: {exc}"
-            ) from exc
+                f"{self.layer} query failed: {error.__class__.__name__}: {error}"
+            ) from error
 
     def close(self):
-        """Close database connection"""
+        """Close database connection (pooled connections are shared and closed at exit)."""
         if self.connection:
             self.connection.close()
             self.connection = None
+
+
+def create_fabric_client(layer="BRONZE"):
+    """Return the client for ``layer`` from the configured backend.
+
+    ``[FABRIC] FABRIC_BACKEND`` (or the ``FABRIC_BACKEND`` environment
+    variable) selects ``odbc``, the default ``FabricClient``, or ``local``, the
+    DuckDB stand-in in ``utils.local_fabric`` for offline runs.
+    """
+    config = configparser.ConfigParser()
+    config.read("config/master.properties")
+    backend = os.getenv("FABRIC_BACKEND") or config.get("FABRIC", "FABRIC_BACKEND", fallback="odbc")
+    if backend.strip().lower() == "local":
+        from utils.local_fabric import LocalFabricClient
+
+        return LocalFabricClient(layer)
+    return FabricClient(layer)
@@ -0,0 +1,277 @@
+"""Process-wide pyodbc connection pools and AAD token cache for Fabric SQL endpoints."""
+
+import atexit
+import struct
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import pyodbc
+
+TOKEN_SCOPE = "https://database.windows.net/.default"
+SQL_COPT_SS_ACCESS_TOKEN = 1256
+
+
+def pack_access_token(token: str) -> bytes:
+    """Encode an AAD access token the way ODBC Driver 18 expects it."""
+    token_bytes = token.encode("utf-16-le")
+    return struct.pack(f"<I{len(token_bytes)}s", len(token_bytes), token_bytes)
+
+
+class FabricTokenCache:
+    """Reuse credentials and access tokens until shortly before they expire."""
+
+    def __init__(self, refresh_margin_seconds: int = 300):
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self._lock = threading.Lock()
+        self._credentials: Dict[Hashable, Any] = {}
+        self._tokens: Dict[Hashable, Any] = {}
+
+    def get_token(self, key: Hashable, credential_factory: Callable[[], Any]) -> str:
+        """Return a cached token for ``key`` or fetch a new one from its credential.
+
+        The lock is held while fetching so concurrent callers trigger a single
+        interactive login instead of one browser prompt per thread.
+        """
+        with self._lock:
+            cached = self._tokens.get(key)
+            if cached is not None and cached.expires_on - self.refresh_margin_seconds > time.time():
+                return cached.token
+
+            credential = self._credentials.get(key)
+            if credential is None:
+                credential = credential_factory()
+                self._credentials[key] = credential
+
+            fresh = credential.get_token(TOKEN_SCOPE)
+            self._tokens[key] = fresh
+            return fresh.token
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._tokens.pop(key, None)
+
+
+token_cache = FabricTokenCache()
+
+
+class PooledConnection:
+    """A pyodbc connection plus the bookkeeping used for staleness checks."""
+
+    __slots__ = ("connection", "created_at", "last_used_at")
+
+    def __init__(self, connection: Any):
+        self.connection = connection
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+
+
+class FabricConnectionPool:
+    """Bounded pool of live connections to one SQL endpoint.
+
+    Idle connections are health-checked before checkout when they have been idle
+    longer than ``validate_after_idle_seconds`` or are older than
+    ``max_lifetime_seconds``. Dead connections are closed and a replacement is
+    opened on a background thread so the pool stays warm.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        connect: Callable[[], Any],
+        size: int = 4,
+        max_lifetime_seconds: float = 2700,
+        validate_after_idle_seconds: float = 60,
+        checkout_timeout_seconds: float = 300,
+        health_check_query: str = "SELECT 1",
+    ):
+        self.endpoint = endpoint
+        self.size = max(1, int(size))
+        self.max_lifetime_seconds = max_lifetime_seconds
+        self.validate_after_idle_seconds = validate_after_idle_seconds
+        self.checkout_timeout_seconds = checkout_timeout_seconds
+        self.health_check_query = health_check_query
+        self._connect = connect
+        self._cond = threading.Condition()
+        self._idle: deque = deque()
+        self._open = 0
+        self._closed = False
+        self.stats = {
+            "created": 0,
+            "reused": 0,
+            "discarded": 0,
+            "replaced_in_background": 0,
+            "checkout_waits": 0,
+        }
+
+    def checkout(self) -> PooledConnection:
+        """Borrow a healthy connection, opening or waiting for one as needed."""
+        deadline = time.monotonic() + self.checkout_timeout_seconds
+        while True:
+            candidate: Optional[PooledConnection] = None
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError(f"Connection pool for {self.endpoint} is closed.")
+                    if self._idle:
+                        candidate = self._idle.pop()
+                        break
+                    if self._open < self.size:
+                        self._open += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise RuntimeError(
+                            f"Timed out after {self.checkout_timeout_seconds}s waiting for a "
+                            f"connection to {self.endpoint} (pool size {self.size})."
+                        )
+                    self.stats["checkout_waits"] += 1
+                    self._cond.wait(remaining)
+
+            if candidate is None:
+                return self._open_new()
+
+            if self._is_healthy(candidate):
+                with self._cond:
+                    self.stats["reused"] += 1
+                return candidate
+            self._discard(candidate)
+
+    def release(self, pooled: PooledConnection, discard: bool = False) -> None:
+        """Return a connection to the pool, or drop it when the caller saw it fail."""
+        if discard:
+            self._discard(pooled)
+            return
+        pooled.last_used_at = time.monotonic()
+        with self._cond:
+            if not self._closed:
+                self._idle.append(pooled)
+                self._cond.notify()
+                return
+            self._open -= 1
+        self._close_quietly(pooled.connection)
+
+    def close(self) -> None:
+        """Close every idle connection; borrowed ones are closed when released."""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for pooled in idle:
+            self._close_quietly(pooled.connection)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "size": self.size,
+                "open": self._open,
+                "idle": len(self._idle),
+                **self.stats,
+            }
+
+    def _open_new(self) -> PooledConnection:
+        try:
+            pooled = PooledConnection(self._connect())
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.stats["created"] += 1
+        return pooled
+
+    def _is_healthy(self, pooled: PooledConnection) -> bool:
+        now = time.monotonic()
+        if now - pooled.created_at > self.max_lifetime_seconds:
+            return False
+        if now - pooled.last_used_at <= self.validate_after_idle_seconds:
+            return True
+        cursor = None
+        try:
+            cursor = pooled.connection.cursor()
+            cursor.execute(self.health_check_query)
+            cursor.fetchone()
+            return True
+        except pyodbc.Error:
+            return False
+        finally:
+            if cursor is not None:
+                self._close_quietly(cursor)
+
+    def _discard(self, pooled: PooledConnection) -> None:
+        self._close_quietly(pooled.connection)
+        with self._cond:
+            self._open -= 1
+            self.stats["discarded"] += 1
+            self._cond.notify()
+        self._spawn_replacement()
+
+    def _spawn_replacement(self) -> None:
+        with self._cond:
+            if self._closed or self._open >= self.size:
+                return
+            self._open += 1
+        threading.Thread(
+            target=self._replace_in_background,
+            name=f"fabric-pool-replace-{self.endpoint[:24]}",
+            daemon=True,
+        ).start()
+
+    def _replace_in_background(self) -> None:
+        try:
+            pooled = PooledConnection(self._connect())
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            return
+        with self._cond:
+            if self._closed:
+                self._open -= 1
+            else:
+                self.stats["created"] += 1
+                self.stats["replaced_in_background"] += 1
+                self._idle.append(pooled)
+                self._cond.notify()
+                return
+        self._close_quietly(pooled.connection)
+
+    @staticmethod
+    def _close_quietly(resource: Any) -> None:
+        try:
+            resource.close()
+        except Exception:
+            pass
+
+
+_pools: Dict[str, FabricConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(endpoint: str, connect: Callable[[], Any], **pool_options: Any) -> FabricConnectionPool:
+    """Return the process-wide pool for ``endpoint``, creating it on first use."""
+    with _pools_lock:
+        pool = _pools.get(endpoint)
+        if pool is None:
+            pool = FabricConnectionPool(endpoint, connect, **pool_options)
+            _pools[endpoint] = pool
+        return pool
+
+
+def pool_snapshots() -> Dict[str, Dict[str, int]]:
+    with _pools_lock:
+        pools = dict(_pools)
+    return {endpoint: pool.snapshot() for endpoint, pool in pools.items()}
+
+
+@atexit.register
+def close_all_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
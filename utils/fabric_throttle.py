@@ -0,0 +1,160 @@
+"""Adaptive per-endpoint concurrency limits and throttling backoff for Fabric SQL endpoints.
+
+Each SQL endpoint gets an AIMD limiter shared by every client in the process.
+The limit grows by one after a full window of successful queries and halves
+when the endpoint throttles or times out. Throttled queries are retried after
+an exponentially growing, fully jittered delay; timeouts are retried with the
+same backoff but under their own, smaller retry budget, since a query that
+timed out once often times out again.
+"""
+
+import random
+import threading
+from typing import Dict, Optional
+
+SUCCEEDED = "succeeded"
+THROTTLED = "throttled"
+FAILED = "failed"
+
+THROTTLE_MARKERS = (
+    "throttl",
+    "too many requests",
+    "server is busy",
+    "service is busy",
+    "40501",
+    "10928",
+    "10929",
+    "resource limit",
+    "request limit",
+    "capacitylimitexceeded",
+    "capacity limit",
+    "capacity has exceeded",
+)
+TIMEOUT_MARKERS = (
+    "timeout expired",
+    "query timeout",
+    "hyt00",
+    "hyt01",
+)
+
+
+def _error_message(exc: BaseException) -> str:
+    return " ".join(str(arg) for arg in getattr(exc, "args", ()) if arg).lower()
+
+
+def is_throttle_error(exc: BaseException) -> bool:
+    """True for errors that mean the endpoint is rejecting work: throttling and capacity limits."""
+    message = _error_message(exc)
+    return any(marker in message for marker in THROTTLE_MARKERS)
+
+
+def is_timeout_error(exc: BaseException) -> bool:
+    """True for query and login timeouts (HYT00/HYT01)."""
+    message = _error_message(exc)
+    return any(marker in message for marker in TIMEOUT_MARKERS)
+
+
+def backoff_delay(attempt: int, base_seconds: float, max_seconds: float) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(max, base * 2**attempt)]."""
+    return random.uniform(0, min(max_seconds, base_seconds * (2 ** attempt)))
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on concurrent queries against one SQL endpoint.
+
+    Queries take a slot before running and report their outcome on release.
+    Successes only raise the limit while at least half of it is in use. A
+    throttled query only lowers the limit if no other query already did so
+    after it started, so a burst of throttled queries halves the limit once
+    instead of collapsing it to the minimum.
+    """
+
+    def __init__(self, endpoint: str, initial_limit: int = 4, min_limit: int = 1, max_limit: int = 16):
+        self.endpoint = endpoint
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self.limit = min(self.max_limit, max(self.min_limit, int(initial_limit)))
+        self._cond = threading.Condition()
+        self._active = 0
+        self._queued = 0
+        self._generation = 0
+        self._successes_since_change = 0
+        self.stats = {
+            "succeeded": 0,
+            "throttled": 0,
+            "failed": 0,
+            "decreases": 0,
+            "increases": 0,
+            "peak_active": 0,
+            "peak_queued": 0,
+        }
+
+    def acquire(self) -> int:
+        """Block until a slot is free; returns a token to pass to ``release``."""
+        with self._cond:
+            self._queued += 1
+            self.stats["peak_queued"] = max(self.stats["peak_queued"], self._queued)
+            try:
+                while self._active >= self.limit:
+                    self._cond.wait()
+            finally:
+                self._queued -= 1
+            self._active += 1
+            self.stats["peak_active"] = max(self.stats["peak_active"], self._active)
+            return self._generation
+
+    def release(self, token: int, outcome: str) -> None:
+        """Free a slot and adapt the limit to the query's outcome."""
+        with self._cond:
+            saturated = self._active * 2 >= self.limit
+            self._active -= 1
+            self.stats[outcome] += 1
+            if outcome == SUCCEEDED and saturated:
+                self._successes_since_change += 1
+                if self._successes_since_change >= self.limit and self.limit < self.max_limit:
+                    self.limit += 1
+                    self._successes_since_change = 0
+                    self.stats["increases"] += 1
+            elif outcome == THROTTLED and token == self._generation:
+                self.limit = max(self.min_limit, self.limit // 2)
+                self._generation += 1
+                self._successes_since_change = 0
+                self.stats["decreases"] += 1
+            self._cond.notify_all()
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._cond:
+            return {"limit": self.limit, "active": self._active, "queued": self._queued, **self.stats}
+
+
+_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(endpoint: str, **limiter_options: int) -> AdaptiveConcurrencyLimiter:
+    """Return the process-wide limiter for ``endpoint``, creating it on first use."""
+    with _limiters_lock:
+        limiter = _limiters.get(endpoint)
+        if limiter is None:
+            limiter = AdaptiveConcurrencyLimiter(endpoint, **limiter_options)
+            _limiters[endpoint] = limiter
+        return limiter
+
+
+def limiter_snapshots() -> Dict[str, Dict[str, int]]:
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {endpoint: limiter.snapshot() for endpoint, limiter in limiters.items()}
+
+
+def format_limiter_report(snapshots: Optional[Dict[str, Dict[str, int]]] = None) -> str:
+    """One line per endpoint with its current limit, load and throttling counts."""
+    snapshots = limiter_snapshots() if snapshots is None else snapshots
+    lines = []
+    for endpoint, snap in sorted(snapshots.items()):
+        lines.append(
+            f"  {endpoint}: limit={snap['limit']} active={snap['active']} queued={snap['queued']} "
+            f"peak_active={snap['peak_active']} peak_queued={snap['peak_queued']} "
+            f"throttled={snap['throttled']} (limit lowered {snap['decreases']}x, raised {snap['increases']}x)"
+        )
+    return "\n".join(lines)
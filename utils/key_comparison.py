@@ -0,0 +1,251 @@
+"""Set-style key comparison on sorted NumPy arrays.
+
+Keys are held as one sorted, de-duplicated array: a plain numeric or string
+array for a single key column, and one packed int64 per key for composite
+keys. Missing/extra keys come from ``np.setdiff1d``
+instead of Python sets of tuples, which keeps tens of millions of keys at a
+fraction of the memory.
+
+Keys match as they would in a Python set: ``Decimal('2.0')`` equals ``2``,
+but ``'1'`` does not equal ``1``.
+"""
+
+from decimal import Decimal
+from numbers import Number
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _key_columns_values(data: Any, key_columns: Sequence[str]) -> List[np.ndarray]:
+    """Per-column value arrays for rows that have a non-NULL value in every key column."""
+    if isinstance(data, pd.DataFrame):
+        if any(col not in data.columns for col in key_columns):
+            return [np.array([]) for _ in key_columns]
+        keys = data.loc[:, list(key_columns)].dropna()
+        return [keys[col].to_numpy() for col in key_columns]
+
+    columns: List[List[Any]] = [[] for _ in key_columns]
+    for row in data or []:
+        if not hasattr(row, 'get'):
+            continue
+        values = [row.get(col) for col in key_columns]
+        if any(value is None for value in values):
+            continue
+        for column, value in zip(columns, values):
+            column.append(value)
+    return [_record_values(column) for column in columns]
+
+
+def _record_values(column: List[Any]) -> np.ndarray:
+    values = np.asarray(column)
+    # NumPy turns a mix of text and numbers into text; keep the original objects.
+    if values.dtype.kind == 'U' and not all(isinstance(value, str) for value in column):
+        return np.array(column, dtype=object)
+    return values
+
+
+def _exact_numeric(values: np.ndarray) -> Optional[np.ndarray]:
+    """``values`` as a numeric array, or None when any value is not exactly a number.
+
+    Object arrays (pyodbc returns DECIMAL as ``Decimal``) are converted when
+    every value equals its float64 form, and to int64 when all are integral.
+    """
+    if values.dtype.kind in 'iufb':
+        return values
+    if values.dtype.kind != 'O':
+        return None
+    try:
+        as_float = values.astype(np.float64)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if not np.asarray(values == as_float, dtype=bool).all():
+        return None
+    if as_float.size and np.all(np.mod(as_float, 1) == 0) and np.abs(as_float).max() < 2 ** 53:
+        return as_float.astype(np.int64)
+    return as_float
+
+
+def _text_key(value: Any) -> str:
+    # Numbers get an exact canonical form and a different prefix than text, so
+    # 1, 1.0 and Decimal('1.000') match each other but never '1'.
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (Number, Decimal)) and not isinstance(value, complex):
+        return 'n' + format(Decimal(value).normalize(), 'f')
+    return 's' + str(value)
+
+
+def _text_keys(values: np.ndarray) -> np.ndarray:
+    if not values.size:
+        return np.array([], dtype='<U1')
+    if values.dtype.kind == 'U':
+        return np.char.add('s', values)
+    return np.frompyfunc(_text_key, 1, 1)(values.astype(object)).astype(str)
+
+
+def _comparable(source_values: np.ndarray, target_values: np.ndarray):
+    """Both sides in one comparable dtype, plus the original values when keys became text.
+
+    The originals line up with ``concatenate([source, target])`` so samples are
+    reported as the values the caller passed in.
+    """
+    source_numeric, target_numeric = _exact_numeric(source_values), _exact_numeric(target_values)
+    if source_numeric is not None and target_numeric is not None:
+        dtypes = [values.dtype for values in (source_numeric, target_numeric) if values.size]
+        dtype = np.result_type(*dtypes) if dtypes else np.dtype(np.float64)
+        return source_numeric.astype(dtype, copy=False), target_numeric.astype(dtype, copy=False), None
+    originals = np.concatenate([source_values.astype(object), target_values.astype(object)])
+    return _text_keys(source_values), _text_keys(target_values), originals
+
+
+def _plain(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _original_lookup(source: np.ndarray, target: np.ndarray, originals: np.ndarray):
+    """Sorted distinct text keys with the first original value of each."""
+    uniques, first = np.unique(np.concatenate([source, target]), return_index=True)
+    return uniques, originals[first]
+
+
+def _sorted_unique(values: np.ndarray) -> np.ndarray:
+    """Sort ``values`` in place and drop duplicates (no argsort/inverse like ``np.unique``)."""
+    values.sort()
+    if values.size < 2:
+        return values
+    keep = np.empty(values.size, dtype=bool)
+    keep[0] = True
+    np.not_equal(values[1:], values[:-1], out=keep[1:])
+    return values[keep]
+
+
+class _PackedKeys:
+    """Composite keys packed into one int64 per row (mixed radix of per-column codes).
+
+    Integer columns are coded as int64 offsets from their minimum; other
+    columns by their position among the distinct values of both sides. Falls
+    back to a structured array of codes when the combined range does not fit
+    in 63 bits.
+    """
+
+    def __init__(self, source_columns: List[np.ndarray], target_columns: List[np.ndarray]):
+        self.radixes: List[int] = []
+        self.offsets: List[int] = []
+        self.uniques: List[Any] = []
+        # Offsets still to subtract while packing; uint64 columns are shifted up front.
+        pack_offsets: List[int] = []
+        source_codes: List[np.ndarray] = []
+        target_codes: List[np.ndarray] = []
+        for src, tgt in zip(source_columns, target_columns):
+            src, tgt, originals = _comparable(src, tgt)
+            integral = src.dtype.kind in 'iub'
+            if integral:
+                present = [values for values in (src, tgt) if values.size]
+                low = min((int(values.min()) for values in present), default=0)
+                high = max((int(values.max()) for values in present), default=0)
+                integral = high - low < 2 ** 63
+            if integral:
+                self.radixes.append(high - low + 1)
+                self.offsets.append(low)
+                self.uniques.append(None)
+                if src.dtype.kind == 'u':
+                    # uint64 + int64 promotes to float64, so shift into int64 codes first.
+                    src = (src - src.dtype.type(low)).astype(np.int64)
+                    tgt = (tgt - tgt.dtype.type(low)).astype(np.int64)
+                    pack_offsets.append(0)
+                else:
+                    pack_offsets.append(low)
+                source_codes.append(src)
+                target_codes.append(tgt)
+                continue
+            combined = np.concatenate([src, tgt])
+            uniques, first, inverse = np.unique(combined, return_index=True, return_inverse=True)
+            self.radixes.append(max(len(uniques), 1))
+            self.offsets.append(0)
+            pack_offsets.append(0)
+            self.uniques.append(uniques if originals is None else originals[first])
+            source_codes.append(inverse[:len(src)].astype(np.int64, copy=False))
+            target_codes.append(inverse[len(src):].astype(np.int64, copy=False))
+
+        cardinality = 1
+        for radix in self.radixes:
+            cardinality *= radix
+        self.packed = cardinality < 2 ** 63
+        self.source = self._pack(source_codes, pack_offsets)
+        self.target = self._pack(target_codes, pack_offsets)
+
+    def _pack(self, codes: List[np.ndarray], offsets: List[int]) -> np.ndarray:
+        if not self.packed:
+            keys = np.empty(len(codes[0]), dtype=[(f'k{index}', np.int64) for index in range(len(codes))])
+            for index, (column_codes, offset) in enumerate(zip(codes, offsets)):
+                keys[f'k{index}'] = column_codes
+                keys[f'k{index}'] -= offset
+            return np.unique(keys)
+        # Built in place, one column at a time, so only one key-sized buffer is live.
+        packed = np.zeros(len(codes[0]), dtype=np.int64)
+        for column_codes, radix, offset in zip(codes, self.radixes, offsets):
+            packed *= radix
+            packed += column_codes
+            packed -= offset
+        return _sorted_unique(packed)
+
+    def decode(self, keys: np.ndarray) -> List[Tuple[Any, ...]]:
+        rows = []
+        for key in keys.tolist():
+            if self.packed:
+                codes = []
+                for radix in reversed(self.radixes):
+                    key, code = divmod(key, radix)
+                    codes.append(code)
+                codes.reverse()
+            else:
+                codes = list(key)
+            rows.append(tuple(
+                offset + code if uniques is None else _plain(uniques[code])
+                for code, offset, uniques in zip(codes, self.offsets, self.uniques)
+            ))
+        return rows
+
+
+def _key_sets(source_data: Any, target_data: Any, key_columns: Sequence[str]):
+    """Sorted distinct keys of both sides and a decoder for sampled keys."""
+    source_columns = _key_columns_values(source_data, key_columns)
+    target_columns = _key_columns_values(target_data, key_columns)
+    if len(key_columns) == 1:
+        source, target, originals = _comparable(source_columns[0], target_columns[0])
+        if originals is None:
+            decode = lambda keys: keys.tolist()
+        else:
+            uniques, values = _original_lookup(source, target, originals)
+            decode = lambda keys: [_plain(values[index]) for index in np.searchsorted(uniques, keys)]
+        return _sorted_unique(np.array(source)), _sorted_unique(np.array(target)), decode
+    packed = _PackedKeys(source_columns, target_columns)
+    return packed.source, packed.target, packed.decode
+
+
+def distinct_key_count(data: Any, key_columns: Sequence[str]) -> int:
+    """Number of distinct non-NULL keys in ``data``."""
+    return len(_key_sets(data, [], key_columns)[0])
+
+
+def compare_keys(
+    source_data: Any, target_data: Any, key_columns: Sequence[str], sample_size: int = 10
+) -> Dict[str, Any]:
+    """Distinct key counts, missing/extra counts and sorted samples (scalars or tuples).
+
+    Rows with a NULL in any key column are ignored, as they cannot match.
+    """
+    source_keys, target_keys, decode = _key_sets(source_data, target_data, key_columns)
+    missing = np.setdiff1d(source_keys, target_keys, assume_unique=True)
+    extra = np.setdiff1d(target_keys, source_keys, assume_unique=True)
+    return {
+        'source_count': len(source_keys),
+        'target_count': len(target_keys),
+        'matched_count': len(source_keys) - len(missing),
+        'missing_count': len(missing),
+        'extra_count': len(extra),
+        'missing_sample': decode(missing[:sample_size]),
+        'extra_sample': decode(extra[:sample_size]),
+    }
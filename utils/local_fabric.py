@@ -0,0 +1,452 @@
+"""Local stand-in for Fabric SQL endpoints, backed by DuckDB lakehouse files.
+
+With ``[FABRIC] FABRIC_BACKEND = local`` (or the ``FABRIC_BACKEND`` environment
+variable) ``create_fabric_client`` returns a ``LocalFabricClient`` instead of
+the ODBC ``FabricClient``. Each ``<lakehouse>.duckdb`` file in
+``FABRIC_LOCAL_DATA_DIR`` is attached under its lakehouse name, so
+``lakehouse.schema.table`` names resolve as they do on Fabric. Queries are
+translated from the T-SQL the CSV engine and its CSV files use (``TOP``,
+``[identifiers]``, ``CONVERT``, ``ISNULL``, ``HASHBYTES`` ...) into DuckDB SQL.
+
+``generate_lakehouse_data`` writes synthetic bronze/silver tables of any size
+with a controlled share of mismatching rows, so the CSV engine can be profiled
+and regression-tested without ODBC Driver 18 or AAD.
+
+DuckDB is an optional dependency and is only imported when the local backend
+is used.
+"""
+
+import atexit
+import datetime
+import decimal
+import glob
+import os
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import pyodbc
+
+from utils.fabric_client import FabricClient
+
+LOCAL_BACKEND = "local"
+LAKEHOUSE_SUFFIX = ".duckdb"
+DEFAULT_DATA_DIR = ".validation_state/local_fabric"
+
+# CONVERT(varchar, <datetime>, style) formats used by the CSV queries.
+_CONVERT_DATE_STYLES = {
+    "23": "%Y-%m-%d",
+    "112": "%Y%m%d",
+    "120": "%Y-%m-%d %H:%M:%S",
+    "121": "%Y-%m-%d %H:%M:%S.%g",
+    "126": "%Y-%m-%dT%H:%M:%S.%f",
+}
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|\[[^\]]*\]")
+_MASKED = re.compile(r"\x00(\d+)\x00")
+_TOP = re.compile(
+    r"\bSELECT(\s+DISTINCT)?\s+TOP\s*(?:\(\s*(\d+(?:\.\d+)?)\s*\)|(\d+(?:\.\d+)?))(\s+PERCENT\b)?",
+    re.IGNORECASE,
+)
+_TYPE_RENAMES = (
+    (re.compile(r"(\bAS\s+)(?:DATETIME2\b\s*(?:\(\s*\d+\s*\))?|SMALLDATETIME\b|DATETIME\b)", re.I), r"\1TIMESTAMP"),
+    (re.compile(r"(\bAS\s+)N?(?:VAR)?CHAR\s*\(\s*MAX\s*\)", re.I), r"\1VARCHAR"),
+    (re.compile(r"(\bAS\s+)N(VARCHAR|CHAR)\b", re.I), r"\1VARCHAR"),
+    (re.compile(r"(\bAS\s+)BIT\b", re.I), r"\1BOOLEAN"),
+    (re.compile(r"(\bAS\s+)UNIQUEIDENTIFIER\b", re.I), r"\1UUID"),
+    (re.compile(r"(\bAS\s+)MONEY\b", re.I), r"\1DECIMAL(19, 4)"),
+)
+_FUNCTION_RENAMES = (
+    (re.compile(r"\bCOUNT_BIG\s*\(", re.I), "COUNT("),
+    (re.compile(r"\bISNULL\s*\(", re.I), "COALESCE("),
+    (re.compile(r"\bLEN\s*\(", re.I), "LENGTH("),
+    (re.compile(r"\b(?:GETDATE|SYSDATETIME)\s*\(\s*\)", re.I), "CURRENT_TIMESTAMP"),
+    (re.compile(r"\s*\bWITH\s*\(\s*NOLOCK\s*\)", re.I), ""),
+)
+
+
+def load_local_data_dir(config) -> str:
+    """Directory of the local lakehouse files; ``FABRIC_LOCAL_DATA_DIR`` env overrides config."""
+    return os.getenv("FABRIC_LOCAL_DATA_DIR") or config.get(
+        "FABRIC", "FABRIC_LOCAL_DATA_DIR", fallback=DEFAULT_DATA_DIR
+    )
+
+
+def quote_name(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def translate_tsql(query: str) -> str:
+    """Translate the T-SQL subset used by the validation queries into DuckDB SQL.
+
+    String literals are masked first, so rewrites never touch quoted text.
+    ``[bracketed]`` identifiers become ``"quoted"`` ones and ``N'...'`` plain
+    strings. Constructs outside this subset are passed through unchanged.
+    """
+    literals: List[str] = []
+
+    def mask(match: "re.Match") -> str:
+        text = match.group(0)
+        if text.startswith("["):
+            text = quote_name(text[1:-1])
+        literals.append(text)
+        return f"\x00{len(literals) - 1}\x00"
+
+    sql = _LITERAL.sub(mask, query.strip().rstrip(";"))
+    sql = re.sub(
+        r"(?<![\w\x00])[Nn](?=\x00(\d+)\x00)",
+        lambda match: "" if literals[int(match.group(1))].startswith("'") else match.group(0),
+        sql,
+    )
+    for pattern, replacement in _FUNCTION_RENAMES:
+        sql = pattern.sub(replacement, sql)
+
+    def literal_value(text: str) -> str:
+        match = _MASKED.fullmatch(text.strip())
+        return literals[int(match.group(1))].strip("'\"") if match else text.strip()
+
+    def hashbytes(args: List[str]) -> Optional[str]:
+        function = {"SHA2_256": "sha256", "MD5": "md5"}.get(literal_value(args[0]).upper())
+        if function is None or len(args) != 2:
+            return None
+        return f"upper({function}(CAST({args[1].strip()} AS VARCHAR)))"
+
+    def convert(args: List[str]) -> Optional[str]:
+        if len(args) not in (2, 3):
+            return None
+        target, expression = args[0].strip(), args[1].strip()
+        style = _CONVERT_DATE_STYLES.get(args[2].strip()) if len(args) == 3 else None
+        if style and re.match(r"N?(?:VAR)?CHAR\b", target, re.I):
+            return f"strftime(CAST({expression} AS TIMESTAMP), '{style}')"
+        return f"CAST({expression} AS {target})"
+
+    sql = _rewrite_calls(sql, "HASHBYTES", hashbytes)
+    sql = _rewrite_calls(sql, "CONVERT", convert)
+    for pattern, replacement in _TYPE_RENAMES:
+        sql = pattern.sub(replacement, sql)
+    sql = _rewrite_top(sql)
+    return _MASKED.sub(lambda match: literals[int(match.group(1))], sql)
+
+
+def _closing_paren(sql: str, open_index: int) -> int:
+    depth = 0
+    for index in range(open_index, len(sql)):
+        if sql[index] == "(":
+            depth += 1
+        elif sql[index] == ")":
+            depth -= 1
+            if depth == 0:
+                return index
+    raise ValueError(f"Unbalanced parentheses in query: {sql}")
+
+
+def _split_args(text: str) -> List[str]:
+    args, depth, start = [], 0, 0
+    for index, char in enumerate(text):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            args.append(text[start:index])
+            start = index + 1
+    args.append(text[start:])
+    return args
+
+
+def _rewrite_calls(sql: str, name: str, rewrite: Callable[[List[str]], Optional[str]]) -> str:
+    """Replace ``name(...)`` calls innermost first; calls ``rewrite`` declines are kept."""
+    pattern = re.compile(rf"\b{name}\s*\(", re.IGNORECASE)
+    search_end = len(sql)
+    while True:
+        matches = list(pattern.finditer(sql, 0, search_end))
+        if not matches:
+            return sql
+        match = matches[-1]
+        close = _closing_paren(sql, match.end() - 1)
+        replacement = rewrite(_split_args(sql[match.end():close]))
+        if replacement is None:
+            search_end = match.start()
+            continue
+        sql = sql[:match.start()] + replacement + sql[close + 1:]
+        search_end = len(sql)
+
+
+def _rewrite_top(sql: str) -> str:
+    """Move ``SELECT TOP n [PERCENT]`` to a ``LIMIT`` at the end of the same SELECT scope."""
+    while True:
+        matches = list(_TOP.finditer(sql))
+        if not matches:
+            return sql
+        match = matches[-1]
+        count = match.group(2) or match.group(3)
+        limit = f" LIMIT {count}{'%' if match.group(4) else ''}"
+        end, depth = match.end(), 0
+        while end < len(sql) and not (depth == 0 and sql[end] == ")"):
+            depth += {"(": 1, ")": -1}.get(sql[end], 0)
+            end += 1
+        body = sql[match.end():end].rstrip()
+        sql = f"{sql[:match.start()]}SELECT{match.group(1) or ''}{body}{limit}{sql[end:]}"
+
+
+# DuckDB type name prefixes mapped to the Python types pyodbc reports as ``type_code``.
+_DESCRIPTION_TYPES = (
+    ("BOOLEAN", bool),
+    ("DECIMAL", decimal.Decimal),
+    ("TIMESTAMP", datetime.datetime),
+    ("DATE", datetime.date),
+    ("TIME", datetime.time),
+    ("BLOB", bytes),
+    ("DOUBLE", float),
+    ("FLOAT", float),
+    ("REAL", float),
+)
+
+_INTEGER_TYPE = re.compile(r"U?(TINY|SMALL|BIG|HUGE)?INT(EGER)?")
+
+
+def _description_type(duckdb_type: Any) -> type:
+    name = str(duckdb_type).upper()
+    for prefix, python_type in _DESCRIPTION_TYPES:
+        if name.startswith(prefix):
+            return python_type
+    return int if _INTEGER_TYPE.fullmatch(name) else str
+
+
+def _import_duckdb():
+    try:
+        import duckdb
+    except ImportError as exc:
+        raise RuntimeError(
+            "The local Fabric backend needs the optional 'duckdb' package (pip install duckdb)."
+        ) from exc
+    return duckdb
+
+
+class _LocalCursor:
+    """DB-API cursor over DuckDB that translates T-SQL and raises ``pyodbc.Error``."""
+
+    def __init__(self, connection, duckdb):
+        self._connection = connection
+        self._duckdb = duckdb
+        self.arraysize = 1
+
+    @property
+    def description(self):
+        if self._connection.description is None:
+            return None
+        return [
+            (name, _description_type(type_code), *rest)
+            for name, type_code, *rest in self._connection.description
+        ]
+
+    @property
+    def rowcount(self) -> int:
+        return -1
+
+    def execute(self, query: str, params: Optional[Sequence[Any]] = None):
+        try:
+            if params is None:
+                self._connection.execute(translate_tsql(query))
+            else:
+                self._connection.execute(translate_tsql(query), list(params))
+        except self._duckdb.Error as exc:
+            # Surface engine errors the way ODBC does, so FabricClient's handling applies.
+            raise pyodbc.Error("42000", f"[local DuckDB] {exc}") from exc
+        return self
+
+    def executemany(self, query: str, seq_of_params: Iterable[Sequence[Any]]):
+        for params in seq_of_params:
+            self.execute(query, params)
+        return self
+
+    def fetchone(self):
+        return self._connection.fetchone()
+
+    def fetchmany(self, size: Optional[int] = None):
+        return self._connection.fetchmany(size or self.arraysize)
+
+    def fetchall(self):
+        return self._connection.fetchall()
+
+    def close(self) -> None:
+        pass
+
+
+class _LocalConnection:
+    """One DuckDB connection to the shared database holding every attached lakehouse."""
+
+    def __init__(self, connection, duckdb):
+        self._connection = connection
+        self._duckdb = duckdb
+
+    def cursor(self) -> _LocalCursor:
+        return _LocalCursor(self._connection, self._duckdb)
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+_databases: Dict[str, Any] = {}
+_databases_lock = threading.Lock()
+
+
+def open_local_connection(data_dir: str) -> _LocalConnection:
+    """Open a connection to the process-wide DuckDB database for ``data_dir``.
+
+    The first call attaches every ``*.duckdb`` lakehouse file in the directory
+    read-only. Later calls share that database.
+    """
+    duckdb = _import_duckdb()
+    data_dir = os.path.abspath(data_dir)
+    with _databases_lock:
+        root = _databases.get(data_dir)
+        if root is None:
+            paths = sorted(glob.glob(os.path.join(data_dir, f"*{LAKEHOUSE_SUFFIX}")))
+            if not paths:
+                raise RuntimeError(
+                    f"No local lakehouse files (*{LAKEHOUSE_SUFFIX}) in {data_dir}. "
+                    "Create them with scripts/generate_local_fabric_data.py."
+                )
+            root = duckdb.connect()
+            for path in paths:
+                lakehouse = os.path.basename(path)[: -len(LAKEHOUSE_SUFFIX)]
+                escaped_path = path.replace("'", "''")
+                root.execute(f"ATTACH '{escaped_path}' AS {quote_name(lakehouse)} (READ_ONLY)")
+            _databases[data_dir] = root
+        return _LocalConnection(root.cursor(), duckdb)
+
+
+@atexit.register
+def close_local_databases() -> None:
+    """Detach every local database; the next connection re-reads the lakehouse files."""
+    with _databases_lock:
+        roots = list(_databases.values())
+        _databases.clear()
+    for root in roots:
+        root.close()
+
+
+class LocalFabricClient(FabricClient):
+    """``FabricClient`` over local DuckDB lakehouse files instead of a SQL endpoint.
+
+    Only the connection is replaced: pooling, retries, the endpoint
+    concurrency limit, query caching and every result format behave as
+    against Fabric. All layers share one endpoint key, ``local:<data_dir>``.
+    """
+
+    def __init__(self, layer: str = "BRONZE", data_dir: Optional[str] = None):
+        super().__init__(layer)
+        self.data_dir = os.path.abspath(data_dir or load_local_data_dir(self.config))
+
+    @property
+    def sql_endpoint(self) -> str:
+        return f"local:{self.data_dir}"
+
+    def _open_connection(self):
+        return open_local_connection(self.data_dir)
+
+
+def _synthetic_rows_query(lakehouse: str, rows: int, seed: int, first_recid: int = 1) -> str:
+    """Deterministic AX-style rows; ``bucket`` (0..999999) drives mismatch selection."""
+    salt = lakehouse.replace("'", "''")
+    noise = f"hash(range, {int(seed)}, '{salt}'"
+    return f"""
+        SELECT
+            range + {int(first_recid)} AS recid,
+            CAST({noise}, 'v') % 5 + 1 AS INTEGER) AS recversion,
+            'DA' || CAST(range % 4 AS VARCHAR) AS dataareaid,
+            'C' || lpad(CAST({noise}, 'a') % 100000 AS VARCHAR), 6, '0') AS accountnum,
+            'INV-' || lpad(CAST(range + {int(first_recid)} AS VARCHAR), 10, '0') AS invoiceid,
+            CAST(({noise}, 'm') % 10000000) / 100.0 AS DECIMAL(18, 2)) AS amountcur,
+            CAST({noise}, 'q') % 1000 AS INTEGER) AS qty,
+            CASE WHEN {noise}, 'd') % 100 = 0 THEN 1 ELSE 0 END AS isdelete,
+            TIMESTAMP '2023-01-01' + to_seconds(CAST({noise}, 'c') % 63072000 AS BIGINT)) AS createddatetime,
+            createddatetime + to_seconds(CAST({noise}, 'u') % 2592000 AS BIGINT)) AS modifieddatetime,
+            createddatetime + INTERVAL 1 HOUR AS dpcreateddatetime,
+            modifieddatetime + INTERVAL 1 HOUR AS dpmodifieddatetime,
+            CAST(createddatetime AS DATE) AS accountingdate,
+            {noise}, 'x') % 1000000 AS bucket
+        FROM range({int(rows)})
+    """
+
+
+def generate_lakehouse_data(
+    data_dir: str,
+    table_names: Sequence[str],
+    rows: int,
+    source_lakehouses: Sequence[str],
+    target_lakehouse: str,
+    source_schema: str = "dbo",
+    target_schema: str = "dbo",
+    lhname_column: str = "lhname",
+    mismatch_rate: float = 0.0,
+    seed: int = 0,
+) -> Dict[str, Dict[str, int]]:
+    """Write synthetic source tables and their target copies as local lakehouse files.
+
+    Every source lakehouse gets ``rows`` rows per table in
+    ``<source_lakehouse>.<source_schema>.<table>``. The target table unions all
+    sources with ``lhname_column`` set to the source lakehouse. ``mismatch_rate``
+    of the rows differ, split evenly between rows missing from the target, rows
+    whose ``amountcur``/``modifieddatetime`` changed, and extra target-only rows.
+
+    Returns the source and target row counts per table. Call
+    ``close_local_databases`` before querying regenerated files in the same
+    process.
+    """
+    duckdb = _import_duckdb()
+    os.makedirs(data_dir, exist_ok=True)
+    third = int(round(mismatch_rate * 1_000_000 / 3))
+    extra_rows = int(round(rows * mismatch_rate / 3))
+    summary: Dict[str, Dict[str, int]] = {}
+
+    def lakehouse_file(lakehouse: str, schema: str):
+        connection = duckdb.connect(os.path.join(data_dir, f"{lakehouse}{LAKEHOUSE_SUFFIX}"))
+        connection.execute(f"CREATE SCHEMA IF NOT EXISTS {quote_name(schema)}")
+        return connection
+
+    for lakehouse in source_lakehouses:
+        connection = lakehouse_file(lakehouse, source_schema)
+        try:
+            for table in table_names:
+                connection.execute(
+                    f"CREATE OR REPLACE TABLE {quote_name(source_schema)}.{quote_name(table)} AS "
+                    f"SELECT * EXCLUDE (bucket) FROM ({_synthetic_rows_query(lakehouse, rows, seed)})"
+                )
+        finally:
+            connection.close()
+
+    connection = lakehouse_file(target_lakehouse, target_schema)
+    try:
+        for table in table_names:
+            selects = []
+            for lakehouse in source_lakehouses:
+                label = lakehouse.replace("'", "''")
+                selects.append(
+                    f"SELECT * EXCLUDE (bucket) REPLACE ("
+                    f"CASE WHEN bucket < {2 * third} THEN amountcur + 1 ELSE amountcur END AS amountcur, "
+                    f"CASE WHEN bucket < {2 * third} THEN modifieddatetime + INTERVAL 1 DAY "
+                    f"ELSE modifieddatetime END AS modifieddatetime), "
+                    f"'{label}' AS {quote_name(lhname_column)} "
+                    f"FROM ({_synthetic_rows_query(lakehouse, rows, seed)}) WHERE bucket >= {third}"
+                )
+                if extra_rows:
+                    selects.append(
+                        f"SELECT * EXCLUDE (bucket), '{label}' AS {quote_name(lhname_column)} "
+                        f"FROM ({_synthetic_rows_query(lakehouse + ':extra', extra_rows, seed, rows + 1)})"
+                    )
+            target = f"{quote_name(target_schema)}.{quote_name(table)}"
+            connection.execute(f"CREATE OR REPLACE TABLE {target} AS {' UNION ALL '.join(selects)}")
+            summary[table] = {
+                "source_rows": rows * len(source_lakehouses),
+                "target_rows": connection.execute(f"SELECT COUNT(*) FROM {target}").fetchone()[0],
+            }
+    finally:
+        connection.close()
+    return summary
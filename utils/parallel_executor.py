@@ -0,0 +1,191 @@
+"""Bounded worker pool for running independent ETL validation rows concurrently."""
+
+import configparser
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import allure
+
+
+def load_parallel_settings(config_file: str = "config/master.properties") -> Dict[str, Any]:
+    """Read ENABLE_PARALLEL / MAX_WORKERS from the [TESTING] section."""
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    enabled = config.getboolean("TESTING", "ENABLE_PARALLEL", fallback=False)
+    max_workers = config.getint("TESTING", "MAX_WORKERS", fallback=4)
+    return {"enabled": enabled, "max_workers": max(1, max_workers)}
+
+
+class AllureEventRecorder:
+    """Capture allure steps/attachments on worker threads and replay them later.
+
+    allure-pytest binds steps to the test item active on the calling thread, so
+    output produced on a pool thread would land on an unrelated test. While a
+    recording is active the events are buffered and replayed by the test that
+    owns the row.
+    """
+
+    _local = threading.local()
+
+    @classmethod
+    @contextmanager
+    def recording(cls):
+        events: List[Dict[str, Any]] = []
+        cls._local.stack = [events]
+        try:
+            yield events
+        finally:
+            cls._local.stack = None
+
+    @classmethod
+    @contextmanager
+    def step(cls, title: str):
+        stack = getattr(cls._local, "stack", None)
+        if not stack:
+            with allure.step(title):
+                yield
+            return
+
+        node = {"kind": "step", "title": title, "children": []}
+        stack[-1].append(node)
+        stack.append(node["children"])
+        try:
+            yield
+        finally:
+            stack.pop()
+
+    @classmethod
+    def attach(cls, body: Any, name: Optional[str] = None, attachment_type: Any = None) -> None:
+        stack = getattr(cls._local, "stack", None)
+        if not stack:
+            allure.attach(body, name=name, attachment_type=attachment_type)
+            return
+        stack[-1].append(
+            {"kind": "attach", "body": body, "name": name, "attachment_type": attachment_type}
+        )
+
+    @classmethod
+    def replay(cls, events: Iterable[Dict[str, Any]]) -> None:
+        for event in events:
+            if event["kind"] == "step":
+                with allure.step(event["title"]):
+                    cls.replay(event["children"])
+            else:
+                allure.attach(
+                    event["body"], name=event["name"], attachment_type=event["attachment_type"]
+                )
+
+
+@dataclass
+class RowExecution:
+    """Outcome and timing of one validation row."""
+
+    key: str
+    value: Any = None
+    error: Optional[BaseException] = None
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    started_at: float = 0.0
+    elapsed_seconds: float = 0.0
+    worker: str = ""
+
+    def result(self) -> Any:
+        """Return the row value or re-raise the error captured on the worker."""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class ParallelRowExecutor:
+    """Run a callable over independent rows with at most ``max_workers`` threads."""
+
+    def __init__(self, max_workers: int = 4, thread_name_prefix: str = "etl-row"):
+        self.max_workers = max(1, int(max_workers))
+        self.thread_name_prefix = thread_name_prefix
+
+    def run(
+        self,
+        rows: Iterable[Any],
+        fn: Callable[[Any], Any],
+        key: Callable[[Any], str],
+    ) -> Dict[str, RowExecution]:
+        """Execute ``fn`` for every row and return executions keyed by ``key(row)``."""
+        executions: Dict[str, RowExecution] = {}
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=self.thread_name_prefix,
+        ) as pool:
+            futures = [pool.submit(self._timed_call, fn, row, key(row)) for row in rows]
+            for future in as_completed(futures):
+                execution = future.result()
+                executions[execution.key] = execution
+        return executions
+
+    @staticmethod
+    def _timed_call(fn: Callable[[Any], Any], row: Any, row_key: str) -> RowExecution:
+        execution = RowExecution(
+            key=row_key,
+            started_at=time.time(),
+            worker=threading.current_thread().name,
+        )
+        started = time.perf_counter()
+        with AllureEventRecorder.recording() as events:
+            try:
+                execution.value = fn(row)
+            except Exception as exc:
+                execution.error = exc
+        execution.events = events
+        execution.elapsed_seconds = time.perf_counter() - started
+        return execution
+
+
+def run_concurrently(*calls: Callable[[], Any]) -> List[Any]:
+    """Run independent callables at the same time and return their results in order.
+
+    The first callable runs on the calling thread; the others use short-lived
+    helper threads. Every call finishes before the first error (in argument
+    order) is re-raised, so no query is left running in the background.
+    """
+    if len(calls) <= 1:
+        return [call() for call in calls]
+
+    with ThreadPoolExecutor(max_workers=len(calls) - 1, thread_name_prefix="etl-query") as pool:
+        futures = [pool.submit(call) for call in calls[1:]]
+        outcomes: List[Any] = []
+        try:
+            outcomes.append((calls[0](), None))
+        except Exception as exc:
+            outcomes.append((None, exc))
+        for future in futures:
+            try:
+                outcomes.append((future.result(), None))
+            except Exception as exc:
+                outcomes.append((None, exc))
+
+    for _, error in outcomes:
+        if error is not None:
+            raise error
+    return [value for value, _ in outcomes]
+
+
+def format_timing_report(
+    executions: Iterable[RowExecution],
+    wall_seconds: Optional[float] = None,
+    top: int = 20,
+) -> str:
+    """Render per-row timings, slowest first, with an optional wall-clock summary."""
+    ordered = sorted(executions, key=lambda item: item.elapsed_seconds, reverse=True)
+    total = sum(item.elapsed_seconds for item in ordered)
+    lines = [f"Rows: {len(ordered)} | Sum of row time: {total:.2f}s"]
+    if wall_seconds is not None:
+        speedup = total / wall_seconds if wall_seconds > 0 else 0.0
+        lines[0] += f" | Wall time: {wall_seconds:.2f}s | Speedup: {speedup:.2f}x"
+    for item in ordered[:top]:
+        status = "ERROR" if item.error is not None else "OK"
+        lines.append(f"- {item.key}: {item.elapsed_seconds:.2f}s [{status}] on {item.worker}")
+    if len(ordered) > top:
+        lines.append(f"... {len(ordered) - top} faster row(s) omitted")
+    return "\n".join(lines)
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import threading
+from contextlib import contextmanager
 from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
+from utils.partitioned_comparison import compare_partitioned
+
 DataLike = Union[pd.DataFrame, Sequence[Mapping[str, Any]], Sequence[Sequence[Any]]]
 
+NORMALIZATION_SAMPLE_ROWS = 2000
+# (table, column, dtype) -> normalization kind, shared across test rows and threads.
+_NORMALIZATION_PLANS: Dict[Tuple[str, str, str], str] = {}
+_NORMALIZATION_PLANS_LOCK = threading.Lock()
+# Per-thread column scans shared by checks running inside ``shared_scan``.
+_SCAN_STATE = threading.local()
+
 
 class PredefinedValidations:
     """Reusable ETL validation helpers for source-target dataset comparison.
@@ -14,15 +26,33 @@ class PredefinedValidations:
     used directly inside pytest test functions.
     """
 
+    @staticmethod
+    def _copy_on_write_active() -> bool:
+        """True when pandas copy-on-write is on (always from pandas 3)."""
+        if int(pd.__version__.split(".")[0]) >= 3:
+            return True
+        try:
+            return pd.get_option("mode.copy_on_write") is True
+        except KeyError:  # pragma: no cover - pandas < 1.5
+            return False
+
     @staticmethod
     def _to_dataframe(
         data: DataLike,
         columns: Optional[Sequence[str]] = None,
         dataset_name: str = "dataset",
+        copy: Optional[bool] = None,
     ) -> pd.DataFrame:
-        """Convert supported input types to a pandas DataFrame."""
+        """Convert supported input types to a pandas DataFrame.
+
+        DataFrame inputs are used without copying when pandas copy-on-write is
+        active, since no derived frame can then write through to the caller's
+        data. Otherwise they are copied, unless ``copy=False`` is passed.
+        """
         if isinstance(data, pd.DataFrame):
-            return data.copy()
+            if copy is None:
+                copy = not PredefinedValidations._copy_on_write_active()
+            return data.copy() if copy else data
 
         if data is None:
             raise AssertionError(f"{dataset_name} is None; expected DataFrame-like input.")
@@ -46,26 +76,178 @@ class PredefinedValidations:
             )
 
     @staticmethod
-    def _normalize_series(series: pd.Series) -> pd.Series:
-        """Normalize values for deterministic comparisons (NaN-safe, whitespace-safe, numeric-safe)."""
+    @contextmanager
+    def shared_scan(df: pd.DataFrame):
+        """Reuse column conversions and group sizes of ``df`` across checks in this block.
+
+        Checks on the same DataFrame object (by identity) read cached numeric /
+        datetime conversions, NULL masks and group sizes instead of re-scanning.
+        """
+        previous = getattr(_SCAN_STATE, "frames", None)
+        _SCAN_STATE.frames = dict(previous or {})
+        _SCAN_STATE.frames[id(df)] = (df, {})
+        try:
+            yield
+        finally:
+            _SCAN_STATE.frames = previous
+
+    @staticmethod
+    def _scanned(df: pd.DataFrame, key: Tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        """Return ``compute()``, cached for ``df`` while a ``shared_scan`` is active."""
+        entry = (getattr(_SCAN_STATE, "frames", None) or {}).get(id(df))
+        if entry is None or entry[0] is not df:
+            return compute()
+        cache = entry[1]
+        if key not in cache:
+            cache[key] = compute()
+        return cache[key]
 
-        # Try numeric conversion first
-        numeric_series = pd.to_numeric(series, errors="coerce")
+    @staticmethod
+    def _numeric_column(df: pd.DataFrame, column: str) -> pd.Series:
+        return PredefinedValidations._scanned(
+            df, ("numeric", column), lambda: pd.to_numeric(df[column], errors="coerce")
+        )
 
-        # If conversion succeeded for most values, treat as numeric
-        if numeric_series.notna().sum() >= len(series) * 0.8:
-            return numeric_series
+    @staticmethod
+    def _datetime_column(df: pd.DataFrame, column: str) -> pd.Series:
+        return PredefinedValidations._scanned(
+            df, ("datetime", column), lambda: pd.to_datetime(df[column], errors="coerce")
+        )
 
-        # Datetime handling
+    @staticmethod
+    def _null_mask(df: pd.DataFrame, column: str, treat_blank_as_null: bool = False) -> pd.Series:
+        """NULL mask for a column, optionally counting empty/whitespace-only strings as NULL."""
+
+        def compute() -> pd.Series:
+            null_mask = df[column].isna()
+            if treat_blank_as_null and (
+                pd.api.types.is_object_dtype(df[column]) or pd.api.types.is_string_dtype(df[column])
+            ):
+                try:
+                    null_mask = null_mask | df[column].str.fullmatch(r"\s*").eq(True)
+                except AttributeError:
+                    pass  # object column without any strings
+            return null_mask
+
+        return PredefinedValidations._scanned(df, ("null", column, treat_blank_as_null), compute)
+
+    @staticmethod
+    def _group_sizes(df: pd.DataFrame, columns: Sequence[str]) -> pd.Series:
+        """Row count per distinct value combination of ``columns`` (NULLs form their own groups)."""
+        return PredefinedValidations._scanned(
+            df,
+            ("group_sizes", tuple(columns)),
+            lambda: df.groupby(list(columns), dropna=False).size(),
+        )
+
+    @staticmethod
+    def _infer_normalization_kind(
+        series: pd.Series, sample_size: int = NORMALIZATION_SAMPLE_ROWS
+    ) -> str:
+        """Decide how a column is normalized, from its dtype or an evenly spaced sample.
+
+        Kinds: ``numeric`` (``pd.to_numeric``), ``text`` (``str`` + strip) and
+        ``passthrough`` (values used as-is).
+        """
+        if pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+            return "passthrough"
         if pd.api.types.is_datetime64_any_dtype(series):
-            return pd.to_datetime(series, errors="coerce")
+            # to_numeric maps datetimes (and NaT) to int64 nanoseconds.
+            return "numeric"
+
+        sample = series
+        if len(series) > sample_size:
+            positions = np.linspace(0, len(series) - 1, sample_size).astype(np.int64)
+            sample = series.iloc[positions]
 
-        # Object handling
+        # Treat as numeric when conversion succeeds for most values.
+        if pd.to_numeric(sample, errors="coerce").notna().sum() >= len(sample) * 0.8:
+            return "numeric"
         if pd.api.types.is_object_dtype(series):
-            return series.astype(str).str.strip()
+            return "text"
+        return "passthrough"
+
+    @staticmethod
+    def _normalization_kind(
+        series: pd.Series,
+        table: Optional[str] = None,
+        column: Optional[str] = None,
+    ) -> str:
+        """Return the cached kind for ``(table, column, dtype)``, inferring it on first use."""
+        if not table:
+            return PredefinedValidations._infer_normalization_kind(series)
+
+        cache_key = (str(table), str(column if column is not None else series.name), str(series.dtype))
+        with _NORMALIZATION_PLANS_LOCK:
+            kind = _NORMALIZATION_PLANS.get(cache_key)
+        if kind is None:
+            kind = PredefinedValidations._infer_normalization_kind(series)
+            with _NORMALIZATION_PLANS_LOCK:
+                _NORMALIZATION_PLANS[cache_key] = kind
+        return kind
 
+    @staticmethod
+    def clear_normalization_plans() -> None:
+        """Drop cached per-(table, column) normalization kinds."""
+        with _NORMALIZATION_PLANS_LOCK:
+            _NORMALIZATION_PLANS.clear()
+
+    @staticmethod
+    def _normalize_series(series: pd.Series, kind: Optional[str] = None) -> pd.Series:
+        """Normalize values for deterministic comparisons (NaN-safe, whitespace-safe, numeric-safe).
+
+        ``kind`` comes from a normalization plan; when omitted it is inferred.
+        """
+        if kind is None:
+            kind = PredefinedValidations._infer_normalization_kind(series)
+        if kind == "numeric":
+            return pd.to_numeric(series, errors="coerce")
+        if kind == "text":
+            return series.astype(str).str.strip()
         return series
 
+    @staticmethod
+    def _normalize_pair(
+        left: pd.Series,
+        right: pd.Series,
+        left_kind: Optional[str] = None,
+        right_kind: Optional[str] = None,
+    ) -> Tuple[pd.Series, pd.Series]:
+        """Normalize a compared column pair, falling back to text on both sides when needed.
+
+        Planned kinds come from a sample, so a numeric kind can meet values that
+        do not parse; coercing them to NaN would make them compare equal. When
+        numeric coercion turns any non-NULL value into NaN, both sides are
+        compared as text instead.
+        """
+        normalized = []
+        for series, kind in ((left, left_kind), (right, right_kind)):
+            values = PredefinedValidations._normalize_series(series, kind)
+            if (values.isna() & series.notna()).any():
+                return (
+                    PredefinedValidations._normalize_series(left, "text"),
+                    PredefinedValidations._normalize_series(right, "text"),
+                )
+            normalized.append(values)
+        return normalized[0], normalized[1]
+
+    @staticmethod
+    def _normalization_plan(
+        source_df: pd.DataFrame,
+        target_df: pd.DataFrame,
+        column_pairs: Sequence[Tuple[str, str]],
+        source_table: Optional[str] = None,
+        target_table: Optional[str] = None,
+    ) -> Dict[str, Tuple[str, str]]:
+        """Map each source column to its (source kind, target kind) pair."""
+        return {
+            source_col: (
+                PredefinedValidations._normalization_kind(source_df[source_col], source_table, source_col),
+                PredefinedValidations._normalization_kind(target_df[target_col], target_table, target_col),
+            )
+            for source_col, target_col in column_pairs
+        }
+
     @staticmethod
     def row_count_comparison(source_data: DataLike, target_data: DataLike) -> Tuple[int, int]:
         """Validate total row count between source and target datasets."""
@@ -228,16 +410,8 @@ class PredefinedValidations:
         if df.empty:
             raise AssertionError("Dataset is empty; cannot validate NULL constraints.")
 
-        working_df = df.copy()
-
-        if treat_blank_as_null:
-            # Replace empty or whitespace-only strings with NA
-            working_df[mandatory_columns] = working_df[mandatory_columns].replace(
-                r'^\s*$', pd.NA, regex=True
-            )
-
         null_counts = {
-            col: int(working_df[col].isna().sum())
+            col: int(PredefinedValidations._null_mask(df, col, treat_blank_as_null).sum())
             for col in mandatory_columns
         }
 
@@ -264,7 +438,8 @@ class PredefinedValidations:
         df = PredefinedValidations._to_dataframe(data, dataset_name="data")
         PredefinedValidations._assert_columns_exist(df, primary_keys, "data")
 
-        duplicate_count = int(df.duplicated(subset=list(primary_keys), keep=False).sum())
+        group_sizes = PredefinedValidations._group_sizes(df, primary_keys)
+        duplicate_count = int(group_sizes[group_sizes > 1].sum())
         if duplicate_count > 0:
             raise AssertionError(
                 f"Duplicate check failed: found {duplicate_count} duplicate rows on keys {list(primary_keys)}."
@@ -288,11 +463,8 @@ class PredefinedValidations:
         PredefinedValidations._assert_columns_exist(source_df, required_source_cols, "source_data")
         PredefinedValidations._assert_columns_exist(target_df, required_target_cols, "target_data")
 
-        source_view = source_df[required_source_cols].copy()
-        target_view = target_df[required_target_cols].copy()
-
-        merge_df = source_view.merge(
-            target_view,
+        merge_df = source_df[required_source_cols].merge(
+            target_df[required_target_cols],
             on=list(key_columns),
             how="inner",
             suffixes=("_source", "_target"),
@@ -342,25 +514,42 @@ class PredefinedValidations:
         PredefinedValidations._assert_columns_exist(target_df, list(aggregate_config.keys()), "target_data")
 
         supported = {"sum", "min", "max"}
-        results: Dict[str, Dict[str, float]] = {}
-        failures: List[str] = []
+        source_values: Dict[str, Dict[str, float]] = {}
+        target_values: Dict[str, Dict[str, float]] = {}
 
         for column, aggs in aggregate_config.items():
-            results[column] = {}
+            source_values[column] = {}
+            target_values[column] = {}
             for agg in aggs:
                 agg_lower = agg.lower()
                 if agg_lower not in supported:
                     raise AssertionError(
                         f"Unsupported aggregate '{agg}' for column '{column}'. Supported: {sorted(supported)}"
                     )
+                source_values[column][agg_lower] = float(getattr(source_df[column], agg_lower)())
+                target_values[column][agg_lower] = float(getattr(target_df[column], agg_lower)())
 
-                source_value = float(getattr(source_df[column], agg_lower)())
-                target_value = float(getattr(target_df[column], agg_lower)())
+        return PredefinedValidations.aggregate_value_comparison(source_values, target_values, tolerance)
+
+    @staticmethod
+    def aggregate_value_comparison(
+        source_values: Mapping[str, Mapping[str, float]],
+        target_values: Mapping[str, Mapping[str, float]],
+        tolerance: float = 0.0,
+    ) -> Dict[str, Dict[str, float]]:
+        """Compare precomputed ``{column: {agg: value}}`` aggregates (e.g. pushed down to SQL)."""
+        results: Dict[str, Dict[str, float]] = {}
+        failures: List[str] = []
+
+        for column, aggs in source_values.items():
+            results[column] = {}
+            for agg_lower, source_value in aggs.items():
+                target_value = float(target_values[column][agg_lower])
                 results[column][agg_lower] = target_value
 
-                if abs(source_value - target_value) > tolerance:
+                if abs(float(source_value) - target_value) > tolerance:
                     failures.append(
-                        f"{column}.{agg_lower}: source={source_value}, target={target_value}, tolerance={tolerance}"
+                        f"{column}.{agg_lower}: source={float(source_value)}, target={target_value}, tolerance={tolerance}"
                     )
 
         if failures:
@@ -368,6 +557,48 @@ class PredefinedValidations:
 
         return results
 
+    @staticmethod
+    def _compare_record_views(
+        source_view: pd.DataFrame,
+        target_view: pd.DataFrame,
+        key_columns: Sequence[str],
+        compare_columns: Sequence[str],
+        max_mismatch_rows: int = 10,
+        normalization_plan: Optional[Mapping[str, Tuple[str, str]]] = None,
+    ) -> Dict[str, Any]:
+        """Merge two key+compare column views and collect missing/extra keys and capped diffs."""
+        merge_df = source_view.merge(
+            target_view,
+            on=list(key_columns),
+            how="outer",
+            suffixes=("_source", "_target"),
+            indicator=True,
+        )
+
+        missing_in_target = merge_df[merge_df["_merge"] == "left_only"][list(key_columns)]
+        extra_in_target = merge_df[merge_df["_merge"] == "right_only"][list(key_columns)]
+
+        both_df = merge_df[merge_df["_merge"] == "both"]
+        mismatches: Dict[str, List[Dict[str, Any]]] = {}
+
+        for col in compare_columns:
+            source_col = f"{col}_source"
+            target_col = f"{col}_target"
+
+            source_kind, target_kind = (normalization_plan or {}).get(col, (None, None))
+            left, right = PredefinedValidations._normalize_pair(
+                both_df[source_col], both_df[target_col], source_kind, target_kind
+            )
+
+            diff_mask = ~(left.eq(right) | (left.isna() & right.isna()))
+            if diff_mask.any():
+                diff_rows = both_df.loc[diff_mask, list(key_columns) + [source_col, target_col]].head(
+                    max_mismatch_rows
+                )
+                mismatches[col] = diff_rows.to_dict(orient="records")
+
+        return {"missing": missing_in_target, "extra": extra_in_target, "mismatches": mismatches}
+
     @staticmethod
     def record_level_dataframe_comparison(
         source_data: DataLike,
@@ -375,6 +606,9 @@ class PredefinedValidations:
         key_columns: Sequence[str],
         compare_columns: Optional[Sequence[str]] = None,
         max_mismatch_rows: int = 10,
+        partition_count: Optional[int] = None,
+        source_table: Optional[str] = None,
+        target_table: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Perform record-level comparison between source and target datasets.
 
@@ -382,6 +616,14 @@ class PredefinedValidations:
         1) Missing keys in target
         2) Extra keys in target
         3) Value mismatches on selected comparison columns
+
+        Parameters
+        ----------
+        partition_count:
+            Compare in this many hash buckets of ``key_columns`` instead of one merge.
+        source_table / target_table:
+            Identify the datasets so per-column normalization kinds are inferred
+            once and reused by later comparisons of the same table.
         """
         source_df = PredefinedValidations._to_dataframe(source_data, dataset_name="source_data")
         target_df = PredefinedValidations._to_dataframe(target_data, dataset_name="target_data")
@@ -396,52 +638,115 @@ class PredefinedValidations:
         PredefinedValidations._assert_columns_exist(source_df, compare_columns, "source_data")
         PredefinedValidations._assert_columns_exist(target_df, compare_columns, "target_data")
 
-        source_view = source_df[list(key_columns) + list(compare_columns)].copy()
-        target_view = target_df[list(key_columns) + list(compare_columns)].copy()
+        view_columns = list(key_columns) + list(compare_columns)
+        normalization_plan = PredefinedValidations._normalization_plan(
+            source_df,
+            target_df,
+            [(col, col) for col in compare_columns],
+            source_table,
+            target_table,
+        )
 
-        merge_df = source_view.merge(
-            target_view,
+        def compare_bucket(source_view: pd.DataFrame, target_view: pd.DataFrame) -> Dict[str, Any]:
+            return PredefinedValidations._compare_record_views(
+                source_view,
+                target_view,
+                key_columns,
+                compare_columns,
+                max_mismatch_rows,
+                normalization_plan,
+            )
+
+        if partition_count and partition_count > 1:
+            summary = compare_partitioned(
+                source_df,
+                target_df,
+                key_columns=key_columns,
+                compare_columns=compare_columns,
+                compare_bucket=compare_bucket,
+                partition_count=int(partition_count),
+                max_mismatch_rows=max_mismatch_rows,
+            )
+        else:
+            result = compare_bucket(source_df[view_columns], target_df[view_columns])
+            missing_in_target = result["missing"]
+            extra_in_target = result["extra"]
+            mismatch_records = [
+                record for col in compare_columns for record in result["mismatches"].get(col, [])
+            ]
+            summary = {
+                "missing_in_target_count": int(len(missing_in_target)),
+                "extra_in_target_count": int(len(extra_in_target)),
+                "mismatch_count": int(len(mismatch_records)),
+                "sample_missing_in_target": missing_in_target.head(max_mismatch_rows).to_dict(orient="records"),
+                "sample_extra_in_target": extra_in_target.head(max_mismatch_rows).to_dict(orient="records"),
+                "sample_mismatches": mismatch_records[:max_mismatch_rows],
+            }
+
+        if (
+            summary["missing_in_target_count"] > 0
+            or summary["extra_in_target_count"] > 0
+            or summary["mismatch_count"] > 0
+        ):
+            raise AssertionError(f"Record-level comparison failed: {summary}")
+
+        return summary
+
+    @staticmethod
+    def row_hash_comparison(
+        source_hashes: DataLike,
+        target_hashes: DataLike,
+        key_columns: Sequence[str],
+        hash_column: str = "row_hash",
+        max_mismatch_rows: int = 10,
+        raise_on_mismatch: bool = True,
+    ) -> Dict[str, Any]:
+        """Compare per-key row fingerprints instead of full rows.
+
+        Both inputs hold ``key_columns`` plus ``hash_column``. Keys whose hashes
+        differ are reported in ``sample_hash_mismatches`` so callers can fetch
+        the full rows for just those keys. Set ``raise_on_mismatch=False`` to get
+        the summary back (with ``passed``) instead of an ``AssertionError``.
+        """
+        source_df = PredefinedValidations._to_dataframe(source_hashes, dataset_name="source_hashes")
+        target_df = PredefinedValidations._to_dataframe(target_hashes, dataset_name="target_hashes")
+
+        required = list(key_columns) + [hash_column]
+        PredefinedValidations._assert_columns_exist(source_df, required, "source_hashes")
+        PredefinedValidations._assert_columns_exist(target_df, required, "target_hashes")
+
+        merge_df = source_df[required].merge(
+            target_df[required],
             on=list(key_columns),
             how="outer",
             suffixes=("_source", "_target"),
             indicator=True,
         )
-
         missing_in_target = merge_df[merge_df["_merge"] == "left_only"][list(key_columns)]
         extra_in_target = merge_df[merge_df["_merge"] == "right_only"][list(key_columns)]
-
-        both_df = merge_df[merge_df["_merge"] == "both"].copy()
-        mismatch_records: List[Dict[str, Any]] = []
-
-        for col in compare_columns:
-            source_col = f"{col}_source"
-            target_col = f"{col}_target"
-
-            left = PredefinedValidations._normalize_series(both_df[source_col])
-            right = PredefinedValidations._normalize_series(both_df[target_col])
-
-            diff_mask = ~(left.eq(right) | (left.isna() & right.isna()))
-            if diff_mask.any():
-                diff_rows = both_df.loc[diff_mask, list(key_columns) + [source_col, target_col]].head(
-                    max_mismatch_rows
-                )
-                mismatch_records.extend(diff_rows.to_dict(orient="records"))
+        both_df = merge_df[merge_df["_merge"] == "both"]
+        mismatched = both_df[
+            both_df[f"{hash_column}_source"] != both_df[f"{hash_column}_target"]
+        ][list(key_columns)]
 
         summary = {
+            "source_key_count": int(len(source_df)),
+            "target_key_count": int(len(target_df)),
             "missing_in_target_count": int(len(missing_in_target)),
             "extra_in_target_count": int(len(extra_in_target)),
-            "mismatch_count": int(len(mismatch_records)),
+            "hash_mismatch_count": int(len(mismatched)),
             "sample_missing_in_target": missing_in_target.head(max_mismatch_rows).to_dict(orient="records"),
             "sample_extra_in_target": extra_in_target.head(max_mismatch_rows).to_dict(orient="records"),
-            "sample_mismatches": mismatch_records[:max_mismatch_rows],
+            "sample_hash_mismatches": mismatched.head(max_mismatch_rows).to_dict(orient="records"),
         }
+        summary["passed"] = not (
+            summary["missing_in_target_count"]
+            or summary["extra_in_target_count"]
+            or summary["hash_mismatch_count"]
+        )
 
-        if (
-            summary["missing_in_target_count"] > 0
-            or summary["extra_in_target_count"] > 0
-            or summary["mismatch_count"] > 0
-        ):
-            raise AssertionError(f"Record-level comparison failed: {summary}")
+        if raise_on_mismatch and not summary["passed"]:
+            raise AssertionError(f"Row-hash comparison failed: {summary}")
 
         return summary
 
@@ -463,29 +768,25 @@ class PredefinedValidations:
         PredefinedValidations._assert_columns_exist(source_df, required_cols, "source_data")
         PredefinedValidations._assert_columns_exist(target_df, required_cols, "target_data")
 
-        source_df = source_df.copy()
-        target_df = target_df.copy()
-
-        source_df[watermark_column] = pd.to_datetime(source_df[watermark_column], errors="coerce")
-        target_df[watermark_column] = pd.to_datetime(target_df[watermark_column], errors="coerce")
+        source_watermark = pd.to_datetime(source_df[watermark_column], errors="coerce")
+        target_watermark = pd.to_datetime(target_df[watermark_column], errors="coerce")
 
-        if source_df[watermark_column].isna().any():
+        if source_watermark.isna().any():
             raise AssertionError(
                 f"Source contains invalid datetime values in watermark column '{watermark_column}'."
             )
-        if target_df[watermark_column].isna().any():
+        if target_watermark.isna().any():
             raise AssertionError(
                 f"Target contains invalid datetime values in watermark column '{watermark_column}'."
             )
 
-        start = pd.to_datetime(delta_start) if delta_start is not None else source_df[watermark_column].min()
-        end = pd.to_datetime(delta_end) if delta_end is not None else source_df[watermark_column].max()
+        start = pd.to_datetime(delta_start) if delta_start is not None else source_watermark.min()
+        end = pd.to_datetime(delta_end) if delta_end is not None else source_watermark.max()
 
-        source_delta = source_df[
-            (source_df[watermark_column] >= start) & (source_df[watermark_column] <= end)
-        ]
-        target_delta = target_df[
-            (target_df[watermark_column] >= start) & (target_df[watermark_column] <= end)
+        source_in_range = (source_watermark >= start) & (source_watermark <= end)
+        source_delta = source_df.loc[source_in_range, list(key_columns)]
+        target_delta = target_df.loc[
+            (target_watermark >= start) & (target_watermark <= end), list(key_columns)
         ]
 
         if source_delta.empty and not allow_empty_delta:
@@ -493,8 +794,8 @@ class PredefinedValidations:
                 f"No source delta records found in range [{start}, {end}] for watermark '{watermark_column}'."
             )
 
-        source_keys = set(map(tuple, source_delta[list(key_columns)].drop_duplicates().to_records(index=False)))
-        target_keys = set(map(tuple, target_delta[list(key_columns)].drop_duplicates().to_records(index=False)))
+        source_keys = set(map(tuple, source_delta.drop_duplicates().to_records(index=False)))
+        target_keys = set(map(tuple, target_delta.drop_duplicates().to_records(index=False)))
 
         missing_keys = source_keys - target_keys
         extra_keys = target_keys - source_keys
@@ -502,6 +803,7 @@ class PredefinedValidations:
         summary = {
             "delta_start": str(start),
             "delta_end": str(end),
+            "max_source_watermark": str(source_watermark[source_in_range].max()) if source_in_range.any() else None,
             "source_delta_rows": int(len(source_delta)),
             "target_delta_rows": int(len(target_delta)),
             "missing_key_count": int(len(missing_keys)),
@@ -594,7 +896,7 @@ class PredefinedValidations:
         df = PredefinedValidations._to_dataframe(data, dataset_name="data")
         PredefinedValidations._assert_columns_exist(df, [date_column], "data")
 
-        dates = pd.to_datetime(df[date_column], errors="coerce")
+        dates = PredefinedValidations._datetime_column(df, date_column)
         if not allow_nulls and dates.isna().any():
             raise AssertionError(
                 f"Date range validation failed: invalid or NULL dates found in '{date_column}'."
@@ -635,8 +937,8 @@ class PredefinedValidations:
         counts: Dict[str, int] = {}
 
         for col in columns:
-            numeric_col = pd.to_numeric(df[col], errors="coerce")
-            if numeric_col.isna().all() and not df[col].isna().all():
+            numeric_col = PredefinedValidations._numeric_column(df, col)
+            if numeric_col.isna().all() and not PredefinedValidations._null_mask(df, col).all():
                 raise AssertionError(
                     f"Negative value validation failed: column '{col}' contains non-numeric values."
                 )
@@ -669,6 +971,7 @@ class PredefinedValidations:
         target_data: DataLike,
         group_columns: Sequence[str],
         tolerance: float = 0.0,
+        max_mismatch_rows: int = 10,
     ) -> Dict[str, Any]:
         """
         Validate grouped distribution between source and target datasets.
@@ -687,36 +990,75 @@ class PredefinedValidations:
         PredefinedValidations._assert_columns_exist(source_df, group_columns, "source_data")
         PredefinedValidations._assert_columns_exist(target_df, group_columns, "target_data")
 
-        source_group = source_df.groupby(list(group_columns)).size().reset_index(name="source_count")
-        target_group = target_df.groupby(list(group_columns)).size().reset_index(name="target_count")
-
-        merged = source_group.merge(
-            target_group,
-            on=list(group_columns),
-            how="outer"
-        ).fillna(0)
-
-        mismatches = []
-
-        for _, row in merged.iterrows():
-            source_count = float(row["source_count"])
-            target_count = float(row["target_count"])
+        def _non_null_groups(df: pd.DataFrame) -> pd.DataFrame:
+            sizes = PredefinedValidations._group_sizes(df, group_columns)
+            null_keys = sizes.index.to_frame(index=False).isna().any(axis=1).to_numpy()
+            return sizes[~null_keys].reset_index(name="row_count")
+
+        return PredefinedValidations.group_count_comparison(
+            _non_null_groups(source_df),
+            _non_null_groups(target_df),
+            group_columns,
+            tolerance=tolerance,
+            max_mismatch_rows=max_mismatch_rows,
+        )
 
-            if source_count == 0 and target_count == 0:
-                continue
+    @staticmethod
+    def group_count_comparison(
+        source_counts: DataLike,
+        target_counts: DataLike,
+        group_columns: Sequence[str],
+        count_column: str = "row_count",
+        tolerance: float = 0.0,
+        max_mismatch_rows: int = 10,
+    ) -> Dict[str, Any]:
+        """Compare precomputed per-group row counts (e.g. pushed down to SQL).
 
-            if source_count == 0 and target_count != 0:
-                mismatches.append(dict(row))
-                continue
+        tolerance:
+            Allowed percentage difference per group.
+        max_mismatch_rows:
+            Number of worst groups reported, ordered by relative then absolute drift.
+        """
+        source_df = PredefinedValidations._to_dataframe(source_counts, dataset_name="source_counts")
+        target_df = PredefinedValidations._to_dataframe(target_counts, dataset_name="target_counts")
 
-            percentage_diff = abs(target_count - source_count) / source_count * 100
+        required = list(group_columns) + [count_column]
+        PredefinedValidations._assert_columns_exist(source_df, required, "source_counts")
+        PredefinedValidations._assert_columns_exist(target_df, required, "target_counts")
 
-            if percentage_diff > tolerance:
-                mismatches.append(dict(row))
+        source_group = source_df[required].rename(columns={count_column: "source_count"})
+        target_group = target_df[required].rename(columns={count_column: "target_count"})
 
-        if mismatches:
+        merged = source_group.merge(
+            target_group,
+            on=list(group_columns),
+            how="outer"
+        )
+        source = pd.to_numeric(merged["source_count"], errors="coerce").fillna(0).to_numpy(dtype=float)
+        target = pd.to_numeric(merged["target_count"], errors="coerce").fillna(0).to_numpy(dtype=float)
+
+        absolute_drift = np.abs(target - source)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # A group missing from source drifts infinitely; empty on both sides never fails.
+            relative_drift = np.where(source == 0, np.inf, absolute_drift / source * 100)
+        both_empty = (source == 0) & (target == 0)
+        relative_drift[both_empty] = 0.0
+        mismatch_mask = (relative_drift > tolerance) & ~both_empty
+
+        if mismatch_mask.any():
+            positions = np.flatnonzero(mismatch_mask)
+            order = np.lexsort((-absolute_drift[positions], -relative_drift[positions]))
+            worst = positions[order[:max_mismatch_rows]]
+            worst_groups = merged.iloc[worst][list(group_columns)].assign(
+                source_count=source[worst],
+                target_count=target[worst],
+                absolute_drift=absolute_drift[worst],
+                relative_drift_pct=relative_drift[worst],
+            )
             raise AssertionError(
-                f"Group distribution validation failed. Sample mismatches: {mismatches[:10]}"
+                f"Group distribution validation failed for {int(mismatch_mask.sum())} of "
+                f"{len(merged)} groups. Top mismatches by drift: "
+                f"{worst_groups.to_dict(orient='records')}"
             )
 
         return {
@@ -734,6 +1076,8 @@ class PredefinedValidations:
         source_transformers: Optional[Mapping[str, Callable[[pd.Series], pd.Series]]] = None,
         target_transformers: Optional[Mapping[str, Callable[[pd.Series], pd.Series]]] = None,
         max_mismatch_rows: int = 10,
+        source_table: Optional[str] = None,
+        target_table: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Compare custom mapped columns between source and target on business keys.
 
@@ -743,6 +1087,8 @@ class PredefinedValidations:
             Mapping of source column -> target column.
         source_transformers / target_transformers:
             Optional per-column transformers applied before comparison.
+        source_table / target_table:
+            Cache keys for per-column normalization kinds (see ``record_level_dataframe_comparison``).
         """
         source_df = PredefinedValidations._to_dataframe(source_data, dataset_name="source_data")
         target_df = PredefinedValidations._to_dataframe(target_data, dataset_name="target_data")
@@ -759,16 +1105,24 @@ class PredefinedValidations:
         source_transformers = dict(source_transformers or {})
         target_transformers = dict(target_transformers or {})
 
-        source_view = source_df[list(key_columns) + source_cols].copy()
-        target_view = target_df[list(key_columns) + target_cols].copy()
-
-        for source_col, transformer in source_transformers.items():
-            if source_col in source_view.columns:
-                source_view[source_col] = transformer(source_view[source_col])
+        source_view = source_df[list(key_columns) + source_cols]
+        target_view = target_df[list(key_columns) + target_cols]
 
-        for target_col, transformer in target_transformers.items():
-            if target_col in target_view.columns:
-                target_view[target_col] = transformer(target_view[target_col])
+        # assign() returns a new frame, so transformers never write into the inputs.
+        source_updates = {
+            col: transformer(source_view[col])
+            for col, transformer in source_transformers.items()
+            if col in source_view.columns
+        }
+        if source_updates:
+            source_view = source_view.assign(**source_updates)
+        target_updates = {
+            col: transformer(target_view[col])
+            for col, transformer in target_transformers.items()
+            if col in target_view.columns
+        }
+        if target_updates:
+            target_view = target_view.assign(**target_updates)
 
         merge_df = source_view.merge(
             target_view,
@@ -777,11 +1131,21 @@ class PredefinedValidations:
             suffixes=("_source", "_target"),
         )
 
+        # Transformed columns are inferred per call; their output is not tied to the table schema.
+        normalization_plan = PredefinedValidations._normalization_plan(
+            source_view,
+            target_view,
+            list(column_mapping.items()),
+            None if source_transformers else source_table,
+            None if target_transformers else target_table,
+        )
         mismatches: List[Dict[str, Any]] = []
 
         for source_col, target_col in column_mapping.items():
-            left = PredefinedValidations._normalize_series(merge_df[source_col])
-            right = PredefinedValidations._normalize_series(merge_df[target_col])
+            source_kind, target_kind = normalization_plan[source_col]
+            left, right = PredefinedValidations._normalize_pair(
+                merge_df[source_col], merge_df[target_col], source_kind, target_kind
+            )
 
             diff_mask = ~(left.eq(right) | (left.isna() & right.isna()))
             if diff_mask.any():
@@ -0,0 +1,220 @@
+"""Opt-in on-disk cache of Fabric query results for fast re-runs during triage.
+
+Entries are keyed by (SQL endpoint, resolved query text, freshness token) and
+stored column-wise as a gzip-compressed pickle of ``(columns, values)``, next to
+a small JSON sidecar with the entry's metadata. Entries older than the TTL are
+dropped on read; when the cache grows beyond its size limit the least recently
+used entries are evicted.
+"""
+
+import configparser
+import gzip
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+DATA_SUFFIX = ".pkl.gz"
+META_SUFFIX = ".json"
+DEFAULT_CACHE_DIR = ".query_cache"
+
+
+def cache_key(endpoint: str, query: str, freshness_token: str = "") -> str:
+    """Stable key for one endpoint/query/token combination."""
+    material = "\x1f".join((endpoint or "", (query or "").strip(), freshness_token or ""))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class QueryResultCache:
+    """Columnar query results on disk with a TTL and size-based LRU eviction.
+
+    The data file's modification time records the last use, so a cache hit only
+    touches the file instead of rewriting its metadata.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        ttl_seconds: float = 0,
+        max_bytes: int = 0,
+        freshness_token: str = "",
+    ):
+        self.directory = directory
+        self.ttl_seconds = float(ttl_seconds or 0)
+        self.max_bytes = int(max_bytes or 0)
+        self.freshness_token = freshness_token or ""
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.directory, key)
+        return base + DATA_SUFFIX, base + META_SUFFIX
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created_at > self.ttl_seconds
+
+    def _remove(self, key: str) -> None:
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _read_metadata(meta_path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(meta_path, "r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+    def get(
+        self, endpoint: str, query: str, freshness_token: Optional[str] = None
+    ) -> Optional[Tuple[List[str], List[List[Any]]]]:
+        """Return cached ``(columns, values)`` or None on a miss or expired entry."""
+        token = self.freshness_token if freshness_token is None else freshness_token
+        key = cache_key(endpoint, query, token)
+        data_path, meta_path = self._paths(key)
+        with self._lock:
+            metadata = self._read_metadata(meta_path)
+            if metadata is None or not os.path.exists(data_path):
+                return None
+            if self._expired(metadata["created_at"], time.time()):
+                self._remove(key)
+                return None
+            try:
+                with gzip.open(data_path, "rb") as handle:
+                    columns, values = pickle.load(handle)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                self._remove(key)
+                return None
+            os.utime(data_path)
+            return columns, values
+
+    def put(
+        self,
+        endpoint: str,
+        query: str,
+        columns: List[str],
+        values: List[List[Any]],
+        freshness_token: Optional[str] = None,
+    ) -> str:
+        """Store one result and evict least recently used entries beyond ``max_bytes``."""
+        token = self.freshness_token if freshness_token is None else freshness_token
+        key = cache_key(endpoint, query, token)
+        data_path, meta_path = self._paths(key)
+        with self._lock:
+            # Write to temp files and rename so concurrent readers never see partial entries.
+            tmp_data = f"{data_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_data, "wb", compresslevel=1) as handle:
+                pickle.dump((list(columns), values), handle, protocol=pickle.HIGHEST_PROTOCOL)
+            metadata = {
+                "key": key,
+                "endpoint": endpoint,
+                "query": query.strip(),
+                "freshness_token": token,
+                "created_at": time.time(),
+                "columns": len(columns),
+                "rows": len(values[0]) if values else 0,
+                "bytes": os.path.getsize(tmp_data),
+            }
+            tmp_meta = f"{meta_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_meta, "w", encoding="utf-8") as handle:
+                json.dump(metadata, handle)
+            os.replace(tmp_data, data_path)
+            os.replace(tmp_meta, meta_path)
+            self._evict_to_size()
+        return key
+
+    def _scan(self) -> List[Dict[str, Any]]:
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(META_SUFFIX):
+                continue
+            key = name[: -len(META_SUFFIX)]
+            data_path, meta_path = self._paths(key)
+            metadata = self._read_metadata(meta_path)
+            try:
+                last_used_at = os.path.getmtime(data_path)
+            except OSError:
+                metadata = None
+            if metadata is None:
+                self._remove(key)
+                continue
+            metadata["last_used_at"] = last_used_at
+            entries.append(metadata)
+        return entries
+
+    def _evict_to_size(self) -> None:
+        if self.max_bytes <= 0:
+            return
+        entries = sorted(self._scan(), key=lambda entry: entry["last_used_at"])
+        total = sum(entry["bytes"] for entry in entries)
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(entry["key"])
+            total -= entry["bytes"]
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Metadata for every entry, most recently used first."""
+        with self._lock:
+            entries = self._scan()
+        now = time.time()
+        for entry in entries:
+            entry["expired"] = self._expired(entry["created_at"], now)
+        return sorted(entries, key=lambda entry: entry["last_used_at"], reverse=True)
+
+    def purge(
+        self,
+        older_than_seconds: Optional[float] = None,
+        endpoint: Optional[str] = None,
+        expired_only: bool = False,
+    ) -> int:
+        """Remove matching entries (all entries without filters); returns the number removed."""
+        removed = 0
+        with self._lock:
+            now = time.time()
+            for entry in self._scan():
+                if endpoint is not None and entry["endpoint"] != endpoint:
+                    continue
+                if older_than_seconds is not None and now - entry["created_at"] <= older_than_seconds:
+                    continue
+                if expired_only and not self._expired(entry["created_at"], now):
+                    continue
+                self._remove(entry["key"])
+                removed += 1
+        return removed
+
+
+_caches: Dict[str, QueryResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def load_query_cache(
+    config_file: str = "config/master.properties", force: bool = False
+) -> Optional[QueryResultCache]:
+    """Return the process-wide cache configured in [QUERY_CACHE], or None when disabled.
+
+    ``force`` returns the configured cache even when ENABLED is False, which the
+    inspection CLI uses.
+    """
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    if not force and not config.getboolean("QUERY_CACHE", "ENABLED", fallback=False):
+        return None
+
+    directory = config.get("QUERY_CACHE", "DIRECTORY", fallback="").strip() or DEFAULT_CACHE_DIR
+    ttl_seconds = config.getfloat("QUERY_CACHE", "TTL_SECONDS", fallback=86400)
+    max_bytes = int(config.getfloat("QUERY_CACHE", "MAX_SIZE_MB", fallback=2048) * 1024 * 1024)
+    freshness_token = config.get("QUERY_CACHE", "FRESHNESS_TOKEN", fallback="").strip()
+
+    with _caches_lock:
+        cache = _caches.get(os.path.abspath(directory))
+        if cache is None:
+            cache = QueryResultCache(directory, ttl_seconds, max_bytes, freshness_token)
+            _caches[os.path.abspath(directory)] = cache
+        return cache
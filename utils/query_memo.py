@@ -0,0 +1,185 @@
+"""Run-scoped deduplication of identical Fabric queries.
+
+CSV rows often resolve to the same SQL (the same ``COUNT(*)`` used by several
+validation types, overlapping table lists across lakehouse expansions).
+``QueryMemo`` sits in front of ``FabricClient.execute_query`` and runs each
+distinct (endpoint, query, result format) once per run. Callers asking for a
+query that is still running wait for that execution instead of starting
+another one.
+
+Hit counts are also summed per process, so the report covers the whole
+pytest session rather than one test class.
+"""
+
+import configparser
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Rough per-value size used to budget memoized row-dict results.
+RECORD_VALUE_BYTES = 64
+DEFAULT_MAX_MB = 64
+
+_session_lock = threading.Lock()
+_session_counts = {"requests": 0, "hits": 0, "in_flight_hits": 0}
+
+
+def _count_session(counter: str) -> None:
+    with _session_lock:
+        _session_counts[counter] += 1
+
+
+def _with_rates(counts: Dict[str, int]) -> Dict[str, Any]:
+    hits = counts["hits"] + counts["in_flight_hits"]
+    return {
+        **counts,
+        "executed": counts["requests"] - hits,
+        "hit_rate": hits / counts["requests"] if counts["requests"] else 0.0,
+    }
+
+
+def _format_stats(stats: Dict[str, Any]) -> str:
+    return (
+        f"Query dedup: {stats['requests']} requested, {stats['executed']} executed, "
+        f"{stats['hits'] + stats['in_flight_hits']} reused "
+        f"({stats['in_flight_hits']} joined in flight), hit rate {stats['hit_rate']:.1%}"
+    )
+
+
+def session_stats() -> Dict[str, Any]:
+    """Request and hit counts summed over every memo in this process."""
+    with _session_lock:
+        return _with_rates(dict(_session_counts))
+
+
+def format_session_report() -> str:
+    """One-line dedup summary for the session, or "" when no query went through a memo."""
+    stats = session_stats()
+    return _format_stats(stats) if stats["requests"] else ""
+
+
+def estimate_result_bytes(result: Any) -> int:
+    """Approximate in-memory size of a query result without walking every value."""
+    if isinstance(result, pd.DataFrame):
+        return int(result.memory_usage(index=False).sum())
+    if isinstance(result, dict):
+        return int(sum(np.asarray(values).nbytes for values in result.values()))
+    if isinstance(result, list) and result:
+        return len(result) * max(len(result[0]), 1) * RECORD_VALUE_BYTES
+    return 0
+
+
+def _share(result: Any) -> Any:
+    """Hand each caller its own container so one row cannot reshape another row's result."""
+    if isinstance(result, pd.DataFrame):
+        return result.copy(deep=False)
+    if isinstance(result, (list, dict)):
+        return type(result)(result)
+    return result
+
+
+class QueryMemo:
+    """Collapse identical queries, including in-flight ones, into one execution.
+
+    Completed results are kept up to ``max_bytes`` (least recently used dropped
+    first; 0 keeps everything). Failed queries are not memoized, so a later row
+    retries them.
+    """
+
+    def __init__(self, max_bytes: int = 0):
+        self.max_bytes = int(max_bytes or 0)
+        self._lock = threading.Lock()
+        self._results: "OrderedDict[Tuple[str, str, str], Tuple[Any, int]]" = OrderedDict()
+        self._in_flight: Dict[Tuple[str, str, str], Future] = {}
+        self._bytes = 0
+        self.requests = 0
+        self.hits = 0
+        self.in_flight_hits = 0
+
+    def execute(self, client, query: str, result_format: str = "records") -> Any:
+        """Return the result of ``client.execute_query`` for this query, running it at most once."""
+        key = (client.sql_endpoint, query.strip(), result_format)
+        with self._lock:
+            self.requests += 1
+            _count_session("requests")
+            cached = self._results.get(key)
+            if cached is not None:
+                self.hits += 1
+                _count_session("hits")
+                self._results.move_to_end(key)
+                return _share(cached[0])
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+            else:
+                self.in_flight_hits += 1
+                _count_session("in_flight_hits")
+
+        if not owner:
+            return _share(future.result())
+
+        try:
+            if result_format == "records":
+                result = client.execute_query(query)
+            else:
+                result = client.execute_query(query, result_format=result_format)
+        except BaseException as exc:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            self._in_flight.pop(key, None)
+            self._remember(key, result)
+        future.set_result(result)
+        return _share(result)
+
+    def prime(self, endpoint: str, query: str, result_format: str, result: Any) -> None:
+        """Store a result obtained elsewhere (e.g. a batched statement) as if the query had run."""
+        with self._lock:
+            self._remember((endpoint, query.strip(), result_format), result)
+
+    def _remember(self, key: Tuple[str, str, str], result: Any) -> None:
+        size = estimate_result_bytes(result)
+        if self.max_bytes and size > self.max_bytes:
+            return
+        self._results[key] = (result, size)
+        self._bytes += size
+        while self.max_bytes and self._bytes > self.max_bytes:
+            _, (_, evicted_size) = self._results.popitem(last=False)
+            self._bytes -= evicted_size
+
+    def clear(self) -> None:
+        """Drop memoized results; counters are kept."""
+        with self._lock:
+            self._results.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = {"requests": self.requests, "hits": self.hits, "in_flight_hits": self.in_flight_hits}
+            return {
+                **_with_rates(counts),
+                "memoized_results": len(self._results),
+                "memoized_bytes": self._bytes,
+            }
+
+    def format_report(self) -> str:
+        return _format_stats(self.stats())
+
+
+def load_query_memo(config_file: str = "config/master.properties") -> Optional[QueryMemo]:
+    """Return a new memo from [TESTING] QUERY_DEDUP_* settings, or None when disabled."""
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    if not config.getboolean("TESTING", "QUERY_DEDUP_ENABLED", fallback=True):
+        return None
+    max_mb = config.getfloat("TESTING", "QUERY_DEDUP_MAX_MB", fallback=DEFAULT_MAX_MB)
+    return QueryMemo(max_bytes=int(max_mb * 1024 * 1024))
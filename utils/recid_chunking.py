@@ -0,0 +1,86 @@
+"""Split large ``{recid_list}`` substitutions into bounded chunks and merge the results.
+
+A dependent query such as ``SELECT ... WHERE recid IN ({recid_list})`` would
+otherwise embed every recid in one SQL literal. Row-level queries return the
+same rows whether the list is sent at once or in chunks, so the chunk results
+are concatenated. Only a plain ``IN ({recid_list})`` filter in the top-level
+WHERE clause of a SELECT is chunked: queries that aggregate, deduplicate,
+limit rows or negate the list (``NOT IN``, ``NOT EXISTS``) would return
+per-chunk results that do not add up.
+"""
+
+import configparser
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List
+
+import pandas as pd
+
+RECID_LIST_PLACEHOLDER = "{recid_list}"
+CHUNK_UNSAFE_PATTERN = re.compile(
+    r"\b(?:COUNT|COUNT_BIG|SUM|AVG|MIN|MAX|STRING_AGG)\s*\(|\bOVER\s*\("
+    r"|\b(?:GROUP\s+BY|DISTINCT|TOP|OFFSET|HAVING|UNION|EXCEPT|INTERSECT|NOT\s+EXISTS)\b",
+    re.IGNORECASE,
+)
+_POSITIVE_IN_PREFIX = re.compile(r"(\bNOT\s+)?\bIN\s*\(\s*$", re.IGNORECASE)
+_WHERE = re.compile(r"\bWHERE\b", re.IGNORECASE)
+
+
+def load_recid_chunk_settings(config_file: str = "config/master.properties") -> Dict[str, int]:
+    """Read RECID_CHUNK_SIZE / RECID_CHUNK_WORKERS from the [TESTING] section."""
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    return {
+        "chunk_size": max(0, config.getint("TESTING", "RECID_CHUNK_SIZE", fallback=5000)),
+        "max_workers": max(1, config.getint("TESTING", "RECID_CHUNK_WORKERS", fallback=4)),
+    }
+
+
+def _paren_depth(text: str) -> int:
+    return text.count("(") - text.count(")")
+
+
+def can_chunk_query(query: str) -> bool:
+    """True when ``query`` returns the union of its per-chunk results.
+
+    The query must be a SELECT whose only ``{recid_list}`` sits in a positive
+    ``IN (...)`` of its top-level WHERE clause, with no aggregates or other
+    row-set operations.
+    """
+    if query.count(RECID_LIST_PLACEHOLDER) != 1 or not re.match(r"\s*SELECT\b", query, re.IGNORECASE):
+        return False
+    if CHUNK_UNSAFE_PATTERN.search(query):
+        return False
+    prefix, suffix = query.split(RECID_LIST_PLACEHOLDER)
+    membership = _POSITIVE_IN_PREFIX.search(prefix)
+    if membership is None or membership.group(1) or not re.match(r"\s*\)", suffix):
+        return False
+    # The IN list is the only open parenthesis, so the filter is not inside a subquery.
+    if _paren_depth(prefix) != 1:
+        return False
+    return any(_paren_depth(prefix[:where.start()]) == 0 for where in _WHERE.finditer(prefix))
+
+
+def chunk_recids(recids: Iterable[Any], chunk_size: int) -> List[List[Any]]:
+    """Distinct recids (first-seen order) in chunks of at most ``chunk_size``."""
+    distinct = list(dict.fromkeys(recids))
+    size = max(1, int(chunk_size))
+    return [distinct[start:start + size] for start in range(0, len(distinct), size)]
+
+
+def run_chunked(run_chunk: Callable[[List[Any]], Any], chunks: List[List[Any]], max_workers: int = 1) -> List[Any]:
+    """Run ``run_chunk`` for every chunk, at most ``max_workers`` at a time; results keep chunk order."""
+    if max_workers <= 1 or len(chunks) <= 1:
+        return [run_chunk(chunk) for chunk in chunks]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks)), thread_name_prefix="recid-chunk") as pool:
+        return list(pool.map(run_chunk, chunks))
+
+
+def merge_chunk_results(results: List[Any]) -> Any:
+    """Concatenate per-chunk results (row-dict lists or DataFrames) into one result."""
+    if results and all(isinstance(result, pd.DataFrame) for result in results):
+        return pd.concat(results, ignore_index=True)
+    merged: List[Any] = []
+    for result in results:
+        merged.extend(result or [])
+    return merged
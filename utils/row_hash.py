@@ -0,0 +1,228 @@
+"""Per-key row fingerprints for source/target reconciliation.
+
+Instead of pulling every compared column across the wire, each side returns
+``(key columns, row_hash)`` pairs. Hashes are computed on the SQL endpoint when
+the compared columns are known (T-SQL ``HASHBYTES``), or locally from full rows
+as a fallback. Only keys whose hashes differ are fetched in full, for samples.
+
+Both sides of one comparison must be hashed the same way: server hashes are
+hex strings, local hashes are unsigned 64-bit integers.
+"""
+
+import datetime
+from decimal import Decimal
+from numbers import Number
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from utils.predefined_validations import PredefinedValidations
+
+ROW_HASH_COLUMN = "row_hash"
+NULL_MARKER = "<NULL>"
+HASH_MODES = ("auto", "server", "local")
+# T-SQL CONCAT_WS takes the separator plus 2 to 253 values.
+CONCAT_WS_MAX_VALUES = 253
+# Server hashes compare numbers at this many decimal places, so 1.5 and 1.50 agree.
+NUMERIC_HASH_SCALE = 6
+
+
+def quote_identifier(column: str) -> str:
+    """Bracket-quote a T-SQL identifier."""
+    return "[" + str(column).replace("]", "]]") + "]"
+
+
+def _concat_ws(expressions: List[str]) -> str:
+    """Join ``expressions`` with ``|``, nesting CONCAT_WS calls to respect its arity."""
+    if len(expressions) == 1:
+        return expressions[0]
+    if len(expressions) > CONCAT_WS_MAX_VALUES:
+        chunks = [
+            expressions[start:start + CONCAT_WS_MAX_VALUES]
+            for start in range(0, len(expressions), CONCAT_WS_MAX_VALUES)
+        ]
+        return _concat_ws([_concat_ws(chunk) for chunk in chunks])
+    return f"CONCAT_WS(N'|', {', '.join(expressions)})"
+
+
+def server_type_kind(type_code: Any) -> str:
+    """Hash kind of a result column from its driver type code (a Python type for pyodbc)."""
+    if isinstance(type_code, type):
+        if issubclass(type_code, datetime.date):
+            return "datetime"
+        if issubclass(type_code, (Number, Decimal)):
+            return "numeric"
+    return "text"
+
+
+def server_column_kinds(
+    source_types: Dict[str, Any],
+    target_types: Dict[str, Any],
+    columns: Sequence[str],
+) -> Dict[str, str]:
+    """Agree on one hash kind per column from both sides' result types.
+
+    A text column compared with a numeric or datetime one takes the other
+    side's kind; its values are parsed with ``TRY_CAST`` and kept as text when
+    they do not parse. Numeric against datetime is hashed as text.
+    """
+    kinds: Dict[str, str] = {}
+    for column in columns:
+        pair = {server_type_kind(source_types.get(column)), server_type_kind(target_types.get(column))}
+        typed = pair - {"text"}
+        kinds[column] = typed.pop() if len(typed) == 1 else "text"
+    return kinds
+
+
+def _server_hash_expression(column: str, kind: str) -> str:
+    """Canonical text of one column, matching the local normalization of its kind."""
+    quoted = quote_identifier(column)
+    text = f"LTRIM(RTRIM(CAST({quoted} AS NVARCHAR(MAX))))"
+    if kind == "numeric":
+        canonical = f"COALESCE(CONVERT(VARCHAR(64), TRY_CAST({quoted} AS DECIMAL(38, {NUMERIC_HASH_SCALE}))), {text})"
+    elif kind == "datetime":
+        canonical = f"COALESCE(CONVERT(VARCHAR(33), TRY_CAST({quoted} AS DATETIME2(6)), 126), {text})"
+    else:
+        canonical = text
+    return f"COALESCE({canonical}, N'{NULL_MARKER}')"
+
+
+def build_row_hash_query(
+    query: str,
+    key_columns: Sequence[str],
+    compare_columns: Sequence[str],
+    column_kinds: Optional[Dict[str, str]] = None,
+) -> str:
+    """Wrap ``query`` so the endpoint returns key columns plus a SHA2_256 row hash.
+
+    ``column_kinds`` (see ``server_column_kinds``) picks each column's canonical
+    form: numbers at a fixed scale, datetimes as ISO 8601 (style 126), text
+    trimmed. Columns without a kind are hashed as text.
+
+    The wrapped query is used as a derived table, so it must not end with
+    ``ORDER BY`` (without ``TOP``) or start with a CTE.
+    """
+    if not compare_columns:
+        raise ValueError("compare_columns are required for server-side row hashing.")
+    column_kinds = column_kinds or {}
+    keys = ", ".join(quote_identifier(column) for column in key_columns)
+    hashed = _concat_ws([
+        _server_hash_expression(column, column_kinds.get(column, "text"))
+        for column in compare_columns
+    ])
+    return (
+        f"SELECT {keys}, "
+        f"CONVERT(VARCHAR(64), HASHBYTES('SHA2_256', {hashed}), 2) "
+        f"AS {ROW_HASH_COLUMN} "
+        f"FROM ({query.strip().rstrip(';')}) AS fingerprint_src"
+    )
+
+
+def _sql_literal(value: Any) -> str:
+    if isinstance(value, (bool, np.bool_)):
+        return "1" if value else "0"
+    if isinstance(value, (Number, Decimal)):
+        return str(value)
+    return "N'" + str(value).replace("'", "''") + "'"
+
+
+def build_key_filter_query(
+    query: str,
+    key_columns: Sequence[str],
+    keys: Iterable[Sequence[Any]],
+) -> str:
+    """Restrict ``query`` to the given key tuples (used to fetch mismatch samples)."""
+    keys = [tuple(key) for key in keys]
+    if not keys:
+        raise ValueError("At least one key is required to build a key filter query.")
+    if len(key_columns) == 1:
+        values = ", ".join(_sql_literal(key[0]) for key in keys)
+        condition = f"{quote_identifier(key_columns[0])} IN ({values})"
+    else:
+        condition = " OR ".join(
+            "(" + " AND ".join(
+                f"{quote_identifier(column)} = {_sql_literal(value)}"
+                for column, value in zip(key_columns, key)
+            ) + ")"
+            for key in keys
+        )
+    return f"SELECT * FROM ({query.strip().rstrip(';')}) AS fingerprint_src WHERE {condition}"
+
+
+def resolve_hash_mode(hash_mode: Optional[str], compare_columns: Sequence[str]) -> str:
+    """Pick server hashing when the compared columns are known, local otherwise."""
+    mode = str(hash_mode or "auto").strip().lower()
+    if mode not in HASH_MODES:
+        raise ValueError(f"Unsupported hash_mode '{hash_mode}'. Use one of {list(HASH_MODES)}.")
+    if mode == "auto":
+        return "server" if compare_columns else "local"
+    if mode == "server" and not compare_columns:
+        raise ValueError("hash_mode=server requires compare_columns.")
+    return mode
+
+
+def _canonical_column(series: pd.Series, kind: str) -> pd.Series:
+    if kind == "numeric":
+        # "+ 0.0" folds -0.0 into 0.0 so equal values hash identically.
+        return pd.to_numeric(series, errors="coerce").astype("float64") + 0.0
+    if kind == "datetime":
+        return pd.to_datetime(series, errors="coerce", utc=True)
+    text = series.astype(object).where(series.notna(), NULL_MARKER)
+    return text.astype(str).str.strip()
+
+
+def local_column_kinds(
+    source_df: pd.DataFrame,
+    target_df: pd.DataFrame,
+    columns: Sequence[str],
+    source_table: Optional[str] = None,
+    target_table: Optional[str] = None,
+) -> Dict[str, str]:
+    """Agree on one canonical kind per column so both sides hash comparably.
+
+    A column is only hashed as numeric when every non-NULL value on both sides
+    parses as a number; otherwise coercion would turn the odd values into NaN
+    on both sides and hide differences between them.
+    """
+    kinds: Dict[str, str] = {}
+    for column in columns:
+        pair = ((source_df[column], source_table), (target_df[column], target_table))
+        if all(pd.api.types.is_datetime64_any_dtype(series) for series, _ in pair):
+            kinds[column] = "datetime"
+        elif all(
+            pd.api.types.is_numeric_dtype(series)
+            or (
+                PredefinedValidations._normalization_kind(series, table, column) == "numeric"
+                and _parses_as_numeric(series)
+            )
+            for series, table in pair
+        ):
+            kinds[column] = "numeric"
+        else:
+            kinds[column] = "text"
+    return kinds
+
+
+def _parses_as_numeric(series: pd.Series) -> bool:
+    return not (pd.to_numeric(series, errors="coerce").isna() & series.notna()).any()
+
+
+def compute_row_hashes(
+    df: pd.DataFrame,
+    key_columns: Sequence[str],
+    column_kinds: Dict[str, str],
+) -> pd.DataFrame:
+    """Return ``key_columns`` + uint64 ``row_hash`` computed locally from full rows."""
+    canonical = pd.DataFrame(
+        {column: _canonical_column(df[column], kind) for column, kind in column_kinds.items()},
+        index=df.index,
+    )
+    hashes = df[list(key_columns)].copy()
+    hashes[ROW_HASH_COLUMN] = pd.util.hash_pandas_object(canonical, index=False).to_numpy()
+    return hashes.reset_index(drop=True)
+
+
+def key_tuples(records: List[Dict[str, Any]], key_columns: Sequence[str]) -> List[tuple]:
+    """Extract key tuples from summary sample records."""
+    return [tuple(record[column] for column in key_columns) for record in records]
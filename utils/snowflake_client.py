@@ -3,12 +3,17 @@ import logging
 from contextlib import contextmanager
 import configparser
 import os
+from utils.connection_pool import get_pool, load_pool_settings
+from utils.db_backend import DBAPIBackend
 
-class SnowflakeClient:
+class SnowflakeClient(DBAPIBackend):
+    paramstyle = "format"
+    
     def __init__(self, config_file="config/master.properties"):
         self.logger = logging.getLogger(__name__)
         self.config = self._load_config(config_file)
         self.connection_params = self._get_connection_params()
+        self.pool_settings = load_pool_settings(config_file)
     
     def _load_config(self, config_file):
         """Load configuration from properties file"""
@@ -28,19 +33,30 @@ class SnowflakeClient:
             'schema': self.config.get('DATABASE', 'SNOWFLAKE_SCHEMA', fallback='')
         }
     
+    @property
+    def pool(self):
+        """Shared pool for this account/user/warehouse/database/schema"""
+        params = self.connection_params
+        return get_pool(
+            ('snowflake', params['account'], params['user'], params['warehouse'], params['database'], params['schema']),
+            lambda: snowflake.connector.connect(**params),
+            reset=lambda conn: conn.rollback(),
+            is_usable=lambda conn: not conn.is_closed(),
+            **self.pool_settings
+        )
+    
     @contextmanager
     def get_connection(self):
         """Get Snowflake connection"""
-        conn = None
         try:
-            conn = snowflake.connector.connect(**self.connection_params)
-            yield conn
+            with self.pool.connection() as conn:
+                yield conn
         except Exception as e:
             self.logger.error(f"Snowflake connection failed: {e}")
             raise
-        finally:
-            if conn:
-                conn.close()
+    
+    def _backend_connection(self):
+        return self.get_connection()
     
     def execute_query(self, query: str, params: tuple = None):
         """Execute query on Snowflake"""
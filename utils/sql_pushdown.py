@@ -0,0 +1,184 @@
+"""Compile aggregate and distribution validations into T-SQL run on the endpoint.
+
+Instead of fetching raw rows and computing SUM/MIN/MAX or ``groupby().size()``
+in pandas, the source/target queries are wrapped so each endpoint returns only
+the aggregate row or the per-group counts. Results are converted back into the
+shapes ``PredefinedValidations`` compares.
+
+Pushdown is opt-in, and a query is only wrapped when it can safely become a
+derived table whose output columns are known (see ``can_wrap_query``).
+"""
+
+import configparser
+import math
+import re
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import pandas as pd
+
+from utils.row_hash import quote_identifier
+
+ROW_COUNT_COLUMN = "row_count"
+SUPPORTED_AGGREGATES = ("sum", "min", "max")
+
+
+_STRING_LITERAL = re.compile(r"N?'(?:[^']|'')*'")
+_SELECT_PREFIX = re.compile(r"\s*SELECT\s+(?:DISTINCT\s+)?(?:TOP\s*\(?\s*\d+\s*\)?\s*(?:PERCENT\s+)?)?", re.IGNORECASE)
+_ALIAS = re.compile(r"\bAS\s+(\[[^\]]+\]|\"[^\"]+\"|\w+)\s*$", re.IGNORECASE)
+_COLUMN_REFERENCE = re.compile(r"(?:(?:\[[^\]]+\]|\w+)\s*\.\s*)*(\[[^\]]+\]|\w+)")
+
+
+def load_pushdown_setting(config_file: str = "config/master.properties") -> bool:
+    """Read SQL_PUSHDOWN_ENABLED from the [TESTING] section (off unless set)."""
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    return config.getboolean("TESTING", "SQL_PUSHDOWN_ENABLED", fallback=False)
+
+
+def _top_level(query: str) -> str:
+    """``query`` with string literals blanked and parenthesized text replaced by spaces."""
+    text = _STRING_LITERAL.sub("''", query)
+    chars, depth = [], 0
+    for char in text:
+        if char == ")":
+            depth -= 1
+        chars.append(char if depth == 0 else " ")
+        if char == "(":
+            depth += 1
+    return "".join(chars)
+
+
+def _split_top_level(text: str) -> List[str]:
+    items, depth, start = [], 0, 0
+    for index, char in enumerate(text):
+        depth += {"(": 1, ")": -1}.get(char, 0)
+        if char == "," and depth == 0:
+            items.append(text[start:index])
+            start = index + 1
+    items.append(text[start:])
+    return items
+
+
+def output_columns(query: str) -> Optional[List[str]]:
+    """Column names a plain ``SELECT`` returns, or ``None`` when they cannot be read from the text.
+
+    ``SELECT *`` gives ``None``; expressions without an alias are left out.
+    """
+    text = _STRING_LITERAL.sub("''", query.strip().rstrip(";"))
+    prefix = _SELECT_PREFIX.match(text)
+    from_match = re.search(r"\bFROM\b", _top_level(text), re.IGNORECASE)
+    if prefix is None or from_match is None:
+        return None
+    columns = []
+    for item in _split_top_level(text[prefix.end():from_match.start()]):
+        item = item.strip()
+        if item == "*" or item.endswith(".*"):
+            return None
+        alias = _ALIAS.search(item)
+        reference = _COLUMN_REFERENCE.fullmatch(item)
+        name = alias.group(1) if alias else reference.group(1) if reference else None
+        if name:
+            columns.append(name.strip('[]"'))
+    return columns
+
+
+def can_wrap_query(query: str, columns: Sequence[str]) -> bool:
+    """True when ``query`` can run as a derived table that returns every name in ``columns``.
+
+    CTEs cannot be nested in a derived table, a top-level ``ORDER BY`` is
+    rejected there, and a column the wrapper refers to must be one the query
+    visibly returns.
+    """
+    if re.match(r"\s*WITH\b", query, re.IGNORECASE):
+        return False
+    if re.search(r"\bORDER\s+BY\b", _top_level(query), re.IGNORECASE):
+        return False
+    available = output_columns(query)
+    if available is None:
+        return False
+    known = {column.lower() for column in available}
+    return all(str(column).lower() in known for column in columns)
+
+
+def _derived_table(query: str) -> str:
+    return f"({query.strip().rstrip(';')}) AS pushdown_src"
+
+
+def aggregate_alias(column: str, aggregate: str) -> str:
+    return f"{column}__{aggregate.lower()}"
+
+
+def build_aggregate_query(query: str, aggregate_config: Mapping[str, Sequence[str]]) -> str:
+    """Wrap ``query`` so the endpoint returns one row of requested aggregates plus the row count.
+
+    SUM is computed as FLOAT, matching the float comparison done in pandas and
+    avoiding integer overflow on large tables.
+    """
+    expressions = [f"COUNT_BIG(*) AS {quote_identifier(ROW_COUNT_COLUMN)}"]
+    for column, aggregates in aggregate_config.items():
+        for aggregate in aggregates:
+            agg = aggregate.lower()
+            if agg not in SUPPORTED_AGGREGATES:
+                raise AssertionError(
+                    f"Unsupported aggregate '{aggregate}' for column '{column}'. "
+                    f"Supported: {sorted(SUPPORTED_AGGREGATES)}"
+                )
+            target = quote_identifier(column)
+            if agg == "sum":
+                target = f"CAST({target} AS FLOAT)"
+            expressions.append(
+                f"{agg.upper()}({target}) AS {quote_identifier(aggregate_alias(column, agg))}"
+            )
+    return f"SELECT {', '.join(expressions)} FROM {_derived_table(query)}"
+
+
+def build_distribution_query(query: str, group_columns: Sequence[str]) -> str:
+    """Wrap ``query`` so the endpoint returns one count per group.
+
+    Rows with a NULL group value are excluded, matching pandas ``groupby``.
+    """
+    if not group_columns:
+        raise ValueError("group_columns are required for a distribution query.")
+    columns = ", ".join(quote_identifier(column) for column in group_columns)
+    not_null = " AND ".join(f"{quote_identifier(column)} IS NOT NULL" for column in group_columns)
+    return (
+        f"SELECT {columns}, COUNT_BIG(*) AS {quote_identifier(ROW_COUNT_COLUMN)} "
+        f"FROM {_derived_table(query)} WHERE {not_null} GROUP BY {columns}"
+    )
+
+
+def _first_row(result: Any) -> Dict[str, Any]:
+    if isinstance(result, pd.DataFrame):
+        records = result.head(1).to_dict(orient="records")
+    else:
+        records = list(result or [])[:1]
+    if not records:
+        raise AssertionError("Aggregate pushdown query returned no rows.")
+    return dict(records[0])
+
+
+def aggregate_row_count(result: Any) -> int:
+    """Row count reported by an aggregate pushdown result."""
+    return int(_first_row(result)[ROW_COUNT_COLUMN])
+
+
+def aggregates_from_result(
+    result: Any, aggregate_config: Mapping[str, Sequence[str]]
+) -> Dict[str, Dict[str, float]]:
+    """Map the single aggregate row back to ``{column: {agg: value}}``.
+
+    SQL returns NULL for aggregates over no rows; SUM becomes 0.0 and MIN/MAX
+    NaN, as pandas would report them.
+    """
+    row = _first_row(result)
+    values: Dict[str, Dict[str, float]] = {}
+    for column, aggregates in aggregate_config.items():
+        values[column] = {}
+        for aggregate in aggregates:
+            agg = aggregate.lower()
+            raw = row[aggregate_alias(column, agg)]
+            if raw is None or (isinstance(raw, float) and math.isnan(raw)):
+                values[column][agg] = 0.0 if agg == "sum" else float("nan")
+            else:
+                values[column][agg] = float(raw)
+    return values
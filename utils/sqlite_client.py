@@ -1,13 +1,21 @@
 import sqlite3
 import logging
 import os
+import threading
 from contextlib import contextmanager
 from datetime import datetime
+from utils.connection_pool import get_pool, load_pool_settings
+from utils.db_backend import DBAPIBackend
 
-class SQLiteClient:
+class SQLiteClient(DBAPIBackend):
     def __init__(self, db_path="etl_test.db"):
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
+        self.pool_settings = load_pool_settings()
+        # Every connection to ":memory:" opens its own empty database, so an in-memory
+        # client keeps one connection instead of pooling.
+        self._memory_connection = self._connect() if db_path == ":memory:" else None
+        self._memory_lock = threading.RLock()
         self._init_database()
     
     def _init_database(self):
@@ -47,19 +55,42 @@ class SQLiteClient:
             
             conn.commit()
     
+    def _connect(self):
+        # Pooled connections may be returned on one thread and borrowed on another.
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    @property
+    def pool(self):
+        """Shared pool for this database file; uncommitted work is rolled back on return"""
+        return get_pool(
+            ('sqlite', os.path.abspath(self.db_path)),
+            self._connect,
+            reset=lambda conn: conn.rollback(),
+            **self.pool_settings
+        )
+    
+    @contextmanager
+    def _memory_connection_borrowed(self):
+        with self._memory_lock:
+            try:
+                yield self._memory_connection
+            finally:
+                self._memory_connection.rollback()
+    
     @contextmanager
     def get_connection(self):
-        conn = None
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            yield conn
+            borrowed = self._memory_connection_borrowed() if self._memory_connection is not None else self.pool.connection()
+            with borrowed as conn:
+                yield conn
         except Exception as e:
             self.logger.error(f"Database connection failed: {e}")
             raise
-        finally:
-            if conn:
-                conn.close()
+    
+    def _backend_connection(self):
+        return self.get_connection()
     
     def execute_query(self, query: str, params: tuple = None):
         with self.get_connection() as conn:
@@ -1,9 +1,14 @@
 """SQL Server Client for AX Database"""
 import pyodbc
 import configparser
+from contextlib import contextmanager
 
+from utils.db_backend import DBAPIBackend
+
+
+class SQLServerClient(DBAPIBackend):
+    fast_executemany = True
 
-class SQLServerClient:
     def __init__(self, config_section='AX_SOURCE'):
         self.config = configparser.ConfigParser()
         self.config.read('config/master.properties')
@@ -61,6 +66,12 @@ class SQLServerClient:
         cursor.execute(query)
         return cursor.fetchall()
     
+    @contextmanager
+    def _backend_connection(self):
+        if not self.connection:
+            self.connect()
+        yield self.connection
+    
     def close(self):
         """Close connection"""
         if self.connection:
@@ -0,0 +1,59 @@
+"""Run several PredefinedValidations checks over one dataset in a single pass."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.predefined_validations import DataLike, PredefinedValidations
+
+
+class ValidationPlan:
+    """Batch of checks that share one DataFrame conversion and one set of column scans.
+
+    Example::
+
+        results = (
+            ValidationPlan(target_rows, dataset_name="target_data")
+            .add("null_checks_mandatory_columns", mandatory_columns=["recid"])
+            .add("duplicate_checks_primary_keys", primary_keys=["recid"])
+            .add("negative_value_validation", columns=["amount"])
+            .add("date_range_validation", date_column="dpmodifieddatetime")
+            .run()
+        )
+
+    The dataset is passed as the first argument of every check, so two-dataset
+    validations (e.g. ``group_by_distribution_validation``) take it as the
+    source and receive the other side as a keyword. Each result holds the
+    check's usual return value under ``result``.
+    """
+
+    def __init__(self, data: DataLike, dataset_name: str = "data"):
+        self.dataset_name = dataset_name
+        self.df = PredefinedValidations._to_dataframe(data, dataset_name=dataset_name)
+        self._checks: List[Tuple[str, str, Dict[str, Any]]] = []
+
+    def add(self, check: str, name: Optional[str] = None, **kwargs: Any) -> "ValidationPlan":
+        """Queue ``PredefinedValidations.<check>``; ``name`` keys the result (defaults to ``check``)."""
+        if check.startswith("_") or not callable(getattr(PredefinedValidations, check, None)):
+            raise ValueError(f"Unknown validation '{check}' for {self.dataset_name}.")
+        result_name = name or check
+        if any(existing == result_name for existing, _, _ in self._checks):
+            raise ValueError(f"Duplicate check name '{result_name}'; pass a distinct name.")
+        self._checks.append((result_name, check, kwargs))
+        return self
+
+    def run(self, raise_on_failure: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Run every queued check and return ``{name: {status, result, message}}``."""
+        results: Dict[str, Dict[str, Any]] = {}
+        with PredefinedValidations.shared_scan(self.df):
+            for name, check, kwargs in self._checks:
+                try:
+                    value = getattr(PredefinedValidations, check)(self.df, **kwargs)
+                    results[name] = {"status": "PASSED", "result": value, "message": ""}
+                except AssertionError as exc:
+                    results[name] = {"status": "FAILED", "result": None, "message": str(exc)}
+
+        failures = {name: item["message"] for name, item in results.items() if item["status"] != "PASSED"}
+        if raise_on_failure and failures:
+            raise AssertionError(
+                f"{len(failures)} of {len(results)} checks failed on {self.dataset_name}: {failures}"
+            )
+        return results
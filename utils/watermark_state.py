@@ -0,0 +1,155 @@
+"""Persisted high watermarks for stateful incremental validations.
+
+With ``incremental_mode=stateful`` a CSV row remembers the highest source
+watermark it validated for each (source lakehouse, target lakehouse, table).
+The next run wraps both queries with ``watermark > <stored value>`` so the
+endpoints only return rows added or changed since then, and the watermark
+advances only after that delta passes.
+"""
+
+import configparser
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from utils.row_hash import quote_identifier
+from utils.sqlite_client import SQLiteClient
+
+DEFAULT_STATE_DB = ".validation_state/watermarks.db"
+STATEFUL_MODE = "stateful"
+
+
+def format_watermark(value: Any) -> str:
+    """Canonical text form of a watermark, usable as a DATETIME2 literal.
+
+    Timezone-aware values are converted to UTC, since DATETIME2 has no offset.
+    """
+    timestamp = pd.Timestamp(value)
+    if pd.isna(timestamp):
+        raise ValueError(f"Watermark value {value!r} is not a valid datetime.")
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+    return timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def build_incremental_query(query: str, watermark_column: str, after: Any) -> str:
+    """Wrap ``query`` so the endpoint only returns rows with a watermark after ``after``."""
+    return (
+        f"SELECT * FROM ({query.strip().rstrip(';')}) AS incremental_src "
+        f"WHERE {quote_identifier(watermark_column)} > CAST('{format_watermark(after)}' AS DATETIME2(6))"
+    )
+
+
+def state_key(source_lakehouse: str, target_lakehouse: str, table_name: str) -> Tuple[str, str, str]:
+    """Lakehouse and table names are case-insensitive on the SQL endpoint."""
+    return (
+        str(source_lakehouse).strip().lower(),
+        str(target_lakehouse).strip().lower(),
+        str(table_name).strip().lower(),
+    )
+
+
+class WatermarkStore(SQLiteClient):
+    """Last validated source watermark per (source lakehouse, target lakehouse, table)."""
+
+    def __init__(self, db_path: str = DEFAULT_STATE_DB):
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        super().__init__(db_path)
+
+    def _init_database(self):
+        with self.get_connection() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS validation_watermarks (
+                    source_lakehouse TEXT NOT NULL,
+                    target_lakehouse TEXT NOT NULL,
+                    table_name TEXT NOT NULL,
+                    watermark_column TEXT NOT NULL,
+                    watermark TEXT NOT NULL,
+                    rows_validated INTEGER,
+                    test_id TEXT,
+                    validated_at TIMESTAMP,
+                    PRIMARY KEY (source_lakehouse, target_lakehouse, table_name)
+                )
+            ''')
+            conn.commit()
+
+    def get(
+        self, source_lakehouse: str, target_lakehouse: str, table_name: str, watermark_column: str
+    ) -> Optional[str]:
+        """Stored watermark, or None when the table has no state for this watermark column."""
+        row = self.fetch_one(
+            "SELECT watermark_column, watermark FROM validation_watermarks "
+            "WHERE source_lakehouse = ? AND target_lakehouse = ? AND table_name = ?",
+            state_key(source_lakehouse, target_lakehouse, table_name),
+        )
+        if row is None or row["watermark_column"].lower() != watermark_column.strip().lower():
+            return None
+        return row["watermark"]
+
+    def advance(
+        self,
+        source_lakehouse: str,
+        target_lakehouse: str,
+        table_name: str,
+        watermark_column: str,
+        watermark: Any,
+        rows_validated: int = 0,
+        test_id: str = "",
+    ) -> str:
+        """Record ``watermark`` as validated; returns the stored text form."""
+        value = format_watermark(watermark)
+        self.execute_query(
+            "INSERT OR REPLACE INTO validation_watermarks "
+            "(source_lakehouse, target_lakehouse, table_name, watermark_column, watermark, "
+            "rows_validated, test_id, validated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            state_key(source_lakehouse, target_lakehouse, table_name)
+            + (watermark_column.strip(), value, int(rows_validated), str(test_id), datetime.now().isoformat()),
+        )
+        return value
+
+    def entries(self) -> List[Dict[str, Any]]:
+        rows = self.execute_query(
+            "SELECT * FROM validation_watermarks ORDER BY source_lakehouse, target_lakehouse, table_name"
+        )
+        return [dict(row) for row in rows]
+
+    def reset(
+        self,
+        source_lakehouse: Optional[str] = None,
+        target_lakehouse: Optional[str] = None,
+        table_name: Optional[str] = None,
+    ) -> int:
+        """Forget matching watermarks (all without filters) so those tables are fully rescanned."""
+        conditions, params = [], []
+        for column, value in (
+            ("source_lakehouse", source_lakehouse),
+            ("target_lakehouse", target_lakehouse),
+            ("table_name", table_name),
+        ):
+            if value:
+                conditions.append(f"{column} = ?")
+                params.append(value.strip().lower())
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self.execute_query(f"DELETE FROM validation_watermarks{where}", tuple(params))
+
+
+_stores: Dict[str, WatermarkStore] = {}
+_stores_lock = threading.Lock()
+
+
+def load_watermark_store(config_file: str = "config/master.properties") -> WatermarkStore:
+    """Return the process-wide store at [TESTING] WATERMARK_STATE_DB."""
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    db_path = config.get("TESTING", "WATERMARK_STATE_DB", fallback="").strip() or DEFAULT_STATE_DB
+    with _stores_lock:
+        store = _stores.get(os.path.abspath(db_path))
+        if store is None:
+            store = WatermarkStore(db_path)
+            _stores[os.path.abspath(db_path)] = store
+        return store